@@ -0,0 +1,259 @@
+"""
+이메일 / 닉네임 사용 가능 여부 확인용 Bloom filter (워커 프로세스별)
+
+회원가입 폼이 입력할 때마다 호출하는 availability API가 매번 DB를 조회하지 않도록
+가입된 이메일 / 닉네임을 Bloom filter에 담아 둡니다.
+- filter에 없으면(음성) 확실히 사용 가능하므로 DB 조회 없이 응답
+- filter에 있으면(양성) 오탐일 수 있으므로 DB(users.email unique / ix_users_nickname 인덱스)로 확인
+
+시작 시 백그라운드 스레드에서 전체 사용자로 생성하고, 이 워커의 가입 / 닉네임 변경은 바로 추가합니다.
+다른 워커에서 가입 / 닉네임을 변경한 사용자는 USER_FILTER_REFRESH_INTERVAL마다 읽어 추가합니다.
+- 마지막으로 본 id 이후의 행, 마지막으로 본 가입 / 수정 시각보다 USER_FILTER_REFRESH_OVERLAP 앞선 시각 이후의 행
+  (ix_users_created_at / ix_users_updated_at, 늦게 커밋되어 id 순서가 뒤바뀐 가입도 다시 읽어 반영)
+filter에서 지울 수 없는 이전 닉네임 / 탈퇴한 사용자는 USER_FILTER_REBUILD_INTERVAL마다 전체 재생성으로 정리합니다. (남아 있는 동안은 DB 확인만 늘어남)
+갱신 주기 사이에 생길 수 있는 잘못된 "사용 가능" 응답은 회원가입 시 DB 중복 검사에서 409로 걸러집니다.
+생성이 끝나기 전이거나 USER_FILTER_ENABLED=false면 항상 DB로 확인합니다.
+"""
+import hashlib
+import logging
+import math
+import threading
+import time
+import unicodedata
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import select, func, union
+from sqlalchemy.orm import Session
+
+from config import (
+    USER_FILTER_ENABLED, USER_FILTER_ERROR_RATE, USER_FILTER_REFRESH_INTERVAL, USER_FILTER_REFRESH_OVERLAP,
+    USER_FILTER_REBUILD_INTERVAL,
+)
+from database import SessionLocal
+from models import User
+
+logger = logging.getLogger(__name__)
+
+# 가입자가 적을 때도 재생성 전까지 가입을 받을 여유
+MIN_CAPACITY = 10000
+
+def normalize(value: str) -> str:
+    # MySQL 기본 collation(대소문자 / 악센트 / 끝 공백 무시)에서 같은 값은 같은 키가 되도록 정규화
+    # 정규화로 더 많은 값이 같아지는 것은 오탐(DB 확인)만 늘리므로 안전
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(ch for ch in decomposed if unicodedata.category(ch) != "Mn")
+    return stripped.casefold().rstrip()
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        # 최적 비트 수 m = -n ln p / (ln 2)^2, 해시 수 k = m / n ln 2
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        # 128비트 해시 하나를 두 값으로 나눠 k개 위치 생성 (double hashing)
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key: str) -> bool:
+        # 새로 켠 비트가 있을 때만 count 증가 (갱신 시 겹쳐 읽은 기존 값을 다시 추가해도 count / 재생성 시점이 그대로)
+        # 모든 비트가 이미 켜진 새 값은 어차피 filter에 있는 것으로 판단되므로 세지 않아도 오탐률 추정에 영향 없음
+        added = False
+        for position in self._positions(key):
+            byte, bit = position >> 3, 1 << (position & 7)
+            if not self._bits[byte] & bit:
+                self._bits[byte] |= bit
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+def _latest(*values: Optional[datetime]) -> Optional[datetime]:
+    values = [value for value in values if value is not None]
+    return max(values) if values else None
+
+
+class UserAvailabilityFilter:
+    def __init__(
+        self, error_rate: float, refresh_interval: float, rebuild_interval: float,
+        refresh_overlap: float = USER_FILTER_REFRESH_OVERLAP, session_factory=SessionLocal
+    ):
+        self.error_rate = error_rate
+        self.refresh_interval = refresh_interval
+        self.rebuild_interval = rebuild_interval
+        self.refresh_overlap = refresh_overlap
+        self.session_factory = session_factory
+
+        self.negatives = 0
+        self.positives = 0
+        self.false_positives = 0
+        self.rebuilds = 0
+
+        self._emails: Optional[BloomFilter] = None
+        self._nicknames: Optional[BloomFilter] = None
+        self._last_user_id = 0
+        self._last_changed_at: Optional[datetime] = None  # 마지막으로 본 가입 / 수정 시각 (DB 시각)
+        self._built_at = 0.0
+        self._rebuilding = False
+        self._added_during_rebuild = []
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @property
+    def ready(self) -> bool:
+        return self._emails is not None
+
+    def might_contain_email(self, email: str) -> bool:
+        return self._might_contain("_emails", email)
+
+    def might_contain_nickname(self, nickname: str) -> bool:
+        return self._might_contain("_nicknames", nickname)
+
+    def _might_contain(self, attr: str, value: str) -> bool:
+        with self._lock:
+            bloom = getattr(self, attr)
+            if bloom is None:
+                return True
+            if normalize(value) in bloom:
+                self.positives += 1
+                return True
+            self.negatives += 1
+            return False
+
+    def record_false_positive(self):
+        with self._lock:
+            self.false_positives += 1
+
+    def add(self, email: Optional[str] = None, nickname: Optional[str] = None):
+        # 이 워커의 가입 / 닉네임 변경 커밋 직후 호출
+        with self._lock:
+            if self._rebuilding:
+                # 재생성 중인 새 filter에도 반영되도록 기록
+                self._added_during_rebuild.append((email, nickname))
+            self._add_locked(email, nickname)
+
+    def _add_locked(self, email: Optional[str], nickname: Optional[str]):
+        if self._emails is None:
+            return
+        if email:
+            self._emails.add(normalize(email))
+        if nickname:
+            self._nicknames.add(normalize(nickname))
+
+    def rebuild(self, db: Session) -> int:
+        with self._lock:
+            self._rebuilding = True
+            self._added_during_rebuild = []
+        try:
+            total, max_id, max_created_at, max_updated_at = db.execute(
+                select(func.count(User.id), func.max(User.id), func.max(User.created_at), func.max(User.updated_at))
+            ).one()
+            capacity = max(MIN_CAPACITY, (total or 0) * 2)
+            emails = BloomFilter(capacity, self.error_rate)
+            nicknames = BloomFilter(capacity, self.error_rate)
+
+            last_id = 0
+            rows = db.execute(
+                select(User.id, User.email, User.nickname).where(User.id <= (max_id or 0)).execution_options(yield_per=1000)
+            )
+            for row in rows:
+                emails.add(normalize(row.email))
+                nicknames.add(normalize(row.nickname))
+                last_id = max(last_id, row.id)
+
+            with self._lock:
+                self._emails, self._nicknames = emails, nicknames
+                self._last_user_id = max(last_id, max_id or 0)
+                self._last_changed_at = _latest(max_created_at, max_updated_at)
+                for email, nickname in self._added_during_rebuild:
+                    self._add_locked(email, nickname)
+                self._built_at = time.monotonic()
+                self.rebuilds += 1
+            return emails.count
+        finally:
+            with self._lock:
+                self._rebuilding = False
+                self._added_during_rebuild = []
+
+    def refresh(self, db: Session) -> int:
+        # 다른 워커에서 가입(새 id) / 닉네임 변경(updated_at)한 사용자
+        # id와 커밋 순서가 다를 수 있으므로 마지막으로 본 시각보다 refresh_overlap 앞부터 다시 읽음 (이미 있는 값은 BloomFilter.add에서 세지 않음)
+        # 조건마다 인덱스 범위 조회 후 UNION (OR 하나로 묶으면 updated_at이 대부분 NULL이라 옵티마이저가 전체 스캔을 고름)
+        conditions = [User.id > self._last_user_id]
+        if self._last_changed_at is not None:
+            since = self._last_changed_at - timedelta(seconds=self.refresh_overlap)
+            conditions += [User.created_at >= since, User.updated_at >= since]
+
+        columns = (User.id, User.email, User.nickname, User.created_at, User.updated_at)
+        rows = db.execute(union(*(select(*columns).where(condition) for condition in conditions))).all()
+        with self._lock:
+            for row in rows:
+                self._add_locked(row.email, row.nickname)
+            if rows:
+                self._last_user_id = max(self._last_user_id, *(row.id for row in rows))
+                self._last_changed_at = _latest(
+                    self._last_changed_at, *(row.created_at for row in rows), *(row.updated_at for row in rows)
+                )
+        return len(rows)
+
+    def _needs_rebuild(self) -> bool:
+        if self._emails is None or time.monotonic() - self._built_at >= self.rebuild_interval:
+            return True
+        # 예상보다 많이 가입해 오탐률이 올라가면 크게 다시 생성
+        return self._emails.count > self._emails.capacity
+
+    def start(self):
+        if not USER_FILTER_ENABLED or self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="user-availability-filter", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stopped.is_set():
+            db = self.session_factory()
+            try:
+                if self._needs_rebuild():
+                    self.rebuild(db)
+                else:
+                    self.refresh(db)
+            except Exception:
+                logger.exception("failed to update user availability filter")
+            finally:
+                db.close()
+            self._stopped.wait(self.refresh_interval)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": USER_FILTER_ENABLED,
+                "ready": self.ready,
+                "emails": self._emails.count if self._emails else 0,
+                "nicknames": self._nicknames.count if self._nicknames else 0,
+                "capacity": self._emails.capacity if self._emails else 0,
+                "bytes": len(self._emails._bits) * 2 if self._emails else 0,
+                "negatives": self.negatives,
+                "positives": self.positives,
+                "falsePositives": self.false_positives,
+                "rebuilds": self.rebuilds,
+            }
+
+user_filter = UserAvailabilityFilter(USER_FILTER_ERROR_RATE, USER_FILTER_REFRESH_INTERVAL, USER_FILTER_REBUILD_INTERVAL)
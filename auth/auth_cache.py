@@ -0,0 +1,10 @@
+from cache import TTLCache
+from config import AUTH_CACHE_TTL, AUTH_CACHE_MAX_SIZE
+
+# 세션 식별자(user_email) -> get_current_user가 반환하는 사용자 dict
+# 사용자 정보를 바꾸는 곳(users_service)에서 명시적으로 invalidate 하며,
+# 다른 워커 프로세스의 캐시는 TTL이 지나면 갱신됨
+identity_cache = TTLCache(max_size=AUTH_CACHE_MAX_SIZE, ttl=AUTH_CACHE_TTL)
+
+def invalidate_user(email: str):
+    identity_cache.invalidate(email)
@@ -1,32 +1,34 @@
 from fastapi import Request, UploadFile
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from auth.auth_schemas import SignupRequest, LoginRequest
 from auth import auth_service
+from auth.auth_availability import user_filter
+from database import read_session
 
-async def signup(email: str, password: str, nickname: str, profileImage: UploadFile, db: Session):
-    # 이메일 중복 체크
-    if auth_service.is_email_exist(email, db):
+async def signup(email: str, password: str, nickname: str, profileImage: UploadFile, db: AsyncSession):
+    # 이메일 중복 체크 (가입은 filter 대신 항상 DB로 확인)
+    if await auth_service.is_email_exist(email, db):
         return JSONResponse(
             status_code=409,
             content={"code": "EMAIL_ALREADY_EXISTS", "data": None}
         )
     
     # 닉네임 중복 체크
-    if auth_service.is_nickname_exist(nickname, db):
+    if await auth_service.is_nickname_exist(nickname, db):
         return JSONResponse(
             status_code=409,
             content={"code": "NICKNAME_ALREADY_EXISTS", "data": None}
         )
 
-    auth_service.create_user(email, password, nickname, profileImage, db)
+    await auth_service.create_user(email, password, nickname, profileImage, db)
     
     return {"code": "SIGNUP_SUCCESS", "data": None}
 
-async def login(req: LoginRequest, request: Request, db: Session):
-    user = auth_service.authenticate_user(req.email, req.password, db)
+async def login(req: LoginRequest, request: Request, db: AsyncSession):
+    user = await auth_service.authenticate_user(req.email, req.password, db)
     
     if not user:
         return JSONResponse(
@@ -60,27 +62,37 @@ async def get_me(user: dict):
         }
     }
 
-async def check_email(request: Request, email: str, db: Session):
+async def check_email(request: Request, email: str):
     if not email:
         raise RequestValidationError([{"loc": ["query", "email"], "msg": "Email is required", "type": "value_error.missing"}])
         
-    if auth_service.is_email_exist(email, db):
-        return JSONResponse(
-            status_code=409,
-            content={"code": "EMAIL_ALREADY_EXISTS", "data": None}
-        )
+    # filter에 없으면 DB 조회 없이 사용 가능, 있으면 오탐일 수 있으므로 DB로 확인
+    # (복제본 세션은 열 때 커넥션을 잡아 pre-ping 하므로 양성일 때만 엶)
+    if user_filter.might_contain_email(email):
+        async with read_session(request) as db:
+            exists = await auth_service.is_email_exist(email, db)
+        if exists:
+            return JSONResponse(
+                status_code=409,
+                content={"code": "EMAIL_ALREADY_EXISTS", "data": None}
+            )
+        user_filter.record_false_positive()
     
     return {"code": "EMAIL_AVAILABLE", "data": None}
 
-async def check_nickname(request: Request, nickname: str, db: Session):
+async def check_nickname(request: Request, nickname: str):
     if not nickname:
         raise RequestValidationError([{"loc": ["query", "nickname"], "msg": "Nickname is required", "type": "value_error.missing"}])
 
-    if auth_service.is_nickname_exist(nickname, db):
-        return JSONResponse(
-            status_code=409,
-            content={"code": "NICKNAME_ALREADY_EXISTS", "data": None}
-        )
+    if user_filter.might_contain_nickname(nickname):
+        async with read_session(request) as db:
+            exists = await auth_service.is_nickname_exist(nickname, db)
+        if exists:
+            return JSONResponse(
+                status_code=409,
+                content={"code": "NICKNAME_ALREADY_EXISTS", "data": None}
+            )
+        user_filter.record_false_positive()
     
     return {"code": "NICKNAME_AVAILABLE", "data": None}
 
@@ -1,9 +1,10 @@
-from fastapi import Request, HTTPException, status, Depends
-from sqlalchemy.orm import Session
-from database import get_db
+from fastapi import Request, HTTPException, status
+from sqlalchemy import select
+from database import read_session
 from models import User
+from auth.auth_cache import identity_cache
 
-async def get_current_user(request: Request, db: Session = Depends(get_db)):
+async def get_current_user(request: Request):
     user_email = request.session.get("user_email")
     if not user_email:
         raise HTTPException(
@@ -11,8 +12,16 @@ async def get_current_user(request: Request, db: Session = Depends(get_db)):
             detail={"code": "UNAUTHORIZED", "data": None}
         )
     
+    # 캐시에 있으면 DB 조회 생략 (호출한 쪽에서 수정해도 캐시가 오염되지 않도록 복사본 반환)
+    cached = identity_cache.get(user_email)
+    if cached is not None:
+        return dict(cached)
+
     # JSON DB 대신 MySQL DB에서 조회
-    user = db.query(User).filter(User.email == user_email).first()
+    # 캐시 미스일 때만 세션을 열어, 쓰기 라우트에서도 복제본(또는 최근 쓰기 후면 primary)에서 읽음
+    async with read_session(request) as db:
+        result = await db.execute(select(User).where(User.email == user_email))
+        user = result.scalar_one_or_none()
     
     if user is None:
         # 세션은 있는데 DB에 사용자가 없는 경우 (탈퇴 등) 세션 삭제 후 에러
@@ -25,10 +34,12 @@ async def get_current_user(request: Request, db: Session = Depends(get_db)):
     # SQLAlchemy 객체는 dict처럼 사용하기 위해 속성들을 딕셔너리로 변환하거나, 
     # 혹은 객체 그대로 넘기고 사용하는 곳에서 속성으로 접근하게 함.
     # 호환성을 위해 dict 형태로 변환하여 반환.
-    return {
+    current_user = {
         "id": user.id,
         "email": user.email,
         "nickname": user.nickname,
         "profileImageUrl": user.profile_image_url,
         "createdAt": user.created_at.isoformat() if user.created_at else None
     }
+    identity_cache.set(user_email, current_user)
+    return dict(current_user)
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, Request, Form, UploadFile, File
-from sqlalchemy.orm import Session
-from database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db
 from auth.auth_schemas import (
     SignupRequest, LoginRequest, BaseResponse, 
     LoginResponse, MeResponse
@@ -19,12 +19,12 @@ async def signup(
     password: str = Form(...),
     nickname: str = Form(...),
     profileImage: UploadFile = File(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     return await auth_controller.signup(email, password, nickname, profileImage, db)
 
 @router.post("/login", status_code=200, response_model=LoginResponse)
-async def login(req: LoginRequest, request: Request, db: Session = Depends(get_db)):
+async def login(req: LoginRequest, request: Request, db: AsyncSession = Depends(get_async_db)):
     return await auth_controller.login(req, request, db)
 
 @router.get("/me", status_code=200, response_model=MeResponse)
@@ -32,12 +32,13 @@ async def get_me(user: dict = Depends(get_current_user)):
     return await auth_controller.get_me(user)
 
 @router.get("/emails/availability", status_code=200, response_model=BaseResponse)
-async def check_email(request: Request, email: str, db: Session = Depends(get_db)):
-    return await auth_controller.check_email(request, email, db)
+async def check_email(request: Request, email: str):
+    # filter 음성이면 DB 세션을 열지 않도록 controller에서 필요할 때만 읽기 세션을 엶
+    return await auth_controller.check_email(request, email)
 
 @router.get("/nicknames/availability", status_code=200, response_model=BaseResponse)
-async def check_nickname(request: Request, nickname: str, db: Session = Depends(get_db)):
-    return await auth_controller.check_nickname(request, nickname, db)
+async def check_nickname(request: Request, nickname: str):
+    return await auth_controller.check_nickname(request, nickname)
 
 @router.delete("/session", status_code=200, response_model=BaseResponse)
 async def logout(request: Request, user: dict = Depends(get_current_user)):
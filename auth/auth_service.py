@@ -1,64 +1,59 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models import User
 from auth.auth_schemas import SignupRequest
-from auth.auth_utils import get_password_hash, verify_password
-from fastapi import UploadFile, HTTPException, status
+from auth.auth_utils import get_password_hash_async, verify_password_async, needs_rehash
+from fastapi import UploadFile
+from uploads import save_image
+from thumbnails import schedule_variants
+from auth.auth_availability import user_filter
 import os
-import shutil
 
 UPLOAD_DIR = "public/image/profile"
 
-def is_email_exist(email: str, db: Session) -> bool:
-    user = db.query(User).filter(User.email == email).first()
-    return user is not None
+async def is_email_exist(email: str, db: AsyncSession) -> bool:
+    result = await db.execute(select(User.id).where(User.email == email))
+    return result.first() is not None
 
-def is_nickname_exist(nickname: str, db: Session) -> bool:
-    user = db.query(User).filter(User.nickname == nickname).first()
-    return user is not None
+async def is_nickname_exist(nickname: str, db: AsyncSession) -> bool:
+    result = await db.execute(select(User.id).where(User.nickname == nickname))
+    return result.first() is not None
 
-def create_user(email: str, password: str, nickname: str, profileImage: UploadFile, db: Session):
-    # 1. 유저 먼저 생성 (ID 생성을 위해)
+async def create_user(email: str, password: str, nickname: str, profileImage: UploadFile, db: AsyncSession):
+    # 1. 프로필 이미지 저장 (있다면)
+    # 저장 경로가 내용 해시라 User ID가 필요 없으므로 유저 생성 전에 저장,
+    # 형식이 잘못되었거나 너무 크면 유저를 만들지 않고 에러 발생
+    profile_image_url = None
+    if profileImage:
+        saved_path = await save_image(profileImage, UPLOAD_DIR, invalid_detail="INVALID_FILE_TYPE")
+        schedule_variants(os.path.join(UPLOAD_DIR, saved_path))
+        profile_image_url = f"/public/image/profile/{saved_path}"
+
+    # 2. 유저 생성
     new_user = User(
         email=email,
-        password=get_password_hash(password),
+        password=await get_password_hash_async(password),
         nickname=nickname,
-        profile_image_url=None
+        profile_image_url=profile_image_url
     )
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
-
-    # 2. 프로필 이미지 저장 (있다면)
-    if profileImage:
-        if not os.path.exists(UPLOAD_DIR):
-            os.makedirs(UPLOAD_DIR)
-        
-        filename = profileImage.filename
-        ext = filename.split(".")[-1].lower() if "." in filename else ""
-        if ext not in ["jpg", "jpeg", "png"]:
-             # 이미 생성된 유저 롤백 필요할 수도 있으나, 여기서는 간단히 에러 발생 시킴
-             # (엄밀하게는 transaction atomic 하게 처리해야 함, 지금은 에러나면 유저는 생성되고 이미지는 없는 상태가 됨)
-             # 사용자가 추후 프로필 수정에서 올리면 되므로 큰 문제는 아님.
-             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="INVALID_FILE_TYPE")
-        
-        # User ID를 파일명으로 사용
-        saved_filename = f"{new_user.id}.{ext}"
-        file_path = os.path.join(UPLOAD_DIR, saved_filename)
-        
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(profileImage.file, buffer)
-        
-        # DB 업데이트
-        new_user.profile_image_url = f"/public/image/profile/{saved_filename}"
-        db.commit()
-        db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
+    user_filter.add(email=new_user.email, nickname=new_user.nickname)
 
     return new_user
 
-def authenticate_user(email: str, password: str, db: Session):
-    user = db.query(User).filter(User.email == email).first()
+async def authenticate_user(email: str, password: str, db: AsyncSession):
+    result = await db.execute(select(User).where(User.email == email))
+    user = result.scalar_one_or_none()
     
-    if not user or not verify_password(password, user.password):
+    if not user or not await verify_password_async(password, user.password):
         return None
+
+    # BCRYPT_ROUNDS가 바뀐 경우 로그인 성공 시점에 평문으로 다시 해시하여 저장
+    if needs_rehash(user.password):
+        user.password = await get_password_hash_async(password)
+        await db.commit()
+        await db.refresh(user)
     
     return user
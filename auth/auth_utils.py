@@ -1,5 +1,12 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Optional
+
 import bcrypt
 
+from config import BCRYPT_ROUNDS, PASSWORD_HASH_EXECUTOR, PASSWORD_HASH_WORKERS
+
 # 설정 (실제 운영 시 환경변수로 관리 권장)
 SECRET_KEY = "super-secret-key-for-community-dev"
 
@@ -8,7 +15,47 @@ def verify_password(plain_password, hashed_password):
         hashed_password = hashed_password.encode("utf-8")
     return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password)
 
-def get_password_hash(password):
+def get_password_hash(password, rounds: int = BCRYPT_ROUNDS):
     pwd_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(pwd_bytes, salt).decode("utf-8")
\ No newline at end of file
+    salt = bcrypt.gensalt(rounds)
+    return bcrypt.hashpw(pwd_bytes, salt).decode("utf-8")
+
+def needs_rehash(hashed_password: str) -> bool:
+    # "$2b$12$..." 형식에서 cost를 읽어 현재 설정(BCRYPT_ROUNDS)과 다르면 재해시 대상
+    try:
+        return int(hashed_password.split("$")[2]) != BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
+# bcrypt는 요청당 수백 ms 동안 CPU를 쓰므로 이벤트 루프를 막지 않도록 별도 executor에서 실행
+# (워커 수로 동시 해시 개수를 제한)
+_executor: Optional[Executor] = None
+
+def get_password_executor() -> Optional[Executor]:
+    global _executor
+    if _executor is None and PASSWORD_HASH_EXECUTOR != "none":
+        if PASSWORD_HASH_EXECUTOR == "process":
+            # 요청 처리 중 처음 만들어지므로 스레드가 있는 워커를 fork 하지 않고 spawn (thumbnails와 동일)
+            _executor = ProcessPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        else:
+            _executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+    return _executor
+
+def shutdown_password_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+async def _run(func, *args):
+    executor = get_password_executor()
+    if executor is None:
+        return func(*args)
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+async def get_password_hash_async(password: str) -> str:
+    return await _run(get_password_hash, password, BCRYPT_ROUNDS)
+
+async def verify_password_async(plain_password: str, hashed_password) -> bool:
+    return await _run(verify_password, plain_password, hashed_password)
@@ -0,0 +1,93 @@
+"""
+동기 세션(기존 방식) vs AsyncSession 피드 조회 처리량 비교
+
+기존 방식처럼 async 핸들러 안에서 동기 세션으로 쿼리하는 라우트와
+AsyncSession(posts_service.get_all_posts)을 쓰는 라우트를 같은 조건으로 동시 호출합니다.
+DB 왕복 지연이 있는 실제 MySQL에서 차이가 크게 드러나므로 DATABASE_URL을 지정해 실행하는 것을 권장합니다.
+
+사용법: DATABASE_URL=mysql+pymysql://... python benchmarks/async_db.py [--duration 5] [--concurrency 32]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp(prefix='async-db-')}/bench.db"
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from sqlalchemy import desc  # noqa: E402
+from sqlalchemy.orm import joinedload  # noqa: E402
+
+from database import engine, async_engine, SessionLocal, AsyncSessionLocal  # noqa: E402
+from migrations import upgrade  # noqa: E402
+from models import Post, User  # noqa: E402
+from posts import posts_service  # noqa: E402
+
+app = FastAPI()
+
+@app.get("/sync")
+async def sync_feed():
+    db = SessionLocal()
+    try:
+        posts = db.query(Post).options(joinedload(Post.user)).order_by(desc(Post.created_at), desc(Post.id)).limit(10).all()
+        return [p.id for p in posts]
+    finally:
+        db.close()
+
+@app.get("/async")
+async def async_feed():
+    async with AsyncSessionLocal() as db:
+        posts = await posts_service.get_all_posts(1, 10, db)
+        return [p.id for p in posts]
+
+def seed():
+    upgrade(engine)
+    db = SessionLocal()
+    try:
+        if db.query(Post).count() >= 100:
+            return
+        user = User(email="bench@example.com", password="x", nickname="bench")
+        db.add(user)
+        db.flush()
+        db.add_all([Post(user_id=user.id, title=f"title {i}", detail="detail " * 50, nickname="bench") for i in range(100)])
+        db.commit()
+    finally:
+        db.close()
+
+async def run(client, path, duration, concurrency):
+    deadline = time.perf_counter() + duration
+    latencies = []
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            await client.get(path)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{path:>7}: {len(latencies) / duration:8.1f} req/s  p50={latencies[len(latencies) // 2]:.1f}ms  p99={p99:.1f}ms")
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    seed()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for path in ("/sync", "/async"):
+            await run(client, path, args.duration, args.concurrency)
+
+    await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
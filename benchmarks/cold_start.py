@@ -0,0 +1,121 @@
+"""
+워커 cold start 시간 측정
+
+매 회 새 프로세스에서 워커 한 개가 뜨는 과정을 단계별로 측정합니다. (SQLite 임시 DB, 스키마는 미리 적용)
+- import: 인터프리터 시작 후 main import (create_app 포함) 까지
+- lifespan: 커넥션 풀 예열 + 주요 조회문 예열 + 백그라운드 스레드 시작
+- first request: 시작 직후 첫 DB 조회 요청 (이메일 사용 가능 여부, filter 생성 전이라 DB 조회)
+- uvicorn: uvicorn 프로세스 실행부터 첫 응답까지 (전체)
+
+예열 효과를 보기 위해 예열 없음(DB_POOL_WARM_SIZE=0, DB_WARM_STATEMENTS=false) 구성과,
+기존처럼 워커마다 시작 시 스키마를 확인하는 구성(DB_MIGRATE_ON_STARTUP=true)과 비교합니다.
+
+사용법: python benchmarks/cold_start.py [--runs 5]
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import time
+started = time.perf_counter()
+import asyncio, json, sys
+sys.path.insert(0, {root!r})
+import main
+imported = time.perf_counter()
+
+async def run():
+    import httpx
+    app = main.create_app()
+    async with app.router.lifespan_context(app):
+        ready = time.perf_counter()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/v1/auth/emails/availability", params={{"email": "nobody@example.com"}})
+            assert response.status_code == 200, response.text
+        done = time.perf_counter()
+    return ready, done
+
+ready, done = asyncio.run(run())
+print(json.dumps({{"import": imported - started, "lifespan": ready - imported, "first request": done - ready}}))
+"""
+
+def run_child(env: dict, cwd: str) -> dict:
+    # 프로세스 시작 시간까지 포함하기 위해 바깥에서도 측정
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD.format(root=ROOT)], env=env, cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result["total"] = time.perf_counter() - started
+    return result
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def run_uvicorn(env: dict, cwd: str) -> float:
+    import httpx
+
+    port = free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "--factory", "main:create_app", "--port", str(port), "--log-level", "warning"],
+        cwd=cwd, env=env
+    )
+    try:
+        while True:
+            try:
+                response = httpx.get(f"http://127.0.0.1:{port}/", timeout=0.5)
+                if response.status_code == 200:
+                    return time.perf_counter() - started
+            except httpx.TransportError:
+                pass
+            if process.poll() is not None:
+                raise RuntimeError("uvicorn exited before serving")
+            time.sleep(0.005)
+    finally:
+        process.terminate()
+        process.wait()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    # 워커는 /public 디렉터리가 있는 임시 작업 디렉터리에서 실행
+    directory = tempfile.mkdtemp(prefix="cold-start-")
+    os.makedirs(os.path.join(directory, "public"))
+    database_url = f"sqlite:///{os.path.join(directory, 'cold.db')}"
+    base_env = {
+        **os.environ, "DATABASE_URL": database_url, "PYTHONPATH": ROOT,
+        "VIEW_BUFFER_ENABLED": "false", "DB_MIGRATE_ON_STARTUP": "false",
+    }
+    subprocess.run([sys.executable, "-m", "migrations", "upgrade"], env=base_env, cwd=directory, check=True, capture_output=True)
+
+    configs = [
+        ("warm (default)", {}),
+        ("no warm-up", {"DB_POOL_WARM_SIZE": "0", "DB_WARM_STATEMENTS": "false"}),
+        ("migrate on startup", {"DB_MIGRATE_ON_STARTUP": "true"}),
+    ]
+    for label, overrides in configs:
+        env = {**base_env, **overrides}
+        results = [run_child(env, directory) for _ in range(args.runs)]
+        uvicorn_times = [run_uvicorn(env, directory) for _ in range(args.runs)]
+
+        print(f"{label} (median of {args.runs})")
+        for phase in ("import", "lifespan", "first request", "total"):
+            print(f"  {phase:14s} {statistics.median(r[phase] for r in results) * 1000:8.1f} ms")
+        print(f"  {'uvicorn':14s} {statistics.median(uvicorn_times) * 1000:8.1f} ms  (process start -> first response)")
+
+if __name__ == "__main__":
+    main()
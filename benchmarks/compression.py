@@ -0,0 +1,119 @@
+"""
+피드 / 댓글 목록 응답 압축 비용 비교 (CPU 시간 vs 절약한 바이트)
+
+controller가 만드는 응답 형태를 orjson으로 직렬화한 본문을 gzip 레벨 / brotli quality별로 압축합니다.
+본문은 단어 목록에서 무작위로 뽑아 만들어(seed 고정) 같은 문장만 반복되는 경우보다 실제에 가깝게 측정합니다.
+saved/ms 는 압축에 쓴 CPU 1ms당 줄어든 전송량입니다.
+
+사용법: python benchmarks/compression.py [--repeat 50] [--posts 20]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import zlib
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import orjson  # noqa: E402
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+WORDS = (
+    "오늘 어제 내일 정말 너무 조금 같이 혼자 회사 학교 카페 점심 저녁 커피 날씨 여행 사진 후기 추천 질문 "
+    "답변 감사합니다 좋아요 그런데 그래서 하지만 진짜 요즘 주말 운동 공부 개발 서버 배포 코드 리뷰 버그 "
+    "수정 완료 맛집 영화 드라마 음악 게임 강아지 고양이 the and for with this that python fastapi"
+).split()
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)) + rng.choice([".", "!", "?", "~"])
+
+def feed_body(count: int, rng: random.Random) -> bytes:
+    now = datetime(2024, 1, 1)
+    return orjson.dumps({
+        "code": "posts_retrieved",
+        "data": [
+            {
+                "postId": 10000 - i,
+                "title": sentence(rng, rng.randint(3, 8)),
+                "content": " ".join(sentence(rng, rng.randint(5, 15)) for _ in range(rng.randint(5, 40))),
+                "likeCount": rng.randint(0, 300),
+                "commentCount": rng.randint(0, 80),
+                "hits": rng.randint(0, 5000),
+                "author": {
+                    "userId": rng.randint(1, 500),
+                    "nickname": f"user{rng.randint(1, 500)}",
+                    "profileImageUrl": f"/public/image/profile/{rng.getrandbits(256):064x}.png",
+                },
+                "file": {"fileId": 1, "fileUrl": f"/public/image/posts/{rng.getrandbits(256):064x}.jpg"}
+                if rng.random() < 0.4 else None,
+                "createdAt": (now - timedelta(minutes=i * 7)).isoformat(),
+            }
+            for i in range(count)
+        ],
+        "nextCursor": "eyJ2IjogWyIyMDI0LTAxLTAxVDAwOjAwOjAwIiwgMV19",
+    })
+
+def comments_body(count: int, rng: random.Random) -> bytes:
+    now = datetime(2024, 1, 1)
+    return orjson.dumps({
+        "code": "COMMENTS_RETRIEVED",
+        "data": [
+            {
+                "commentId": i,
+                "postId": 1,
+                "content": sentence(rng, rng.randint(2, 25)),
+                "author": {"userId": rng.randint(1, 500), "nickname": f"user{rng.randint(1, 500)}", "profileImageUrl": None},
+                "createdAt": (now - timedelta(seconds=i * 30)).isoformat(),
+            }
+            for i in range(count)
+        ],
+        "nextCursor": None,
+    })
+
+def gzip_compress(level: int):
+    def compress(body: bytes) -> bytes:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        return compressor.compress(body) + compressor.flush()
+    return compress
+
+def measure(fn, body: bytes, repeat: int):
+    compressed = fn(body)
+    started = time.process_time()
+    for _ in range(repeat):
+        fn(body)
+    return (time.process_time() - started) / repeat * 1000, len(compressed)
+
+def run(name: str, body: bytes, repeat: int):
+    cases = [(f"gzip level {level}", gzip_compress(level)) for level in (1, 4, 6, 9)]
+    if brotli is not None:
+        cases += [(f"brotli quality {q}", lambda b, q=q: brotli.compress(b, quality=q, mode=brotli.MODE_TEXT))
+                  for q in (1, 4, 6, 11)]
+
+    print(f"{name} ({len(body) / 1024:.1f} KiB)")
+    for label, fn in cases:
+        ms, size = measure(fn, body, repeat)
+        saved = len(body) - size
+        print(
+            f"  {label:18s} {ms:8.3f} ms/op  {size / 1024:7.1f} KiB  ratio {len(body) / size:4.1f}x"
+            f"  saved/ms {saved / 1024 / ms:8.1f} KiB"
+        )
+    if brotli is None:
+        print("  (brotli not installed: pip install brotli)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--posts", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    run(f"feed, {args.posts} posts", feed_body(args.posts, rng), args.repeat)
+    run("feed, 100 posts", feed_body(100, rng), args.repeat)
+    run("comments, 1000 comments", comments_body(1000, rng), args.repeat)
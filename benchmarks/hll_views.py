@@ -0,0 +1,45 @@
+"""
+정확 집계(views 행) vs HyperLogLog sketch 메모리 / 정확도 비교
+
+사용법: python benchmarks/hll_views.py [--error 0.02]
+DB 없이 동작하며, 정확 집계 쪽 크기는 조회자 id 집합의 메모리와
+views 행 하나당 대략적인 저장 크기(ROW_BYTES)로 계산합니다.
+"""
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")  # sketch 계산만 하므로 실제 DB 불필요
+
+from posts.posts_hll import HyperLogLog  # noqa: E402
+
+# views 행 하나의 대략적인 InnoDB 크기 (id, post_id, user_id, 시각 3개 + 유니크 인덱스)
+ROW_BYTES = 80
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--error", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'viewers':>9} {'estimate':>9} {'error':>7} {'set KiB':>9} {'rows KiB':>9} {'sketch B':>9} {'blob B':>7}")
+    for viewers in (10, 100, 1_000, 10_000, 100_000, 1_000_000):
+        user_ids = rng.sample(range(1, 50_000_000), viewers)
+        sketch = HyperLogLog.from_error(args.error)
+        for user_id in user_ids:
+            sketch.add(user_id)
+
+        exact = set(user_ids)
+        estimate = sketch.count()
+        set_bytes = sys.getsizeof(exact) + sum(sys.getsizeof(u) for u in exact)
+        print(
+            f"{viewers:>9} {estimate:>9} {abs(estimate - viewers) / viewers:>7.2%} "
+            f"{set_bytes / 1024:>9.1f} {viewers * ROW_BYTES / 1024:>9.1f} "
+            f"{len(sketch.registers):>9} {len(sketch.to_bytes()):>7}"
+        )
+
+if __name__ == "__main__":
+    main()
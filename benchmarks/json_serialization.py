@@ -0,0 +1,96 @@
+"""
+피드 / 댓글 목록 응답 직렬화 비용 비교 (DB 없이 controller가 만드는 dict 형태로 측정)
+
+- before: dict 반환 시 FastAPI 기본 경로 (jsonable_encoder + 표준 json, JSONResponse)
+- orjson (encoder): default_response_class=ORJSONResponse 로 dict를 반환하는 경우 (jsonable_encoder는 그대로)
+- orjson (direct): 피드 / 상세 / 댓글 목록처럼 ORJSONResponse를 직접 반환하는 경우
+- TypeAdapter: 응답 모델로 한 번 검증한 뒤 pydantic-core로 직렬화하는 경우 (참고용)
+
+사용법: python benchmarks/json_serialization.py [--repeat 200]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from schemas import PostListResponse, CommentListResponse  # noqa: E402
+
+def feed_payload(count: int) -> dict:
+    now = datetime(2024, 1, 1)
+    return {
+        "code": "posts_retrieved",
+        "data": [
+            {
+                "postId": i,
+                "title": f"게시글 제목 {i}",
+                "content": "본문 내용입니다. " * 20,
+                "likeCount": i % 50,
+                "commentCount": i % 30,
+                "hits": i * 7,
+                "author": {"userId": i % 100, "nickname": f"user{i % 100}", "profileImageUrl": f"/public/image/profile/{i}.png"},
+                "file": {"fileId": 1, "fileUrl": f"/public/image/posts/{i}.jpg"} if i % 2 else None,
+                "createdAt": (now - timedelta(minutes=i)).isoformat(),
+            }
+            for i in range(count)
+        ],
+        "nextCursor": "eyJ2IjogWyIyMDI0LTAxLTAxVDAwOjAwOjAwIiwgMV19",
+    }
+
+def comments_payload(count: int) -> dict:
+    now = datetime(2024, 1, 1)
+    return {
+        "code": "COMMENTS_RETRIEVED",
+        "data": [
+            {
+                "commentId": i,
+                "postId": 1,
+                "content": f"댓글 내용 {i} " * 5,
+                "author": {"userId": i % 100, "nickname": f"user{i % 100}", "profileImageUrl": None},
+                "createdAt": (now - timedelta(seconds=i)).isoformat(),
+            }
+            for i in range(count)
+        ],
+        "nextCursor": None,
+    }
+
+def measure(fn, repeat: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+def run(name: str, payload: dict, model, repeat: int):
+    adapter = TypeAdapter(model)
+    validated = adapter.validate_python(payload)
+
+    cases = [
+        ("before (jsonable_encoder + json)", lambda: JSONResponse(jsonable_encoder(payload)).body),
+        ("orjson (jsonable_encoder + orjson)", lambda: ORJSONResponse(jsonable_encoder(payload)).body),
+        ("orjson (direct)", lambda: ORJSONResponse(payload).body),
+        ("TypeAdapter validate + dump_json", lambda: adapter.dump_json(adapter.validate_python(payload))),
+        ("TypeAdapter dump_json (pre-validated)", lambda: adapter.dump_json(validated)),
+    ]
+
+    print(f"{name} ({len(ORJSONResponse(payload).body) / 1024:.0f} KiB)")
+    baseline = None
+    for label, fn in cases:
+        ms = measure(fn, repeat)
+        baseline = baseline or ms
+        print(f"  {label:40s} {ms:8.3f} ms/op  x{baseline / ms:5.1f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    run("feed, 100 posts", feed_payload(100), PostListResponse, args.repeat)
+    run("comments, 1000 comments", comments_payload(1000), CommentListResponse, args.repeat)
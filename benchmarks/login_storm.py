@@ -0,0 +1,72 @@
+"""
+로그인 폭주 중 다른 엔드포인트(GET /) 지연 측정
+
+같은 이벤트 루프에서 앱을 직접 호출하므로 bcrypt가 루프를 막으면 GET / 지연이 그대로 드러납니다.
+사용법:
+    PASSWORD_HASH_EXECUTOR=none python benchmarks/login_storm.py    # 기존 방식 (루프에서 바로 해시)
+    PASSWORD_HASH_EXECUTOR=thread python benchmarks/login_storm.py
+    PASSWORD_HASH_EXECUTOR=process python benchmarks/login_storm.py
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKDIR = tempfile.mkdtemp(prefix="login-storm-")
+sys.path.insert(0, ROOT)
+os.chdir(WORKDIR)
+os.makedirs("public", exist_ok=True)
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{WORKDIR}/bench.db")
+os.environ.setdefault("VIEW_BUFFER_ENABLED", "false")
+
+import httpx  # noqa: E402
+
+from database import engine  # noqa: E402
+from main import app  # noqa: E402
+from migrations import upgrade  # noqa: E402
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    # main import는 스키마를 만들지 않으므로 먼저 적용
+    upgrade(engine)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post("/v1/auth/signup", data={"email": "storm@example.com", "password": "password1", "nickname": "storm"})
+
+        deadline = time.perf_counter() + args.duration
+        logins = 0
+        latencies = []
+
+        async def storm():
+            nonlocal logins
+            while time.perf_counter() < deadline:
+                await client.post("/v1/auth/login", json={"email": "storm@example.com", "password": "password1"})
+                logins += 1
+
+        async def probe():
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                await client.get("/")
+                latencies.append((time.perf_counter() - started) * 1000)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(probe(), *[storm() for _ in range(args.concurrency)])
+
+    print(f"executor={os.getenv('PASSWORD_HASH_EXECUTOR', 'thread')} logins/s={logins / args.duration:.1f} "
+          f"GET / p50={percentile(latencies, 0.5):.1f}ms p99={percentile(latencies, 0.99):.1f}ms "
+          f"max={max(latencies):.1f}ms samples={len(latencies)}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
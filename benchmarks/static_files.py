@@ -0,0 +1,121 @@
+"""
+/public 이미지 서빙 처리량 (uvicorn 워커 1개 기준)
+
+같은 이미지 파일을 아래 방식으로 서빙하는 uvicorn 워커를 각각 띄우고 동시에 요청합니다.
+- starlette: 기존 StaticFiles
+- public: PublicFiles (캐시 헤더, Range, 청크 전송)
+- public-range: PublicFiles에 Range: bytes=0-16383 요청 (이미지 일부 / 이어받기)
+- accel: PublicFiles + X-Accel-Redirect (본문은 nginx가 전송하므로 앱은 헤더만 응답)
+
+사용법: python benchmarks/static_files.py [--duration 5] [--concurrency 32] [--size-kb 200]
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import httpx  # noqa: E402
+from starlette.applications import Starlette  # noqa: E402
+from starlette.routing import Mount  # noqa: E402
+from starlette.staticfiles import StaticFiles  # noqa: E402
+
+from static_files import PublicFiles  # noqa: E402
+
+IMAGE_PATH = "image/posts/ab/cd/" + "ab" * 32 + ".jpg"
+
+def create_bench_app():
+    # uvicorn --factory 진입점, 모드와 디렉터리는 환경변수로 전달
+    directory = os.environ["BENCH_PUBLIC_DIR"]
+    mode = os.environ["BENCH_MODE"]
+    if mode == "starlette":
+        files = StaticFiles(directory=directory)
+    elif mode == "accel":
+        files = PublicFiles(directory=directory, accel_redirect_prefix="/_public")
+    else:
+        files = PublicFiles(directory=directory, accel_redirect_prefix="")
+    return Starlette(routes=[Mount("/public", files)])
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def start_worker(mode: str, directory: str):
+    port = free_port()
+    env = {**os.environ, "BENCH_PUBLIC_DIR": directory, "BENCH_MODE": mode, "PYTHONPATH": ROOT}
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "--factory", "benchmarks.static_files:create_bench_app",
+         "--port", str(port), "--log-level", "warning", "--no-access-log"],
+        cwd=ROOT, env=env
+    )
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return process, port
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("uvicorn worker did not start")
+
+async def run(label: str, port: int, headers: dict, duration: float, concurrency: int):
+    deadline = time.perf_counter() + duration
+    latencies = []
+    transferred = 0
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits) as client:
+        async def worker():
+            nonlocal transferred
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = await client.get(f"/public/{IMAGE_PATH}", headers=headers)
+                transferred += len(response.content)
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{label:>13}: {len(latencies) / duration:8.1f} req/s  {transferred / duration / 1024 / 1024:7.1f} MiB/s"
+        f"  p50={latencies[len(latencies) // 2]:.1f}ms  p99={p99:.1f}ms"
+    )
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--size-kb", type=int, default=200)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="static-bench-")
+    path = os.path.join(directory, IMAGE_PATH)
+    os.makedirs(os.path.dirname(path))
+    with open(path, "wb") as file:
+        file.write(b"\xff\xd8\xff" + os.urandom(args.size_kb * 1024))
+
+    cases = [
+        ("starlette", "starlette", {}),
+        ("public", "public", {}),
+        ("public-range", "public", {"Range": "bytes=0-16383"}),
+        ("accel", "accel", {}),
+    ]
+    for label, mode, headers in cases:
+        process, port = start_worker(mode, directory)
+        try:
+            await run(label, port, headers, args.duration, args.concurrency)
+        finally:
+            process.terminate()
+            process.wait()
+
+if __name__ == "__main__":
+    asyncio.run(main())
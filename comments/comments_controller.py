@@ -1,16 +1,19 @@
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from comments import comments_service
 from posts import posts_service
 from schemas import CommentCreate, CommentUpdate
+from pagination import encode_cursor
+from thumbnails import thumbnail_url, PROFILE_IMAGE_WIDTH
+from etag import make_etag, etag_matches, not_modified, conditional_json
+from typing import Optional
 
-def create_comment(postId: int, comment_data: CommentCreate, user: dict, db: Session):
+async def create_comment(postId: int, comment_data: CommentCreate, user: dict, db: AsyncSession):
     # 게시글 존재 여부 확인
-    post = posts_service.get_post_detail(postId, db)
-    if post is None:
+    if not await posts_service.post_exists(postId, db):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="POST_NOT_FOUND")
 
-    new_comment = comments_service.create_comment(postId, comment_data, user, db)
+    new_comment = await comments_service.create_comment(postId, comment_data, user, db)
     
     return {
         "code": "COMMENT_CREATED",
@@ -19,13 +22,12 @@ def create_comment(postId: int, comment_data: CommentCreate, user: dict, db: Ses
         }
     }
 
-def update_comment(postId: int, commentId: int, comment_data: CommentUpdate, user: dict, db: Session):
+async def update_comment(postId: int, commentId: int, comment_data: CommentUpdate, user: dict, db: AsyncSession):
     # 게시글 존재 여부 확인
-    post = posts_service.get_post_detail(postId, db)
-    if post is None:
+    if not await posts_service.post_exists(postId, db):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="POST_NOT_FOUND")
 
-    comment = comments_service.get_comment(commentId, db)
+    comment = await comments_service.get_comment(commentId, db)
     
     if comment is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="COMMENT_NOT_FOUND")
@@ -34,20 +36,28 @@ def update_comment(postId: int, commentId: int, comment_data: CommentUpdate, use
     if comment.user_id != user["id"]:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="FORBIDDEN")
     
-    comments_service.update_comment(commentId, comment_data, db)
+    await comments_service.update_comment(commentId, comment_data, db)
     
     return {
         "code": "COMMENT_UPDATED",
         "data": None
     }
 
-def get_comments(postId: int, db: Session):
-    # 게시글 존재 여부 확인
-    post = posts_service.get_post_detail(postId, db)
-    if post is None:
+async def get_comments(request, postId: int, db: AsyncSession, cursor: Optional[tuple] = None, limit: int = 20, order: str = "desc"):
+    # 게시글 존재 여부 확인 겸 댓글 목록 버전 조회, 변경이 없으면 댓글/작성자를 읽지 않고 304
+    version = await comments_service.get_comments_version(postId, db)
+    if version is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="POST_NOT_FOUND")
 
-    comments = comments_service.get_comments(postId, db)
+    etag = make_etag("comments", postId, version.comment_count, version.comments_version, cursor, limit, order)
+    last_modified = version.comments_updated_at
+    if etag_matches(request, etag):
+        return not_modified(etag, last_modified)
+
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    comments = await comments_service.get_comments(postId, db, cursor=cursor, limit=limit + 1, order=order)
+    has_next = len(comments) > limit
+    comments = comments[:limit]
     
     # 응답 포맷 변환
     data = []
@@ -63,23 +73,26 @@ def get_comments(postId: int, db: Session):
             "author": {
                 "userId": author_id,
                 "nickname": c.nickname,
-                "profileImageUrl": author_profile
+                "profileImageUrl": author_profile,
+                "profileThumbnailUrl": thumbnail_url(author_profile, PROFILE_IMAGE_WIDTH)
             },
             "createdAt": c.created_at.isoformat() if c.created_at else ""
         })
 
-    return {
+    next_cursor = encode_cursor(comments[-1].created_at, comments[-1].id) if has_next else None
+
+    return conditional_json({
         "code": "COMMENTS_RETRIEVED",
-        "data": data
-    }
+        "data": data,
+        "nextCursor": next_cursor
+    }, etag, last_modified)
 
-def delete_comment(postId: int, commentId: int, user: dict, db: Session):
+async def delete_comment(postId: int, commentId: int, user: dict, db: AsyncSession):
     # 게시글 존재 여부 확인
-    post = posts_service.get_post_detail(postId, db)
-    if post is None:
+    if not await posts_service.post_exists(postId, db):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="POST_NOT_FOUND")
 
-    comment = comments_service.get_comment(commentId, db)
+    comment = await comments_service.get_comment(commentId, db)
     
     if comment is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="COMMENT_NOT_FOUND")
@@ -87,7 +100,7 @@ def delete_comment(postId: int, commentId: int, user: dict, db: Session):
     if comment.user_id != user["id"]:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="FORBIDDEN")
     
-    comments_service.delete_comment(commentId, db)
+    await comments_service.delete_comment(commentId, db)
     
     return {
         "code": "COMMENT_DELETED",
@@ -1,15 +1,74 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc
+from sqlalchemy.orm import joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, asc, or_, and_, select, update, func
+from typing import Optional
 from models import Comment, Post
 from schemas import CommentCreate, CommentUpdate
+from posts.posts_feed_cache import feed_cache
 
-def get_comments(postId: int, db: Session):
-    return db.query(Comment).options(joinedload(Comment.user)).filter(Comment.post_id == postId).order_by(desc(Comment.created_at)).all()
+async def get_comments(postId: int, db: AsyncSession, cursor: Optional[tuple] = None, limit: int = 20, order: str = "desc"):
+    # cursor: 이전 페이지 마지막 댓글의 (created_at, id), order: desc(최신순) / asc(오래된순)
+    query = select(Comment).options(joinedload(Comment.user)).where(Comment.post_id == postId)
 
-def get_comment(commentId: int, db: Session):
-    return db.query(Comment).filter(Comment.id == commentId).first()
+    if order == "asc":
+        if cursor is not None:
+            created_at, comment_id = cursor
+            query = query.where(or_(
+                Comment.created_at > created_at,
+                and_(Comment.created_at == created_at, Comment.id > comment_id)
+            ))
+        query = query.order_by(asc(Comment.created_at), asc(Comment.id))
+    else:
+        if cursor is not None:
+            created_at, comment_id = cursor
+            query = query.where(or_(
+                Comment.created_at < created_at,
+                and_(Comment.created_at == created_at, Comment.id < comment_id)
+            ))
+        query = query.order_by(desc(Comment.created_at), desc(Comment.id))
 
-def create_comment(postId: int, comment_data: CommentCreate, user: dict, db: Session):
+    result = await db.execute(query.limit(limit))
+    return result.scalars().all()
+
+async def get_comments_version(postId: int, db: AsyncSession):
+    # 댓글 목록 ETag 계산용 버전 (게시글 PK 조회 한 번, 댓글 / 작성자 행은 읽지 않음), 게시글이 없으면 None
+    result = await db.execute(
+        select(Post.comment_count, Post.comments_version, Post.comments_updated_at).where(Post.id == postId)
+    )
+    return result.first()
+
+async def touch_comments(postId: int, delta: int, db: AsyncSession):
+    # 댓글 수와 댓글 목록 버전을 한 UPDATE로 갱신, 게시글 updated_at(onupdate)은 건드리지 않음, commit은 호출한 쪽에서
+    await db.execute(
+        update(Post)
+        .where(Post.id == postId)
+        .values({
+            Post.comment_count: Post.comment_count + delta,
+            Post.comments_version: Post.comments_version + 1,
+            Post.comments_updated_at: func.now(),
+            Post.updated_at: Post.updated_at,
+        })
+        .execution_options(synchronize_session=False)
+    )
+
+async def touch_author_comments(user_id: int, db: AsyncSession):
+    # 작성자 프로필 이미지가 바뀌면 그 사용자가 댓글을 단 게시글의 댓글 목록 버전만 올림 (ix_comments_user_id)
+    await db.execute(
+        update(Post)
+        .where(Post.id.in_(select(Comment.post_id).where(Comment.user_id == user_id).distinct()))
+        .values({
+            Post.comments_version: Post.comments_version + 1,
+            Post.comments_updated_at: func.now(),
+            Post.updated_at: Post.updated_at,
+        })
+        .execution_options(synchronize_session=False)
+    )
+
+async def get_comment(commentId: int, db: AsyncSession):
+    result = await db.execute(select(Comment).where(Comment.id == commentId))
+    return result.scalar_one_or_none()
+
+async def create_comment(postId: int, comment_data: CommentCreate, user: dict, db: AsyncSession):
     new_comment = Comment(
         post_id=postId,
         user_id=user["id"],
@@ -17,21 +76,26 @@ def create_comment(postId: int, comment_data: CommentCreate, user: dict, db: Ses
         nickname=user["nickname"]
     )
     db.add(new_comment)
-    db.commit()
-    db.refresh(new_comment)
+    await touch_comments(postId, 1, db)
+    await db.commit()
+    await db.refresh(new_comment)
+    await feed_cache.invalidate()
     return new_comment
 
-def update_comment(commentId: int, comment_data: CommentUpdate, db: Session):
-    comment = db.query(Comment).filter(Comment.id == commentId).first()
+async def update_comment(commentId: int, comment_data: CommentUpdate, db: AsyncSession):
+    comment = await get_comment(commentId, db)
     if comment:
         comment.comment = comment_data.content
-        db.commit()
-        db.refresh(comment)
+        await touch_comments(comment.post_id, 0, db)
+        await db.commit()
+        await db.refresh(comment)
     return comment
 
-def delete_comment(commentId: int, db: Session):
-    comment = db.query(Comment).filter(Comment.id == commentId).first()
+async def delete_comment(commentId: int, db: AsyncSession):
+    comment = await get_comment(commentId, db)
     if comment:
-        db.delete(comment)
-        db.commit()
+        await db.delete(comment)
+        await touch_comments(comment.post_id, -1, db)
+        await db.commit()
+        await feed_cache.invalidate()
     return comment
@@ -0,0 +1,169 @@
+"""
+응답 압축 (gzip / brotli)
+
+- Accept-Encoding(q 값 포함)으로 br > gzip 순서로 협상, brotli 패키지가 없으면 gzip만 사용
+- COMPRESSION_MIN_SIZE보다 작은 응답은 압축 비용이 절약보다 크므로 그대로 전송
+- JSON / 텍스트 계열 Content-Type만 압축, 이미 압축된 이미지(/public, image/*)와
+  Content-Encoding이 이미 있는 응답, 206 / 304 등 본문을 바꾸면 안 되는 응답은 제외
+- 한 번에 보내는 응답(ORJSONResponse 등)은 한 번에 압축하고 Content-Length를 갱신,
+  여러 번 나눠 보내는 응답은 청크마다 flush 하며 Content-Length 없이 전송
+- ETag는 etag.py에서 weak(W/)로 만들므로 압축 여부와 관계없이 그대로 사용 (strong ETag는 weak로 변환)
+"""
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config import COMPRESSION_MIN_SIZE, COMPRESSION_GZIP_LEVEL, COMPRESSION_BROTLI_QUALITY
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성 (pyproject extras: brotli)
+    brotli = None
+
+EXCLUDED_PATH_PREFIXES = ("/public",)
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/xml")
+SKIPPED_STATUS_CODES = {204, 206, 304}
+
+def available_encodings() -> tuple:
+    # 서버 선호 순서
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+def negotiate_encoding(accept_encoding: Optional[str], encodings: tuple) -> Optional[str]:
+    """
+Accept-Encoding에서 q 값이 가장 높은 인코딩을 고릅니다. 같으면 encodings 순서(서버 선호)를 따릅니다.
+q=0 이거나 언급되지 않은 인코딩(* 제외)은 사용하지 않습니다.
+    """
+    if not accept_encoding:
+        return None
+
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[coding] = q
+
+    best, best_q = None, 0.0
+    for encoding in encodings:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+def is_compressible(content_type: str) -> bool:
+    content_type = content_type.lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES) or "+json" in content_type
+
+
+class _Compressor:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality, mode=brotli.MODE_TEXT)
+            self._zlib = None
+        else:
+            # wbits=31: gzip 헤더 / 트레일러 포함
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+            self._brotli = None
+
+    def compress(self, data: bytes) -> bytes:
+        # 스트리밍 응답은 청크마다 클라이언트가 바로 풀 수 있도록 flush
+        if self._zlib is not None:
+            return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+        return self._brotli.process(data) + self._brotli.flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        if self._zlib is not None:
+            return self._zlib.compress(data) + self._zlib.flush()
+        return self._brotli.process(data) + self._brotli.finish()
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = COMPRESSION_MIN_SIZE,
+        gzip_level: int = COMPRESSION_GZIP_LEVEL,
+        brotli_quality: int = COMPRESSION_BROTLI_QUALITY,
+        excluded_paths: tuple = EXCLUDED_PATH_PREFIXES,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.excluded_paths = excluded_paths
+        self.encodings = available_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.excluded_paths):
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"), self.encodings)
+        start_message: Optional[Message] = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def compressing_send(message: Message) -> None:
+            nonlocal start_message, compressor, passthrough
+
+            if message["type"] == "http.response.start":
+                # 첫 본문을 보고 압축 여부를 정하기 위해 보류
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            if passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                headers = MutableHeaders(raw=start_message["headers"])
+                eligible = (
+                    start_message["status"] not in SKIPPED_STATUS_CODES
+                    and "content-encoding" not in headers
+                    and is_compressible(headers.get("content-type", ""))
+                )
+                if eligible:
+                    # 압축 가능한 응답은 캐시가 인코딩별로 구분하도록 항상 Vary 추가
+                    headers.add_vary_header("Accept-Encoding")
+                if not eligible or encoding is None or (not more_body and len(body) < self.minimum_size):
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                compressor = _Compressor(encoding, self.gzip_level, self.brotli_quality)
+                headers["Content-Encoding"] = encoding
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+
+                if not more_body:
+                    body = compressor.finish(body)
+                    headers["Content-Length"] = str(len(body))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+
+                del headers["Content-Length"]
+                await send(start_message)
+
+            body = compressor.compress(body) if more_body else compressor.finish(body)
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, compressing_send)
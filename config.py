@@ -0,0 +1,110 @@
+import os
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+def get_bool(name: str, default: bool = False) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+def get_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+def get_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+# 비동기 드라이버 URL (없으면 DATABASE_URL에서 mysql+aiomysql / sqlite+aiosqlite로 변환)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
+
+# 커넥션 풀 (워커 프로세스 / 엔진별)
+DB_POOL_SIZE = get_int("DB_POOL_SIZE", 5)
+DB_MAX_OVERFLOW = get_int("DB_MAX_OVERFLOW", 10)
+DB_POOL_TIMEOUT = get_float("DB_POOL_TIMEOUT", 30.0)  # 초
+DB_POOL_RECYCLE = get_int("DB_POOL_RECYCLE", 1800)  # 초, MySQL wait_timeout보다 짧게
+DB_POOL_PRE_PING = get_bool("DB_POOL_PRE_PING", True)
+# 워커 시작 시 미리 열어 둘 커넥션 수 (첫 요청이 연결 수립을 기다리지 않도록, 0이면 사용하지 않음)
+DB_POOL_WARM_SIZE = get_int("DB_POOL_WARM_SIZE", DB_POOL_SIZE)
+# 워커 시작 시 주요 조회문을 한 번씩 실행해 SQL 컴파일 캐시 예열
+DB_WARM_STATEMENTS = get_bool("DB_WARM_STATEMENTS", True)
+# 워커 시작 시 스키마 마이그레이션 적용 (단일 프로세스 개발용, 운영은 배포 시 python -m migrations upgrade)
+DB_MIGRATE_ON_STARTUP = get_bool("DB_MIGRATE_ON_STARTUP", False)
+
+# 읽기 전용 복제본 (쉼표로 구분, 비어 있으면 모든 요청이 DATABASE_URL 사용)
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+# 사용자가 쓰기 요청을 보낸 뒤 이 시간 동안은 읽기도 primary에서 (복제 지연으로 내 글이 안 보이는 문제 방지)
+DB_REPLICA_STICKY_SECONDS = get_float("DB_REPLICA_STICKY_SECONDS", 5.0)  # 초
+# 연결에 실패한 복제본을 제외했다가 다시 시도하기까지의 시간
+DB_REPLICA_RETRY_INTERVAL = get_float("DB_REPLICA_RETRY_INTERVAL", 30.0)  # 초
+
+# 개발 모드 (응답 헤더에 쿼리 통계 노출 등)
+DEBUG = get_bool("DEBUG")
+# 내부 통계 API(/internal/stats) 노출 여부
+INTERNAL_STATS_ENABLED = get_bool("INTERNAL_STATS_ENABLED", DEBUG)
+
+# 조회수 기록 write-behind 버퍼 (테스트 등에서는 false로 두면 요청 안에서 바로 기록)
+VIEW_BUFFER_ENABLED = get_bool("VIEW_BUFFER_ENABLED", True)
+VIEW_BUFFER_FLUSH_INTERVAL = get_float("VIEW_BUFFER_FLUSH_INTERVAL", 2.0)  # 초
+VIEW_BUFFER_FLUSH_SIZE = get_int("VIEW_BUFFER_FLUSH_SIZE", 500)
+VIEW_BUFFER_MAX_SIZE = get_int("VIEW_BUFFER_MAX_SIZE", 10000)
+
+# 조회수 집계 방식: exact(views 테이블 행 수) / hll(HyperLogLog 근사치, views 행을 쌓지 않음)
+VIEW_COUNT_BACKEND = os.getenv("VIEW_COUNT_BACKEND", "exact")
+# hll 사용 시 허용 표준 오차 (0.02 = 약 2%), 값이 작을수록 게시글당 sketch 크기가 커짐
+VIEW_HLL_ERROR = get_float("VIEW_HLL_ERROR", 0.02)
+
+# get_current_user 사용자 조회 캐시 (워커 프로세스별)
+AUTH_CACHE_TTL = get_float("AUTH_CACHE_TTL", 30.0)  # 초
+AUTH_CACHE_MAX_SIZE = get_int("AUTH_CACHE_MAX_SIZE", 10000)
+
+# 피드 페이지 응답 캐시
+FEED_CACHE_ENABLED = get_bool("FEED_CACHE_ENABLED", True)
+# memory(워커 프로세스별) / redis(워커 간 공유, redis 패키지 필요)
+FEED_CACHE_BACKEND = os.getenv("FEED_CACHE_BACKEND", "memory")
+FEED_CACHE_REDIS_URL = os.getenv("FEED_CACHE_REDIS_URL", "redis://localhost:6379/0")
+FEED_CACHE_TTL = get_float("FEED_CACHE_TTL", 5.0)  # 초, 조회수처럼 무효화하지 않는 값이 반영되기까지의 최대 지연
+FEED_CACHE_MAX_SIZE = get_int("FEED_CACHE_MAX_SIZE", 1000)
+
+# 이미지 업로드
+UPLOAD_MAX_SIZE = get_int("UPLOAD_MAX_SIZE", 5 * 1024 * 1024)  # 바이트, 파일 하나 기준
+UPLOAD_CHUNK_SIZE = get_int("UPLOAD_CHUNK_SIZE", 1024 * 1024)
+# multipart 본문 전체 한도 = UPLOAD_MAX_SIZE + 폼 필드 / boundary 여유분
+UPLOAD_FORM_OVERHEAD = get_int("UPLOAD_FORM_OVERHEAD", 64 * 1024)
+
+# 업로드 이미지 썸네일 (WebP 변형, Pillow 필요)
+THUMBNAIL_ENABLED = get_bool("THUMBNAIL_ENABLED", True)
+# 생성할 너비 목록, 가장 작은 너비는 프로필 이미지, 가장 큰 너비는 피드 게시글 이미지에 사용
+THUMBNAIL_WIDTHS = [int(w) for w in os.getenv("THUMBNAIL_WIDTHS", "160,320,640").split(",") if w.strip()]
+THUMBNAIL_QUALITY = get_int("THUMBNAIL_QUALITY", 80)
+THUMBNAIL_WORKERS = get_int("THUMBNAIL_WORKERS", 2)
+
+# /public 정적 파일: 설정하면 본문 대신 X-Accel-Redirect: <prefix>/<경로> 헤더만 응답 (nginx internal location에서 전송)
+STATIC_ACCEL_REDIRECT_PREFIX = os.getenv("STATIC_ACCEL_REDIRECT_PREFIX", "")
+
+# 응답 압축 (gzip / brotli, brotli는 brotli 패키지가 있을 때만 사용)
+COMPRESSION_ENABLED = get_bool("COMPRESSION_ENABLED", True)
+# 이보다 작은 응답은 압축하지 않음 (바이트)
+COMPRESSION_MIN_SIZE = get_int("COMPRESSION_MIN_SIZE", 1024)
+COMPRESSION_GZIP_LEVEL = get_int("COMPRESSION_GZIP_LEVEL", 4)  # 1~9, 6 이상은 크기는 거의 같고 CPU 비용만 2배 이상 (benchmarks/compression.py)
+COMPRESSION_BROTLI_QUALITY = get_int("COMPRESSION_BROTLI_QUALITY", 1)  # 0~11, 피드 본문에서 1~4는 크기 차이가 거의 없고 11은 수백 ms
+
+# 이메일 / 닉네임 사용 가능 여부 확인용 Bloom filter (워커 프로세스별)
+USER_FILTER_ENABLED = get_bool("USER_FILTER_ENABLED", True)
+USER_FILTER_ERROR_RATE = get_float("USER_FILTER_ERROR_RATE", 0.01)  # 오탐(DB 확인)률
+# 다른 워커에서 가입 / 닉네임을 변경한 사용자를 반영하는 주기
+USER_FILTER_REFRESH_INTERVAL = get_float("USER_FILTER_REFRESH_INTERVAL", 2.0)  # 초
+# 갱신 시 마지막으로 본 가입 / 수정 시각보다 이만큼 앞부터 다시 읽음 (늦게 커밋된 트랜잭션 / id 순서가 뒤바뀐 커밋 대비)
+USER_FILTER_REFRESH_OVERLAP = get_float("USER_FILTER_REFRESH_OVERLAP", 30.0)  # 초
+# 전체 재생성 주기 (filter에서 지울 수 없는 이전 닉네임 / 탈퇴한 사용자 정리)
+USER_FILTER_REBUILD_INTERVAL = get_float("USER_FILTER_REBUILD_INTERVAL", 600.0)  # 초
+
+# 비밀번호 해시 (bcrypt)
+BCRYPT_ROUNDS = get_int("BCRYPT_ROUNDS", 12)
+# 해시/검증을 이벤트 루프 밖에서 실행할 executor: thread / process / none(요청 처리 스레드에서 바로 실행)
+PASSWORD_HASH_EXECUTOR = os.getenv("PASSWORD_HASH_EXECUTOR", "thread")
+PASSWORD_HASH_WORKERS = get_int("PASSWORD_HASH_WORKERS", 4)
@@ -1,25 +1,378 @@
+import asyncio
+import logging
 import os
-from dotenv import load_dotenv
-from sqlalchemy import create_engine
+import threading
+import time
+from contextlib import contextmanager, asynccontextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
 
-# .env 파일 로드
-load_dotenv()
+from config import (
+    DATABASE_URL, ASYNC_DATABASE_URL,
+    DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_POOL_PRE_PING,
+    DATABASE_REPLICA_URLS, DB_REPLICA_STICKY_SECONDS, DB_REPLICA_RETRY_INTERVAL,
+)
 
-DATABASE_URL = os.getenv("DATABASE_URL")
+logger = logging.getLogger(__name__)
 
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL is not set in .env file")
 
+# 동기 드라이버 URL에 대응하는 비동기 드라이버
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+def to_async_url(url: str) -> str:
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+# 커넥션 풀 계측 (체크아웃 대기 시간 히스토그램, overflow / timeout 횟수)
+# 대기 시간은 풀에 빈 커넥션이 생기기를 기다린 시간만 (풀 크기 판단용),
+# 새 연결 수립 / pre-ping 등 체크아웃 중 DB 왕복 시간은 setup 히스토그램에 따로 기록 (DB / 네트워크 지연)
+WAIT_BUCKETS_MS = [1, 5, 10, 50, 100, 500, 1000, 5000]
+
+def _bucket_index(seconds: float) -> int:
+    milliseconds = seconds * 1000
+    return next((i for i, bound in enumerate(WAIT_BUCKETS_MS) if milliseconds <= bound), len(WAIT_BUCKETS_MS))
+
+def _histogram(counts: list) -> dict:
+    buckets = {f"le_{bound}ms": count for bound, count in zip(WAIT_BUCKETS_MS, counts)}
+    buckets[f"gt_{WAIT_BUCKETS_MS[-1]}ms"] = counts[-1]
+    return buckets
+
+class PoolMetrics:
+    def __init__(self):
+        self.checkouts = 0
+        self.overflow_checkouts = 0
+        self.timeouts = 0
+        self.peak_checked_out = 0
+        self.wait_total = 0.0  # 초 단위
+        self.wait_max = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)  # 마지막 칸은 5000ms 초과
+        self.setup_total = 0.0
+        self.setup_max = 0.0
+        self.setup_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self._lock = threading.Lock()
+
+    def observe(self, pool, waited: float, setup: float = 0.0):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+            self.wait_buckets[_bucket_index(waited)] += 1
+            self.setup_total += setup
+            self.setup_max = max(self.setup_max, setup)
+            self.setup_buckets[_bucket_index(setup)] += 1
+
+            self.peak_checked_out = max(self.peak_checked_out, pool.checkedout())
+            if pool.overflow() > 0:
+                self.overflow_checkouts += 1
+
+    def observe_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, pool) -> dict:
+        with self._lock:
+            return {
+                "size": pool.size(),
+                "checkedOut": pool.checkedout(),
+                "checkedIn": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "peakCheckedOut": self.peak_checked_out,
+                "checkouts": self.checkouts,
+                "overflowCheckouts": self.overflow_checkouts,
+                "timeouts": self.timeouts,
+                "waitAvgMs": self.wait_total / self.checkouts * 1000 if self.checkouts else 0.0,
+                "waitMaxMs": self.wait_max * 1000,
+                "waitHistogram": _histogram(self.wait_buckets),
+                "setupAvgMs": self.setup_total / self.checkouts * 1000 if self.checkouts else 0.0,
+                "setupMaxMs": self.setup_max * 1000,
+                "setupHistogram": _histogram(self.setup_buckets),
+            }
+
+class InstrumentedPoolMixin:
+    metrics: PoolMetrics
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.observe_timeout()
+            raise
+        elapsed = time.perf_counter() - started
+
+        # _do_get에서 기록한 큐 대기 시간, 나머지(새 연결 / 재연결 / pre-ping)는 setup
+        record = connection._connection_record.__dict__
+        waited = min(record.pop("_queue_wait", elapsed), elapsed)
+        record.pop("_connect_time", None)
+        self.metrics.observe(self, waited, elapsed - waited)
+        return connection
+
+    def _do_get(self):
+        # 빈 커넥션을 기다린 시간 (overflow 여유가 있으면 이 안에서 새 연결을 만들므로 그 시간은 제외)
+        # 경합 시 _do_get이 재귀 호출되면 바깥 호출이 전체 시간으로 덮어씀
+        started = time.perf_counter()
+        record = super()._do_get()
+        elapsed = time.perf_counter() - started
+        record._queue_wait = max(elapsed - record.__dict__.get("_connect_time", 0.0), 0.0)
+        return record
+
+    def _create_connection(self):
+        started = time.perf_counter()
+        record = super()._create_connection()
+        record._connect_time = time.perf_counter() - started
+        return record
+
+def instrumented_pool_class(base):
+    # dispose() 시 풀을 같은 클래스로 다시 만들므로 계측 객체는 클래스 속성으로 유지
+    return type(f"Instrumented{base.__name__}", (InstrumentedPoolMixin, base), {"metrics": PoolMetrics()})
+
+def engine_options(url: str, pool_base) -> dict:
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        # 메모리 SQLite는 커넥션 하나를 공유하는 전용 풀을 써야 함
+        return {}
+
+    return {
+        "poolclass": instrumented_pool_class(pool_base),
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,  # MySQL wait_timeout보다 짧게
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+def pool_stats() -> dict:
+    stats = {}
+    pools = [("sync", engine.pool), ("async", async_engine.pool)]
+    pools += [(f"replica{i}", replica.pool) for i, replica in enumerate(replica_router.engines)]
+    for name, pool in pools:
+        metrics = getattr(pool, "metrics", None)
+        stats[name] = metrics.snapshot(pool) if metrics else {"status": pool.status()}
+    return stats
+
 # SQLAlchemy 설정
-engine = create_engine(DATABASE_URL)
+# 동기 엔진: 마이그레이션, 백그라운드 스레드(조회 기록 flush), 관리 커맨드용
+# 엔진 생성은 연결을 열지 않으며, 첫 연결은 워커의 lifespan(warm_pool) 또는 첫 요청에서
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL, QueuePool))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
-# DB 세션 의존성 주입을 위한 함수
-def get_db():
-    db = SessionLocal()
-    try:
+# 비동기 엔진: API 요청 처리용 (이벤트 루프를 막지 않음)
+_async_url = ASYNC_DATABASE_URL or to_async_url(DATABASE_URL)
+async_engine = create_async_engine(_async_url, **engine_options(_async_url, AsyncAdaptedQueuePool))
+# commit 후 속성 접근 시 lazy refresh(비동기에서는 불가)가 일어나지 않도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+# 읽기 복제본 라우팅
+class ReplicaRouter:
+    """
+읽기 세션을 복제본 엔진들에 round-robin으로 분배합니다.
+연결에 실패한 복제본은 retry_interval 동안 후보에서 제외하고, 쓸 수 있는 복제본이 없으면 primary를 사용합니다.
+    """
+    def __init__(self, engines: list, retry_interval: float):
+        self.engines = engines
+        self.retry_interval = retry_interval
+
+        self.replica_reads = [0] * len(engines)
+        self.replica_failures = [0] * len(engines)
+        self.primary_reads = 0
+        self.sticky_reads = 0
+
+        self._down_until = [0.0] * len(engines)
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def candidates(self) -> list:
+        # 이번 요청에서 시도할 복제본 순서 (round-robin 시작점부터, 제외 중인 복제본은 건너뜀)
+        now = time.monotonic()
+        with self._lock:
+            start = self._counter
+            self._counter += 1
+        count = len(self.engines)
+        order = [(start + offset) % count for offset in range(count)]
+        return [index for index in order if self._down_until[index] <= now]
+
+    def mark_down(self, index: int):
+        with self._lock:
+            self.replica_failures[index] += 1
+            self._down_until[index] = time.monotonic() + self.retry_interval
+
+    def observe_replica(self, index: int):
+        with self._lock:
+            self.replica_reads[index] += 1
+
+    def observe_primary(self, sticky: bool):
+        with self._lock:
+            self.primary_reads += 1
+            if sticky:
+                self.sticky_reads += 1
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "replicas": [
+                    {
+                        "url": replica.url.render_as_string(hide_password=True),
+                        "healthy": self._down_until[i] <= now,
+                        "reads": self.replica_reads[i],
+                        "failures": self.replica_failures[i],
+                    }
+                    for i, replica in enumerate(self.engines)
+                ],
+                "primaryReads": self.primary_reads,
+                "stickyReads": self.sticky_reads,
+            }
+
+replica_router = ReplicaRouter(
+    [create_async_engine(url, **engine_options(url, AsyncAdaptedQueuePool)) for url in map(to_async_url, DATABASE_REPLICA_URLS)],
+    DB_REPLICA_RETRY_INTERVAL,
+)
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+DB_WRITE_AT_KEY = "db_write_at"
+
+def _has_session(request: Optional[Request]) -> bool:
+    return request is not None and "session" in request.scope
+
+def _is_sticky(request: Optional[Request]) -> bool:
+    if not _has_session(request):
+        return False
+    written_at = request.session.get(DB_WRITE_AT_KEY)
+    return written_at is not None and time.time() - written_at < DB_REPLICA_STICKY_SECONDS
+
+@asynccontextmanager
+async def read_session(request: Optional[Request] = None):
+    """
+읽기 전용 세션을 엽니다. 복제본이 설정되어 있으면 round-robin으로 고르고,
+최근 쓰기 요청을 보낸 사용자(read-your-writes)이거나 모든 복제본에 연결할 수 없으면 primary 세션을 엽니다.
+    """
+    sticky = _is_sticky(request)
+    if replica_router.engines and not sticky:
+        for index in replica_router.candidates():
+            db = AsyncSessionLocal(bind=replica_router.engines[index])
+            try:
+                # 커넥션을 미리 잡아 pre-ping으로 상태 확인, 실패하면 다음 복제본 시도
+                await db.connection()
+            except (exc.DBAPIError, exc.TimeoutError, OSError):
+                await db.close()
+                replica_router.mark_down(index)
+                logger.warning("read replica %d is unavailable, excluded for %.0fs", index, replica_router.retry_interval, exc_info=True)
+                continue
+
+            replica_router.observe_replica(index)
+            try:
+                yield db
+            finally:
+                await db.close()
+            return
+
+    replica_router.observe_primary(sticky)
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# 쓰기(또는 primary가 필요한) 라우트용 세션
+async def get_async_db(request: Request):
+    if replica_router.engines and request.method not in SAFE_METHODS and _has_session(request):
+        # 이후 DB_REPLICA_STICKY_SECONDS 동안 이 사용자의 읽기는 primary에서
+        request.session[DB_WRITE_AT_KEY] = time.time()
+
+    async with AsyncSessionLocal() as db:
         yield db
+
+# 읽기 전용 라우트용 세션 (복제본 또는 primary)
+async def get_read_db(request: Request):
+    async with read_session(request) as db:
+        yield db
+
+async def dispose_async_engines():
+    await async_engine.dispose()
+    for replica in replica_router.engines:
+        await replica.dispose()
+
+def _sync_engines() -> list:
+    return [engine, async_engine.sync_engine, *(replica.sync_engine for replica in replica_router.engines)]
+
+async def warm_pool(size: int):
+    """
+비동기 엔진(primary / 복제본)마다 커넥션을 size개(풀 크기 이내)까지 동시에 열어 두어
+워커의 첫 요청들이 연결 수립(TCP / 인증)을 기다리지 않도록 합니다.
+    """
+    async def touch(target):
+        async with target.connect() as conn:
+            await conn.exec_driver_sql("SELECT 1")
+
+    for target in (async_engine, *replica_router.engines):
+        count = min(size, target.pool.size()) if hasattr(target.pool, "size") else 0
+        if count <= 0:
+            continue
+        results = await asyncio.gather(*[touch(target) for _ in range(count)], return_exceptions=True)
+        failures = [result for result in results if isinstance(result, Exception)]
+        if failures:
+            # 복제본이 내려가 있어도 워커는 시작 (요청 시 read_session이 primary로 대체)
+            logger.warning("failed to warm %d connections for %s: %s", len(failures), target.url, failures[0])
+
+def _reset_pools_after_fork():
+    # preload 후 fork된 워커가 부모 프로세스의 커넥션(소켓)을 같이 쓰지 않도록 풀만 새로 만듦
+    # close=False: 부모가 쓰는 커넥션을 자식에서 닫지 않음
+    for target in _sync_engines():
+        target.dispose(close=False)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+
+# 요청 단위 쿼리 통계 (N+1 감지용)
+class QueryStats:
+    def __init__(self):
+        self.statements = 0
+        self.rows = 0
+        self.duration = 0.0  # 초 단위
+
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+@contextmanager
+def track_queries():
+    """
+블록 안에서 실행된 SQL 문 개수, 영향/조회 row 수(드라이버 rowcount 기준), DB 소요 시간을 집계합니다.
+요청 미들웨어나 테스트에서 `with track_queries() as stats:` 형태로 사용합니다.
+    """
+    stats = QueryStats()
+    token = _query_stats.set(stats)
+    try:
+        yield stats
     finally:
-        db.close()
+        _query_stats.reset(token)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started_at = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _query_stats.get()
+    if stats is None:
+        return
+
+    stats.statements += 1
+    stats.rows += max(cursor.rowcount, 0)
+    stats.duration += time.perf_counter() - context._query_started_at
+
+for _engine in _sync_engines():
+    event.listen(_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(_engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,61 @@
+"""
+조건부 GET(ETag / If-None-Match) 헬퍼
+
+리소스 본문 대신 가벼운 버전 값(updated_at, 카운터, 개수 등)으로 ETag를 만들고,
+클라이언트가 보낸 If-None-Match와 같으면 본문 없이 304를 응답합니다.
+압축 등으로 바이트가 달라질 수 있으므로 weak ETag(W/"...")를 사용합니다.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Optional
+
+from fastapi import Request, status
+from fastapi.responses import ORJSONResponse, Response
+
+def make_etag(*parts) -> str:
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode("utf-8"), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    # If-None-Match는 weak 비교 (W/ 접두어 무시), 여러 값은 쉼표로 구분
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if (tag[2:] if tag.startswith("W/") else tag) == opaque:
+            return True
+    return False
+
+def latest(*values: Optional[datetime]) -> Optional[datetime]:
+    # Last-Modified 후보 중 가장 최근 시각 (None 제외)
+    values = [value for value in values if value is not None]
+    return max(values) if values else None
+
+def http_date(value: datetime) -> str:
+    # DB 시각은 timezone 없는 UTC로 저장됨
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> dict:
+    headers = {
+        "ETag": etag,
+        # 사용자별 값(isLiked 등)이 포함되므로 공유 캐시에는 저장하지 않고, 매번 재검증
+        "Cache-Control": "private, no-cache",
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+def not_modified(etag: str, last_modified: Optional[datetime]) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag, last_modified))
+
+def conditional_json(content: dict, etag: str, last_modified: Optional[datetime]) -> ORJSONResponse:
+    # controller가 만든 dict를 jsonable_encoder 없이 바로 직렬화
+    return ORJSONResponse(content, headers=validator_headers(etag, last_modified))
@@ -1,61 +1,153 @@
-from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
-from fastapi.exceptions import RequestValidationError
-from starlette.exceptions import HTTPException as StarletteHTTPException
+"""
+API 서버 앱
+
+import 시에는 DB에 연결하지 않고 앱 구성만 하며, DB 관련 초기화는 워커마다 lifespan에서 실행합니다.
+- 스키마는 배포 시 명시적으로 적용: python -m migrations upgrade (개발용: DB_MIGRATE_ON_STARTUP=true)
+- 시작: 커넥션 풀 예열(DB_POOL_WARM_SIZE), 주요 조회문 컴파일 캐시 예열(DB_WARM_STATEMENTS), 백그라운드 스레드 시작
+- 종료: 백그라운드 스레드 / executor 정리, 엔진 dispose
+
+실행 예)
+uvicorn main:app                                # 또는 uvicorn --factory main:create_app
+gunicorn main:app -k uvicorn.workers.UvicornWorker -w 4 --preload
+  (--preload: 마스터에서 한 번 import 후 fork, 워커별 풀은 database의 fork 훅이 새로 만듦)
+"""
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
 
-from posts import posts_router
-from comments import comments_router
-from auth import auth_router
+from posts import posts_router, posts_service
+from posts.posts_views import view_buffer
+from comments import comments_router, comments_service
+from auth import auth_router, auth_service
+from auth.auth_availability import user_filter
+from migrations import upgrade as upgrade_schema
 from users import users_router
+from stats import stats_router
 from exceptions import register_exception_handlers
-from auth.auth_utils import SECRET_KEY
+from uploads import UploadSizeLimitMiddleware
+from compression import CompressionMiddleware
+from static_files import PublicFiles
+from thumbnails import shutdown_thumbnail_executor
+from auth.auth_utils import SECRET_KEY, shutdown_password_executor
+
+from database import engine, AsyncSessionLocal, warm_pool, dispose_async_engines, track_queries
+from config import DEBUG, COMPRESSION_ENABLED, DB_POOL_WARM_SIZE, DB_WARM_STATEMENTS, DB_MIGRATE_ON_STARTUP
+
+logger = logging.getLogger(__name__)
+
+async def warm_hot_statements():
+    # 주요 조회문을 결과가 없는 값으로 한 번씩 실행해 SQLAlchemy 컴파일 캐시 / ORM 로딩 경로를 미리 준비
+    # (첫 요청들이 SQL 컴파일 비용을 내지 않도록, PK / 인덱스 조회라 DB 부하는 거의 없음)
+    async with AsyncSessionLocal() as db:
+        await posts_service.get_all_posts(1, 1, db)
+        await posts_service.get_posts_by_cursor((datetime.utcnow(), 0), 1, db)
+        await posts_service.get_post_version(0, 0, db)
+        await posts_service.get_post_detail(0, db)
+        await comments_service.get_comments(0, db, limit=1)
+        await comments_service.get_comments_version(0, db)
+        await auth_service.is_email_exist("", db)
+        await auth_service.is_nickname_exist("", db)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if DB_MIGRATE_ON_STARTUP:
+        await run_in_threadpool(upgrade_schema, engine)
+
+    await warm_pool(DB_POOL_WARM_SIZE)
+    if DB_WARM_STATEMENTS:
+        try:
+            await warm_hot_statements()
+        except Exception:
+            # 스키마가 아직 없는 경우 등, 워커는 시작하고 요청 시 다시 컴파일
+            logger.warning("failed to warm hot statements (run: python -m migrations upgrade)", exc_info=True)
+
+    # 조회 기록 버퍼 flush 스레드 / 이메일·닉네임 사용 가능 여부 filter 생성·갱신 스레드
+    view_buffer.start()
+    user_filter.start()
+    try:
+        yield
+    finally:
+        # 남은 조회 기록 flush 후 종료
+        view_buffer.stop()
+        user_filter.stop()
+        shutdown_password_executor()
+        shutdown_thumbnail_executor()
+        await dispose_async_engines()
+
+def create_app() -> FastAPI:
+    # dict를 반환하는 라우트도 표준 json 대신 orjson으로 직렬화
+    app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+    # 업로드 본문 크기 제한 (CORS 헤더가 붙도록 CORS보다 안쪽에 등록)
+    app.add_middleware(UploadSizeLimitMiddleware)
+
+    app.add_middleware(SessionMiddleware, secret_key=SECRET_KEY, max_age=3600)
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origin_regex=".*",     # 모든 Origin 허용 (Credentials 포함) (개발용)
+        allow_credentials=True,      # 쿠키 / 세션 / 인증 헤더 허용
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # 피드 / 댓글 목록 등 JSON 응답 압축 (/public 이미지는 제외)
+    if COMPRESSION_ENABLED:
+        app.add_middleware(CompressionMiddleware)
 
-from database import engine
-import models
+    # 개발 모드에서는 요청별 SQL 실행 통계를 응답 헤더로 노출 (N+1 확인용)
+    if DEBUG:
+        @app.middleware("http")
+        async def query_stats_header(request: Request, call_next):
+            with track_queries() as stats:
+                response = await call_next(request)
 
-app = FastAPI()
+            response.headers["X-DB-Statements"] = str(stats.statements)
+            response.headers["X-DB-Rows"] = str(stats.rows)
+            response.headers["X-DB-Time"] = f"{stats.duration * 1000:.2f}ms"
+            return response
 
-app.add_middleware(SessionMiddleware, secret_key=SECRET_KEY, max_age=3600)
+    # 정적 파일 서빙 설정 (이미지 등), 캐시 헤더 / Range / X-Accel-Redirect 지원
+    app.mount("/public", PublicFiles(directory="public"), name="public")
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origin_regex=".*",     # 모든 Origin 허용 (Credentials 포함) (개발용)
-    allow_credentials=True,      # 쿠키 / 세션 / 인증 헤더 허용
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    # 게시글 라우터 등록
+    app.include_router(posts_router.router)
 
-# 정적 파일 서빙 설정 (이미지 등)
-app.mount("/public", StaticFiles(directory="public"), name="public")
+    # 댓글 라우터 등록
+    app.include_router(comments_router.router)
 
-# 게시글 라우터 등록
-app.include_router(posts_router.router)
+    # 인증 라우터 등록
+    app.include_router(auth_router.router)
 
-# 댓글 라우터 등록
-app.include_router(comments_router.router)
+    # 유저 라우터 등록
+    app.include_router(users_router.router)
 
-# 인증 라우터 등록
-app.include_router(auth_router.router)
+    # 내부 통계 라우터 등록
+    app.include_router(stats_router.router)
 
-# 유저 라우터 등록
-app.include_router(users_router.router)
+    # 예외 처리기 등록
+    register_exception_handlers(app)
 
-# 예외 처리기 등록
-register_exception_handlers(app)
+    # 루트 경로
+    @app.get("/")
+    async def root():
+        return {"message": "Community API Server is running"}
 
-# 테이블 생성
-models.Base.metadata.create_all(bind=engine)
+    return app
 
-# 루트 경로
-@app.get("/")
-async def root():
-    return {"message": "Community API Server is running"}
+# uvicorn main:app / gunicorn main:app 호환 (앱 구성만 하므로 DB 연결 없음)
+app = create_app()
 
 # 서버 실행 (python main.py 실행 간편화)
 # 완성 후 제거
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # 개발 실행 시에는 스키마를 먼저 적용
+    upgrade_schema(engine)
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
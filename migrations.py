@@ -0,0 +1,331 @@
+"""
+버전별 스키마 마이그레이션
+
+create_all은 없는 테이블만 만들고 기존 테이블의 컬럼 / 인덱스는 바꾸지 않으므로,
+스키마 변경을 번호가 붙은 마이그레이션으로 순서대로 적용하고 적용 기록을 schema_migrations 테이블에 남깁니다.
+각 마이그레이션은 현재 스키마를 확인한 뒤 필요한 변경만 적용하므로(멱등),
+create_all로 만들어진 기존 DB나 일부만 적용된 DB에도 그대로 실행할 수 있습니다.
+
+새 마이그레이션은 MIGRATIONS 끝에 다음 번호로 추가합니다. (이미 적용된 마이그레이션은 수정하지 않음)
+
+사용법:
+python -m migrations upgrade     # 적용되지 않은 마이그레이션 적용
+python -m migrations status      # 적용 여부 출력
+python -m migrations check-plans # 시드 DB에서 주요 조회 쿼리의 실행 계획 확인 (full scan이면 실패)
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from sqlalchemy import (
+    Column, Integer, String, DateTime, MetaData, Table, inspect, select, text, create_engine, event, exc
+)
+from sqlalchemy.engine import Connection, Engine
+
+import models
+from models import Post
+
+Migration = namedtuple("Migration", ["version", "description", "apply"])
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("description", String(200), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def _create_tables(conn: Connection):
+    # 없는 테이블만 생성 (기존 DB는 그대로), 새 DB는 models의 컬럼 / 인덱스가 모두 포함됨
+    models.Base.metadata.create_all(bind=conn)
+
+def _add_post_counters(conn: Connection):
+    # 비정규화 카운터 도입 전에 만들어진 posts 테이블
+    # 값은 python -m posts.posts_counters 로 채움
+    existing = {c["name"] for c in inspect(conn).get_columns(Post.__tablename__)}
+    for name in ("like_count", "view_count", "comment_count"):
+        if name not in existing:
+            conn.execute(text(f"ALTER TABLE {Post.__tablename__} ADD COLUMN {name} INTEGER NOT NULL DEFAULT 0"))
+
+# 주요 조회 쿼리용 인덱스 (models에 정의된 이름)
+HOT_QUERY_INDEXES = {
+    "posts": ["ix_posts_created_at_id", "ix_posts_user_id"],            # 피드 정렬 / 작성자별 게시글
+    "comments": ["ix_comments_post_id_created_at_id"],                  # 게시글별 댓글 목록
+    "likes": ["ix_likes_post_id_id"],                                   # 게시글별 좋아요 목록
+    "users": ["ix_users_nickname"],                                     # 닉네임 중복 확인
+}
+
+# 이메일 / 닉네임 filter 갱신 시 최근 가입 / 수정된 사용자 조회용 (auth_availability.refresh)
+USER_FILTER_INDEXES = {
+    "users": ["ix_users_created_at", "ix_users_updated_at"],
+}
+
+def _create_indexes(conn: Connection, indexes: dict):
+    for table_name, index_names in indexes.items():
+        table = models.Base.metadata.tables[table_name]
+        for index in table.indexes:
+            if index.name in index_names:
+                index.create(conn, checkfirst=True)
+
+def _add_hot_query_indexes(conn: Connection):
+    _create_indexes(conn, HOT_QUERY_INDEXES)
+
+def _add_user_filter_indexes(conn: Connection):
+    _create_indexes(conn, USER_FILTER_INDEXES)
+
+# 작성자의 프로필 변경 시 댓글 단 게시글의 댓글 목록 버전 갱신용 (comments_service.touch_author_comments)
+COMMENT_AUTHOR_INDEXES = {
+    "comments": ["ix_comments_user_id"],
+}
+
+def _add_comments_version(conn: Connection):
+    # 댓글 목록 조건부 GET이 댓글 행을 집계하지 않고 게시글 행 하나만 읽도록
+    # 기존 게시글의 comments_updated_at은 NULL로 두고(Last-Modified 없이 ETag만 사용) 다음 댓글 변경 시 채워짐
+    existing = {c["name"] for c in inspect(conn).get_columns(Post.__tablename__)}
+    if "comments_version" not in existing:
+        conn.execute(text(f"ALTER TABLE {Post.__tablename__} ADD COLUMN comments_version INTEGER NOT NULL DEFAULT 0"))
+    if "comments_updated_at" not in existing:
+        conn.execute(text(f"ALTER TABLE {Post.__tablename__} ADD COLUMN comments_updated_at DATETIME NULL"))
+    _create_indexes(conn, COMMENT_AUTHOR_INDEXES)
+
+# 사용자 삭제 시 다른 게시글에 남긴 좋아요 / 조회 기록 조회용 (posts_service.delete_user_content)
+USER_ACTIVITY_INDEXES = {
+    "likes": ["ix_likes_user_id"],
+    "views": ["ix_views_user_id"],
+}
+
+def _add_user_activity_indexes(conn: Connection):
+    _create_indexes(conn, USER_ACTIVITY_INDEXES)
+
+def _add_post_search_index(conn: Connection):
+    from posts import posts_search
+
+    posts_search.ensure_search_index(conn)
+    if conn.dialect.name != "sqlite":
+        # MySQL FULLTEXT 인덱스는 생성 시 기존 행을 모두 색인
+        return
+
+    # FTS5 테이블은 별도 테이블이므로 기존 게시글을 배치로 색인 (이미 색인된 게시글은 건너뜀)
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            text(
+                f"SELECT id, title, detail FROM {Post.__tablename__} "
+                f"WHERE id > :last_id AND id NOT IN (SELECT rowid FROM {posts_search.FTS_TABLE}) ORDER BY id LIMIT 500"
+            ),
+            {"last_id": last_id}
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            text(f"INSERT INTO {posts_search.FTS_TABLE} (rowid, title, detail) VALUES (:id, :title, :detail)"),
+            [{"id": row.id, "title": posts_search.ngrams(row.title), "detail": posts_search.ngrams(row.detail)} for row in rows]
+        )
+        last_id = rows[-1].id
+
+MIGRATIONS = [
+    Migration(1, "create tables", _create_tables),
+    Migration(2, "add post counter columns", _add_post_counters),
+    Migration(3, "add hot query indexes", _add_hot_query_indexes),
+    Migration(4, "add post full-text search index", _add_post_search_index),
+    Migration(5, "add user filter refresh indexes", _add_user_filter_indexes),
+    Migration(6, "add post comments version columns", _add_comments_version),
+    Migration(7, "add user activity indexes", _add_user_activity_indexes),
+]
+
+
+def applied_versions(engine: Engine) -> set:
+    with engine.begin() as conn:
+        schema_migrations.create(conn, checkfirst=True)
+        return set(conn.execute(select(schema_migrations.c.version)).scalars())
+
+def upgrade(engine: Engine) -> list:
+    """
+적용되지 않은 마이그레이션을 번호 순서로 하나씩(각각 한 트랜잭션) 적용하고 적용한 번호 목록을 반환합니다.
+MySQL DDL은 트랜잭션으로 묶이지 않지만, 마이그레이션이 멱등이므로 중간에 실패해도 다시 실행하면 됩니다.
+    """
+    applied = applied_versions(engine)
+    done = []
+    for migration in MIGRATIONS:
+        if migration.version in applied:
+            continue
+        try:
+            with engine.begin() as conn:
+                migration.apply(conn)
+                conn.execute(schema_migrations.insert().values(
+                    version=migration.version, description=migration.description, applied_at=datetime.utcnow()
+                ))
+        except exc.IntegrityError:
+            # 다른 프로세스가 같은 마이그레이션을 먼저 기록함
+            continue
+        done.append(migration.version)
+    return done
+
+
+# 주요 조회 쿼리 실행 계획 확인 (python -m migrations check-plans)
+# posts_service / comments_service / auth_service의 함수를 시드 DB에 실제로 실행해 나간 SELECT를 모으고,
+# 각각 EXPLAIN 하여 인덱스 없이 테이블 전체를 읽는 쿼리가 있으면 실패(종료 코드 1)합니다.
+
+SEED_USERS = 200
+SEED_POSTS = 2000
+SEED_COMMENTS_PER_POST = 5
+
+def seed(engine: Engine):
+    # 옵티마이저가 작은 테이블에서 인덱스 대신 전체 스캔을 고르지 않도록 충분한 행 + 통계
+    now = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(models.User.__table__.insert(), [
+            {"email": f"user{i}@example.com", "password": "x", "nickname": f"user{i}", "created_at": now - timedelta(hours=i)}
+            for i in range(1, SEED_USERS + 1)
+        ])
+        conn.execute(models.Post.__table__.insert(), [
+            {"user_id": i % SEED_USERS + 1, "title": f"서버 배포 후기 {i}", "detail": f"본문 {i} 내용입니다",
+             "nickname": f"user{i % SEED_USERS + 1}", "created_at": now - timedelta(minutes=i)}
+            for i in range(1, SEED_POSTS + 1)
+        ])
+        conn.execute(models.Comment.__table__.insert(), [
+            {"post_id": i // SEED_COMMENTS_PER_POST + 1, "user_id": i % SEED_USERS + 1, "comment": f"댓글 {i}",
+             "nickname": f"user{i % SEED_USERS + 1}", "created_at": now - timedelta(seconds=i)}
+            for i in range(SEED_POSTS * SEED_COMMENTS_PER_POST)
+        ])
+        conn.execute(models.Like.__table__.insert(), [
+            {"post_id": i % SEED_POSTS + 1, "user_id": (i + i // SEED_POSTS) % SEED_USERS + 1} for i in range(SEED_POSTS * 3)
+        ])
+        # 검색 색인에 시드 게시글 반영
+        _add_post_search_index(conn)
+        conn.execute(text("ANALYZE"))
+
+async def run_hot_queries(async_engine):
+    # 실제 서비스 함수를 실행 (쓰기 없이 조회만)
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from posts import posts_service, posts_search
+    from comments import comments_service
+    from auth import auth_service
+
+    now = datetime(2024, 1, 1)
+    session_factory = async_sessionmaker(async_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        await posts_service.get_all_posts(1, 10, db)
+        await posts_service.get_all_posts(20, 10, db)
+        await posts_service.get_posts_by_cursor((now - timedelta(minutes=100), 100), 11, db)
+        await posts_service.get_posts_by_ids([5, 3, 1], db)
+        await posts_service.get_post_detail(1, db)
+        await posts_service.get_post_version(1, 1, db)
+        await posts_service.get_post_like_count(1, db)
+        await posts_service.get_post_likers(1, None, 20, db)
+        await posts_service.get_post_likers(1, 100, 20, db)
+        await posts_service.get_liked_post_ids([1, 2, 3], 1, db)
+        await posts_search.search_post_ids("서버 배포", 11, db)
+        await comments_service.get_comments(1, db)
+        await comments_service.get_comments(1, db, cursor=(now, 3), order="asc")
+        await comments_service.get_comments(1, db, cursor=(now, 3), order="desc")
+        await comments_service.get_comments_version(1, db)
+        await auth_service.is_email_exist("user1@example.com", db)
+        await auth_service.is_nickname_exist("user1", db)
+
+    # 이메일 / 닉네임 filter 갱신 (다른 워커의 가입 / 닉네임 변경, 동기 세션으로 실행)
+    from auth.auth_availability import UserAvailabilityFilter
+
+    availability = UserAvailabilityFilter(0.01, 0, 0)
+    availability._last_user_id, availability._last_changed_at = SEED_USERS, now
+    async with session_factory() as db:
+        await db.run_sync(availability.refresh)
+
+def full_scans(conn: Connection, statement: str, parameters) -> list:
+    """
+실행 계획에서 인덱스 없이 테이블 전체를 읽는 단계를 반환합니다.
+SQLite: "SCAN <table>" (USING INDEX / 가상 테이블 제외), MySQL: type = ALL
+    """
+    raw = conn.connection.cursor()
+    try:
+        if conn.dialect.name == "sqlite":
+            raw.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            details = [row[3] for row in raw.fetchall()]
+            return [
+                detail for detail in details
+                if detail.startswith("SCAN ") and " USING " not in detail
+                and "VIRTUAL TABLE" not in detail and "CONSTANT ROW" not in detail
+                and not detail.startswith("SCAN SUBQUERY")  # 서브쿼리 결과(이미 인덱스로 좁혀진 행)
+            ]
+        raw.execute(f"EXPLAIN {statement}", parameters)
+        columns = [column[0] for column in raw.description]
+        rows = [dict(zip(columns, row)) for row in raw.fetchall()]
+        # <derived2> 등 서브쿼리 결과는 제외
+        return [
+            f"{row['table']}: type=ALL" for row in rows
+            if row.get("type") == "ALL" and row.get("table") and not row["table"].startswith("<")
+        ]
+    finally:
+        raw.close()
+
+def check_plans(database_url: str = None) -> int:
+    from database import to_async_url
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    temp_dir = None
+    if database_url is None:
+        temp_dir = tempfile.mkdtemp(prefix="plan-check-")
+        database_url = f"sqlite:///{os.path.join(temp_dir, 'seed.db')}"
+
+    engine = create_engine(database_url)
+    if temp_dir is not None:
+        upgrade(engine)
+        seed(engine)
+
+    async_engine = create_async_engine(to_async_url(database_url))
+    statements = []
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and (statement, parameters) not in statements:
+            statements.append((statement, parameters))
+
+    async def run():
+        try:
+            await run_hot_queries(async_engine)
+        finally:
+            await async_engine.dispose()
+
+    asyncio.run(run())
+
+    failures = 0
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            scans = full_scans(conn, statement, parameters)
+            summary = " ".join(statement.split())[:120]
+            if scans:
+                failures += 1
+                print(f"FULL SCAN {summary}\n  {'; '.join(scans)}")
+            else:
+                print(f"ok        {summary}")
+    engine.dispose()
+
+    print(f"{len(statements)} queries checked, {failures} with full scans")
+    return failures
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Schema migrations")
+    parser.add_argument("command", choices=["upgrade", "status", "check-plans"])
+    parser.add_argument(
+        "--database-url",
+        help="check-plans only: EXPLAIN against this database instead of a seeded temporary SQLite database"
+    )
+    args = parser.parse_args()
+
+    if args.command == "check-plans":
+        sys.exit(1 if check_plans(args.database_url) else 0)
+
+    from database import engine
+
+    if args.command == "upgrade":
+        versions = upgrade(engine)
+        print(f"applied migrations: {versions}" if versions else "already up to date")
+    else:
+        applied = applied_versions(engine)
+        for migration in MIGRATIONS:
+            print(f"{'x' if migration.version in applied else ' '} {migration.version:4d} {migration.description}")
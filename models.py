@@ -1,18 +1,28 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, UniqueConstraint, Index, LargeBinary
 from sqlalchemy.orm import relationship
+from sqlalchemy.dialects import sqlite
 from database import Base
 from sqlalchemy.sql import func
 
+# 커서 페이지네이션 정렬 키로 쓰는 시각 컬럼용 타입
+# SQLite는 DATETIME을 문자열로 비교하므로 CURRENT_TIMESTAMP와 같은 초 단위 형식으로 바인딩 (MySQL DATETIME과 동일한 정밀도)
+Timestamp = DateTime().with_variant(
+    sqlite.DATETIME(storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"),
+    "sqlite"
+)
+
 class User(Base):
     __tablename__ = "users"
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(100), unique=True, nullable=False)
     password = Column(String(255), nullable=False)
-    nickname = Column(String(20), nullable=False)
+    # 닉네임 중복 확인용 (ix_users_nickname)
+    nickname = Column(String(20), nullable=False, index=True)
     profile_image_url = Column(String(1000), nullable=True)
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, nullable=True, onupdate=func.now())
+    # 이메일 / 닉네임 filter가 최근 가입 / 수정된 사용자만 읽도록 (ix_users_created_at, ix_users_updated_at)
+    created_at = Column(DateTime, default=func.now(), index=True)
+    updated_at = Column(DateTime, nullable=True, onupdate=func.now(), index=True)
     deleted_at = Column(DateTime, nullable=True)
 
     posts = relationship("Post", back_populates="user")
@@ -23,32 +33,48 @@ class Post(Base):
     __tablename__ = "posts"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # 작성자별 게시글 / 사용자 삭제 시 FK 확인용 (ix_posts_user_id, MySQL은 FK에 자동 생성되지만 SQLite는 아님)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     title = Column(String(200), nullable=False)
     detail = Column(Text, nullable=False)
     nickname = Column(String(50), nullable=False)
     post_image_url = Column(String(1000), nullable=True)
-    created_at = Column(DateTime, default=func.now())
+    # 목록 조회 시 매번 COUNT 하지 않도록 쓰기 시점에 함께 갱신하는 비정규화 카운터
+    like_count = Column(Integer, nullable=False, default=0, server_default="0")
+    view_count = Column(Integer, nullable=False, default=0, server_default="0")
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
+    # 댓글 목록 ETag / Last-Modified용, 댓글 작성/수정/삭제와 댓글 작성자의 프로필 이미지 변경 시 갱신
+    comments_version = Column(Integer, nullable=False, default=0, server_default="0")
+    comments_updated_at = Column(DateTime, nullable=True)
+    created_at = Column(Timestamp, default=func.now())
     updated_at = Column(DateTime, nullable=True, onupdate=func.now())
     deleted_at = Column(DateTime, nullable=True)
 
+    # 피드 정렬 / 커서 페이지네이션용 (created_at DESC, id DESC)
+    __table_args__ = (Index("ix_posts_created_at_id", "created_at", "id"),)
+
     user = relationship("User", back_populates="posts")
     comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan")
     likes = relationship("Like", back_populates="post", cascade="all, delete-orphan")
     views = relationship("View", back_populates="post", cascade="all, delete-orphan")
+    view_sketch = relationship("PostViewSketch", uselist=False, cascade="all, delete-orphan")
 
 class Comment(Base):
     __tablename__ = "comments"
 
     id = Column(Integer, primary_key=True, index=True)
     post_id = Column(Integer, ForeignKey("posts.id"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # 작성자의 프로필 변경 시 댓글 단 게시글 찾기 / 사용자 삭제 시 FK 확인용 (ix_comments_user_id)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     comment = Column(String(100), nullable=False)
     nickname = Column(String(100), nullable=False)
-    created_at = Column(DateTime, default=func.now())
+    created_at = Column(Timestamp, default=func.now())
     updated_at = Column(DateTime, nullable=True, onupdate=func.now())
     deleted_at = Column(DateTime, nullable=True)
 
+    # 게시글별 댓글 목록 커서 페이지네이션용
+    __table_args__ = (Index("ix_comments_post_id_created_at_id", "post_id", "created_at", "id"),)
+
     post = relationship("Post", back_populates="comments")
     user = relationship("User")
 
@@ -57,12 +83,17 @@ class Like(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     post_id = Column(Integer, ForeignKey("posts.id"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # 사용자 삭제 시 좋아요 기록 / FK 확인용 (ix_likes_user_id)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, nullable=True, onupdate=func.now())
     deleted_at = Column(DateTime, nullable=True)
 
-    __table_args__ = (UniqueConstraint('post_id', 'user_id', name='unique_post_user_like'),)
+    __table_args__ = (
+        UniqueConstraint('post_id', 'user_id', name='unique_post_user_like'),
+        # 게시글별 좋아요 목록 커서 페이지네이션용
+        Index("ix_likes_post_id_id", "post_id", "id"),
+    )
 
     post = relationship("Post", back_populates="likes")
     user = relationship("User", back_populates="likes")
@@ -72,7 +103,8 @@ class View(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     post_id = Column(Integer, ForeignKey("posts.id"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # 사용자 삭제 시 조회 기록 / FK 확인용 (ix_views_user_id)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, nullable=True, onupdate=func.now())
     deleted_at = Column(DateTime, nullable=True)
@@ -81,3 +113,13 @@ class View(Base):
 
     post = relationship("Post", back_populates="views")
     user = relationship("User", back_populates="views")
+
+
+class PostViewSketch(Base):
+    # VIEW_COUNT_BACKEND=hll 일 때 게시글별 고유 조회자 HyperLogLog sketch (zlib 압축된 레지스터)
+    __tablename__ = "post_view_sketches"
+
+    post_id = Column(Integer, ForeignKey("posts.id"), primary_key=True)
+    precision = Column(Integer, nullable=False)
+    registers = Column(LargeBinary, nullable=False)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
@@ -0,0 +1,49 @@
+import base64
+import json
+from datetime import datetime
+
+# 커서(keyset) 페이지네이션용 불투명 토큰 인코딩/디코딩
+# 토큰 내부는 정렬 키 값 목록(JSON)이며, datetime은 ISO 문자열로 저장
+
+def encode_cursor(*values) -> str:
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """
+토큰을 정렬 키 값 목록으로 되돌립니다. 형식이 맞지 않으면 ValueError를 발생시킵니다.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+def decode_time_id_cursor(cursor: str):
+    # (created_at, id) 형태의 커서
+    created_at, row_id = decode_cursor(cursor, 2)
+    if not isinstance(row_id, int):
+        raise ValueError("Invalid cursor")
+    try:
+        return datetime.fromisoformat(created_at), row_id
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+def decode_id_cursor(cursor: str) -> int:
+    # id 하나로 정렬하는 커서
+    (row_id,) = decode_cursor(cursor, 1)
+    if not isinstance(row_id, int):
+        raise ValueError("Invalid cursor")
+    return row_id
+
+def decode_score_id_cursor(cursor: str):
+    # (관련도 점수, id) 형태의 커서 (검색 결과)
+    score, row_id = decode_cursor(cursor, 2)
+    if not isinstance(score, (int, float)) or isinstance(score, bool) or not isinstance(row_id, int):
+        raise ValueError("Invalid cursor")
+    return float(score), row_id
@@ -1,90 +1,145 @@
 from fastapi import HTTPException, status, UploadFile
-from sqlalchemy.orm import Session
-from posts import posts_service
+from sqlalchemy.ext.asyncio import AsyncSession
+from posts import posts_service, posts_views, posts_search
 from schemas import PostCreate, PostUpdate
+from pagination import encode_cursor
+from etag import make_etag, etag_matches, latest, not_modified, conditional_json
+from uploads import save_image
+from thumbnails import thumbnail_url, schedule_variants, FEED_IMAGE_WIDTH, PROFILE_IMAGE_WIDTH
+from typing import Optional
 import os
-import shutil
-import uuid
 
 UPLOAD_DIR = "public/image/posts"
 
-def get_all_posts(page: int, size: int, db: Session):
-    posts = posts_service.get_all_posts(page, size, db)
+def post_summary(p) -> dict:
+    # 피드 / 검색 결과 목록의 게시글 항목
+    profile_image_url = p.user.profile_image_url if p.user else None
+    return {
+        "postId": p.id,
+        "title": p.title,
+        "content": p.detail,
+        "likeCount": p.like_count,
+        "commentCount": p.comment_count,
+        "hits": p.view_count,
+        "author": {
+            "userId": p.user_id,
+            "nickname": p.nickname,
+            "profileImageUrl": profile_image_url,
+            # 썸네일이 아직 없으면 원본 URL
+            "profileThumbnailUrl": thumbnail_url(profile_image_url, PROFILE_IMAGE_WIDTH)
+        },
+        "file": {
+            "fileId": 1, # 임시
+            "fileUrl": p.post_image_url,
+            "thumbnailUrl": thumbnail_url(p.post_image_url, FEED_IMAGE_WIDTH)
+        } if p.post_image_url else None,
+        "createdAt": p.created_at.isoformat() if p.created_at else ""
+    }
+
+async def get_all_posts(page: int, size: int, db: AsyncSession, cursor: Optional[tuple] = None):
+    if cursor is not None:
+        # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+        posts = await posts_service.get_posts_by_cursor(cursor, size + 1, db)
+        has_next = len(posts) > size
+        posts = posts[:size]
+    else:
+        posts = await posts_service.get_all_posts(page, size, db)
+        has_next = len(posts) == size
     
-    data = []
-    for p in posts:
-        like_count = posts_service.get_post_like_count(p.id, db)
-        view_count = posts_service.get_post_view_count(p.id, db)
-        comment_count = len(p.comments)
+    data = [post_summary(p) for p in posts]
 
-        data.append({
-            "postId": p.id,
-            "title": p.title,
-            "content": p.detail,
-            "likeCount": like_count,
-            "commentCount": comment_count,
-            "hits": view_count,
-            "author": {
-                "userId": p.user_id,
-                "nickname": p.nickname,
-                "profileImageUrl": p.user.profile_image_url if p.user else None
-            },
-            "file": {
-                "fileId": 1, # 임시
-                "fileUrl": p.post_image_url
-            } if p.post_image_url else None,
-            "createdAt": p.created_at.isoformat() if p.created_at else ""
-        })
+    # page 방식으로 조회한 경우에도 nextCursor를 내려주어 커서 방식으로 이어서 조회 가능
+    next_cursor = encode_cursor(posts[-1].created_at, posts[-1].id) if has_next and posts else None
 
     return {
         "code": "posts_retrieved",
-        "data": data
+        "data": data,
+        "nextCursor": next_cursor
     }
 
-async def get_post_detail(request, postId: int, db: Session, user: dict = None):
-    post = posts_service.get_post_detail(postId, db)
-    
-    if post is None:
+async def search_posts(q: str, size: int, db: AsyncSession, cursor: Optional[tuple] = None):
+    # 관련도 순 (score, id) keyset, 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    matches = await posts_search.search_post_ids(q, size + 1, db, cursor=cursor)
+    has_next = len(matches) > size
+    matches = matches[:size]
+
+    posts = await posts_service.get_posts_by_ids([post_id for post_id, _ in matches], db)
+    # 커서는 게시글 조회 결과와 관계없이 색인 결과의 마지막 항목 기준
+    next_cursor = encode_cursor(matches[-1][1], matches[-1][0]) if has_next else None
+
+    return {
+        "code": "posts_searched",
+        "data": [post_summary(p) for p in posts],
+        "nextCursor": next_cursor
+    }
+
+def post_etag(postId: int, updated_at, like_count: int, comment_count: int, view_count: int, author_updated_at, is_liked) -> str:
+    return make_etag("post", postId, updated_at, like_count, comment_count, view_count, author_updated_at, bool(is_liked))
+
+async def get_post_detail(request, postId: int, db: AsyncSession, user: dict = None):
+    # 본문/작성자를 읽기 전에 버전 값만 조회해 변경이 없으면 304
+    version = await posts_service.get_post_version(postId, user["id"] if user else None, db)
+
+    if version is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="POST_NOT_FOUND")
-    
+
     if user:
-         posts_service.increase_view_count(postId, user["id"], db)
+         await posts_views.record_view(postId, user["id"])
 
-    like_count = posts_service.get_post_like_count(postId, db)
-    view_count = posts_service.get_post_view_count(postId, db)
-    comment_count = len(post.comments)
-    is_liked = posts_service.is_liked_by_user(postId, user["id"], db) if user else False
+    etag = post_etag(
+        postId, version.updated_at, version.like_count, version.comment_count, version.view_count,
+        version.author_updated_at, version.is_liked
+    )
+    last_modified = latest(version.created_at, version.updated_at, version.author_updated_at)
+    if etag_matches(request, etag):
+        return not_modified(etag, last_modified)
 
-    return {
+    post = await posts_service.get_post_detail(postId, db)
+
+    if post is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="POST_NOT_FOUND")
+
+    # 응답 ETag는 본문과 같은 값(방금 기록한 조회수 반영)으로 다시 계산, 다음 폴링의 버전 값과 일치해 304
+    author_updated_at = post.user.updated_at if post.user else None
+    etag = post_etag(
+        postId, post.updated_at, post.like_count, post.comment_count, post.view_count,
+        author_updated_at, version.is_liked
+    )
+    last_modified = latest(post.created_at, post.updated_at, author_updated_at)
+
+    data = {
         "postId": post.id,
         "title": post.title,
         "content": post.detail,
-        "likeCount": like_count,
-        "commentCount": comment_count,
-        "hits": view_count,
+        "likeCount": post.like_count,
+        "commentCount": post.comment_count,
+        "hits": post.view_count,
         "author": {
             "userId": post.user_id,
             "nickname": post.nickname,
-            "profileImageUrl": post.user.profile_image_url if post.user else None
+            "profileImageUrl": post.user.profile_image_url if post.user else None,
+            "profileThumbnailUrl": thumbnail_url(post.user.profile_image_url if post.user else None, PROFILE_IMAGE_WIDTH)
         },
         "file": {
             "fileId": 1,
             "fileUrl": post.post_image_url
         } if post.post_image_url else None,
         "createdAt": post.created_at.isoformat() if post.created_at else "",
-        "likedBy": [l.user_id for l in post.likes] # 성능 주의
+        "isLiked": bool(version.is_liked)
     }
 
-def create_post(post_data: PostCreate, user: dict, db: Session):
-    new_post = posts_service.create_post(post_data, user["id"], db)
+    return conditional_json({"code": "post_retrieved", "data": data}, etag, last_modified)
+
+async def create_post(post_data: PostCreate, user: dict, db: AsyncSession):
+    new_post = await posts_service.create_post(post_data, user["id"], db)
     
     return {
         "code": "post_success",
         "data": {"postId": new_post.id}
     }
 
-def update_post(postId: int, post_data: PostUpdate, user: dict, db: Session):
-    post = posts_service.get_post_detail(postId, db)
+async def update_post(postId: int, post_data: PostUpdate, user: dict, db: AsyncSession):
+    post = await posts_service.get_post_detail(postId, db)
     
     if post is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="POST_NOT_FOUND")
@@ -92,15 +147,15 @@ def update_post(postId: int, post_data: PostUpdate, user: dict, db: Session):
     if post.user_id != user["id"]:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="FORBIDDEN")
     
-    posts_service.update_post(postId, post_data, db)
+    await posts_service.update_post(postId, post_data, db)
     
     return {
         "code": "POST_UPDATED",
         "data": None
     }
 
-def delete_post(postId: int, user: dict, db: Session):
-    post = posts_service.get_post_detail(postId, db)
+async def delete_post(postId: int, user: dict, db: AsyncSession):
+    post = await posts_service.get_post_detail(postId, db)
     
     if post is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="POST_NOT_FOUND")
@@ -108,23 +163,20 @@ def delete_post(postId: int, user: dict, db: Session):
     if post.user_id != user["id"]:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="FORBIDDEN")
     
-    posts_service.delete_post(postId, db)
+    await posts_service.delete_post(postId, db)
     
     return {
         "code": "POST_DELETED",
         "data": None
     }
 
-def like_post(postId: int, user: dict, db: Session):
-    post = posts_service.get_post_detail(postId, db)
-    if post is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="POST_NOT_FOUND")
-
-    success = posts_service.like_post(postId, user["id"], db)
-    if not success:
-         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="POST_ALREADY_LIKED")
-    
-    like_count = posts_service.get_post_like_count(postId, db)
+async def like_post(postId: int, user: dict, db: AsyncSession):
+    like_count = await posts_service.like_post(postId, user["id"], db)
+    if like_count is None:
+        # 추가된 행이 없는 경우에만 원인 확인 (게시글 없음 / 이미 좋아요)
+        if not await posts_service.post_exists(postId, db):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="POST_NOT_FOUND")
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="POST_ALREADY_LIKED")
     
     return {
         "code": "POST_LIKE_CREATED",
@@ -133,17 +185,13 @@ def like_post(postId: int, user: dict, db: Session):
         }
     }
 
-def unlike_post(postId: int, user: dict, db: Session):
-    post = posts_service.get_post_detail(postId, db)
-    if post is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="POST_NOT_FOUND")
-
-    success = posts_service.unlike_post(postId, user["id"], db)
-    if not success:
+async def unlike_post(postId: int, user: dict, db: AsyncSession):
+    like_count = await posts_service.unlike_post(postId, user["id"], db)
+    if like_count is None:
+        if not await posts_service.post_exists(postId, db):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="POST_NOT_FOUND")
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="POST_ALREADY_UNLIKED")
 
-    like_count = posts_service.get_post_like_count(postId, db)
-
     return {
         "code": "POST_LIKE_DELETED",
         "data": {
@@ -151,22 +199,46 @@ def unlike_post(postId: int, user: dict, db: Session):
         }
     }
 
-def upload_post_image(file: UploadFile):
-    if not os.path.exists(UPLOAD_DIR):
-        os.makedirs(UPLOAD_DIR)
-        
-    filename = file.filename
-    ext = filename.split(".")[-1].lower() if "." in filename else ""
-    if ext not in ["jpg", "jpeg", "png"]:
-         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="INVALID_FILE")
-    
-    saved_filename = f"{uuid.uuid4()}.{ext}"
-    file_path = os.path.join(UPLOAD_DIR, saved_filename)
-    
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+async def get_post_likers(postId: int, cursor: Optional[int], limit: int, db: AsyncSession):
+    if not await posts_service.post_exists(postId, db):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="POST_NOT_FOUND")
+
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    rows = await posts_service.get_post_likers(postId, cursor, limit + 1, db)
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    data = []
+    for like, liker in rows:
+        data.append({
+            "userId": liker.id,
+            "nickname": liker.nickname,
+            "profileImageUrl": liker.profile_image_url,
+            "likedAt": like.created_at.isoformat() if like.created_at else ""
+        })
+
+    return {
+        "code": "POST_LIKES_RETRIEVED",
+        "data": data,
+        "nextCursor": encode_cursor(rows[-1][0].id) if has_next else None
+    }
+
+async def get_my_liked_posts(post_ids: list, user: dict, db: AsyncSession):
+    liked = await posts_service.get_liked_post_ids(post_ids, user["id"], db) if post_ids else []
+
+    return {
+        "code": "LIKED_POSTS_RETRIEVED",
+        "data": {
+            "postIds": liked
+        }
+    }
+
+async def upload_post_image(file: UploadFile):
+    # 내용 해시 경로라 같은 이미지는 같은 URL, 변경되지 않는 URL이므로 브라우저 캐시 충돌 없음
+    saved_path = await save_image(file, UPLOAD_DIR)
+    schedule_variants(os.path.join(UPLOAD_DIR, saved_path))
         
-    post_file_url = f"/public/image/posts/{saved_filename}"
+    post_file_url = f"/public/image/posts/{saved_path}"
     
     return {
         "code": "POST_FILE_UPLOADED",
@@ -0,0 +1,65 @@
+"""
+게시글 비정규화 카운터(like_count, view_count, comment_count) 백필 / 정합성 복구 커맨드
+
+likes, views, comments 테이블을 기준으로 posts의 카운터를 배치 단위로 다시 계산합니다.
+VIEW_COUNT_BACKEND=hll이면 views 행이 더 쌓이지 않으므로 view_count는 post_view_sketches의 추정값으로 계산합니다.
+컬럼이 없는 기존 DB라면 마이그레이션(카운터 컬럼 추가)을 먼저 적용합니다.
+
+사용법: python -m posts.posts_counters [--batch-size 500]
+"""
+import argparse
+
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session
+
+from config import VIEW_COUNT_BACKEND
+from database import engine, SessionLocal
+from models import Post, Like, View, Comment
+from migrations import upgrade
+from posts.posts_hll import sync_view_counts
+
+def reconcile_post_counters(db: Session, batch_size: int = 500, view_backend: str = VIEW_COUNT_BACKEND) -> int:
+    like_count = select(func.count(Like.id)).where(Like.post_id == Post.id).scalar_subquery()
+    view_count = select(func.count(View.id)).where(View.post_id == Post.id).scalar_subquery()
+    comment_count = select(func.count(Comment.id)).where(Comment.post_id == Post.id).scalar_subquery()
+
+    last_id = 0
+    total = 0
+    while True:
+        ids = [row.id for row in db.query(Post.id).filter(Post.id > last_id).order_by(Post.id).limit(batch_size)]
+        if not ids:
+            break
+
+        values = {
+            Post.like_count: like_count,
+            Post.comment_count: comment_count,
+            Post.updated_at: Post.updated_at,
+        }
+        if view_backend != "hll":
+            values[Post.view_count] = view_count
+
+        # 배치마다 커밋하여 락 점유 시간을 짧게 유지
+        db.query(Post).filter(Post.id.in_(ids)).update(values, synchronize_session=False)
+        if view_backend == "hll":
+            sync_view_counts(ids, db)
+        db.commit()
+
+        last_id = ids[-1]
+        total += len(ids)
+
+    return total
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recompute post like/view/comment counters")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    upgrade(engine)
+
+    db = SessionLocal()
+    try:
+        count = reconcile_post_counters(db, args.batch_size)
+    finally:
+        db.close()
+
+    print(f"reconciled {count} posts")
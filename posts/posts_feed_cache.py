@@ -0,0 +1,178 @@
+"""
+피드 페이지 응답 캐시
+
+GET /v1/posts 응답은 요청한 사용자와 무관하므로 (page 또는 cursor, size) 기준으로
+직렬화된 JSON을 짧은 TTL(FEED_CACHE_TTL) 동안 캐시합니다.
+
+- 게시글 작성/수정/삭제, 좋아요, 댓글 작성/삭제 시 invalidate()로 세대(generation)를 올려 모든 페이지를 무효화
+  (새 글 하나로 모든 페이지의 경계가 밀리므로 키 단위 무효화는 하지 않음)
+- 같은 키의 캐시 미스가 동시에 몰리면 한 요청만 DB에서 만들고 나머지는 그 결과를 기다림 (stampede 방지)
+- 저장소: memory(워커 프로세스별, 기본) / redis(워커 간 공유, FEED_CACHE_REDIS_URL, redis 패키지 필요)
+  memory 저장소에서 다른 워커의 캐시는 무효화되지 않으므로 TTL이 지나야 갱신됨
+"""
+import asyncio
+import logging
+import threading
+from typing import Awaitable, Callable, Optional
+
+from cache import TTLCache
+from config import (
+    FEED_CACHE_ENABLED, FEED_CACHE_BACKEND, FEED_CACHE_TTL, FEED_CACHE_MAX_SIZE, FEED_CACHE_REDIS_URL,
+)
+
+logger = logging.getLogger(__name__)
+
+class MemoryFeedCacheBackend:
+    def __init__(self, max_size: int, ttl: float):
+        self._cache = TTLCache(max_size=max_size, ttl=ttl)
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    async def generation(self) -> int:
+        return self._generation
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes):
+        self._cache.set(key, value)
+
+    async def invalidate(self):
+        # 이전 세대 키는 더 이상 조회되지 않으므로 바로 비워 메모리 반환
+        with self._lock:
+            self._generation += 1
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        stats = self._cache.stats()
+        return {
+            "backend": "memory",
+            "generation": self._generation,
+            "size": stats["size"],
+            "maxSize": stats["maxSize"],
+            "ttl": stats["ttl"],
+            "evictions": stats["evictions"],
+        }
+
+class RedisFeedCacheBackend:
+    GENERATION_KEY = "feed:generation"
+
+    def __init__(self, url: str, ttl: float):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("FEED_CACHE_BACKEND=redis requires the redis package") from e
+
+        self._client = redis.from_url(url)
+        self.ttl = ttl
+
+    async def generation(self) -> int:
+        return int(await self._client.get(self.GENERATION_KEY) or 0)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(f"feed:{key}")
+
+    async def set(self, key: str, value: bytes):
+        await self._client.set(f"feed:{key}", value, px=int(self.ttl * 1000))
+
+    async def invalidate(self):
+        # 이전 세대 키는 TTL이 지나면 redis에서 만료됨
+        await self._client.incr(self.GENERATION_KEY)
+
+    def stats(self) -> dict:
+        return {"backend": "redis", "ttl": self.ttl}
+
+class FeedCache:
+    def __init__(self, backend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0  # 진행 중인 조회 결과를 기다린 요청 수
+        self.invalidations = 0
+
+        self._inflight = {}  # key -> asyncio.Future
+
+    @staticmethod
+    def page_key(page: int, size: int, cursor: Optional[str] = None) -> str:
+        return f"c:{cursor}:{size}" if cursor else f"p:{page}:{size}"
+
+    async def get_or_load(self, page_key: str, loader: Callable[[], Awaitable[bytes]]) -> bytes:
+        if not self.enabled:
+            return await loader()
+
+        try:
+            key = f"{await self.backend.generation()}:{page_key}"
+            value = await self.backend.get(key)
+        except Exception:
+            # 공유 저장소 장애 시 캐시 없이 응답
+            logger.warning("feed cache backend is unavailable", exc_info=True)
+            return await loader()
+
+        if value is not None:
+            self.hits += 1
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # 먼저 조회하던 요청이 취소된 경우(클라이언트 연결 종료 등) 직접 조회
+                return await loader()
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # 기다리는 요청이 없어도 "never retrieved" 경고가 나지 않도록
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            del self._inflight[key]
+
+        # 조회 중에 무효화되었다면 키의 세대가 달라 이후 요청에서는 읽히지 않음
+        try:
+            await self.backend.set(key, value)
+        except Exception:
+            logger.warning("failed to store feed page in cache", exc_info=True)
+        return value
+
+    async def invalidate(self):
+        if not self.enabled:
+            return
+        self.invalidations += 1
+        try:
+            await self.backend.invalidate()
+        except Exception:
+            logger.warning("failed to invalidate feed cache", exc_info=True)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "invalidations": self.invalidations,
+            "hitRate": self.hits / total if total else 0.0,
+            "store": self.backend.stats(),
+        }
+
+def create_backend():
+    if FEED_CACHE_BACKEND == "redis":
+        return RedisFeedCacheBackend(FEED_CACHE_REDIS_URL, FEED_CACHE_TTL)
+    return MemoryFeedCacheBackend(FEED_CACHE_MAX_SIZE, FEED_CACHE_TTL)
+
+feed_cache = FeedCache(create_backend(), enabled=FEED_CACHE_ENABLED)
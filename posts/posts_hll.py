@@ -0,0 +1,187 @@
+"""
+HyperLogLog 기반 근사 고유 조회수 집계 (VIEW_COUNT_BACKEND=hll)
+
+views 테이블에 (post, user) 행을 계속 쌓는 대신 게시글마다 고정 크기 sketch 하나만 유지합니다.
+sketch는 post_view_sketches에 압축 blob으로 저장하고, 추정값은 posts.view_count에 반영하므로
+피드/상세의 hits 조회 경로는 그대로입니다.
+
+기존 views 행으로부터 sketch 재구성: python -m posts.posts_hll rebuild [--batch-size 500]
+"""
+import argparse
+import hashlib
+import math
+import zlib
+
+from sqlalchemy.orm import Session
+
+from config import VIEW_HLL_ERROR
+from database import SessionLocal
+from models import Post, PostViewSketch, View
+
+MIN_PRECISION = 4
+MAX_PRECISION = 14
+
+def precision_for_error(error: float) -> int:
+    # 표준 오차 ≈ 1.04 / sqrt(m), m = 2^p
+    p = math.ceil(math.log2((1.04 / error) ** 2))
+    return max(MIN_PRECISION, min(MAX_PRECISION, p))
+
+class HyperLogLog:
+    def __init__(self, precision: int, registers: bytes = None):
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = bytearray(registers) if registers is not None else bytearray(self.m)
+
+    @classmethod
+    def from_error(cls, error: float):
+        return cls(precision_for_error(error))
+
+    def add(self, value) -> bool:
+        x = int.from_bytes(hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest(), "big")
+        index = x >> (64 - self.precision)
+        rest = x & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - rest.bit_length() + 1
+
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+            return True
+        return False
+
+    def merge(self, other: "HyperLogLog"):
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches with different precision")
+        self.registers = bytearray(max(a, b) for a, b in zip(self.registers, other.registers))
+
+    def fold(self, precision: int) -> "HyperLogLog":
+        """
+더 낮은 정밀도의 sketch로 변환합니다. 같은 값들을 처음부터 그 정밀도로 추가한 것과 같은 레지스터가 됩니다.
+(인덱스에서 빠지는 하위 비트가 나머지 비트의 앞쪽이 되므로 rank를 다시 계산, 높은 정밀도로는 변환할 수 없음)
+        """
+        if precision > self.precision:
+            raise ValueError("Cannot fold a sketch into a higher precision")
+        if precision == self.precision:
+            return self
+
+        shift = self.precision - precision
+        folded = HyperLogLog(precision)
+        for index, rank in enumerate(self.registers):
+            if rank == 0:
+                continue
+            dropped = index & ((1 << shift) - 1)
+            new_rank = shift - dropped.bit_length() + 1 if dropped else shift + rank
+            new_index = index >> shift
+            if new_rank > folded.registers[new_index]:
+                folded.registers[new_index] = new_rank
+        return folded
+
+    def count(self) -> int:
+        m = self.m
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+
+        # 작은 범위 보정 (linear counting), 64비트 해시라 큰 범위 보정은 불필요
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+    def to_bytes(self) -> bytes:
+        # 조회자가 적은 게시글은 대부분 0 레지스터라 압축 효과가 큼
+        return zlib.compress(bytes(self.registers))
+
+    @classmethod
+    def from_bytes(cls, precision: int, data: bytes):
+        return cls(precision, zlib.decompress(data))
+
+
+def _load_sketches(post_ids, db: Session) -> dict:
+    # 여러 워커가 같은 게시글을 동시에 갱신해도 유실이 없도록 행 잠금 후 병합
+    rows = db.query(PostViewSketch).filter(PostViewSketch.post_id.in_(post_ids)).with_for_update().all()
+    return {row.post_id: row for row in rows}
+
+def _save_sketch(post_id: int, sketch: HyperLogLog, rows: dict, db: Session):
+    row = rows.get(post_id)
+    if row is None:
+        db.add(PostViewSketch(post_id=post_id, precision=sketch.precision, registers=sketch.to_bytes()))
+    else:
+        row.precision = sketch.precision
+        row.registers = sketch.to_bytes()
+
+    db.query(Post).filter(Post.id == post_id).update(
+        {Post.view_count: sketch.count(), Post.updated_at: Post.updated_at},
+        synchronize_session=False
+    )
+
+def _merge_into_stored(sketches: dict, db: Session):
+    rows = _load_sketches(list(sketches), db)
+    for post_id, sketch in sketches.items():
+        row = rows.get(post_id)
+        if row is not None:
+            stored = HyperLogLog.from_bytes(row.precision, row.registers)
+            # VIEW_HLL_ERROR가 바뀌어 정밀도가 다르면 낮은 쪽으로 접어서 병합 (저장된 조회자를 버리지 않음)
+            # 더 높은 정밀도는 views 행이 남아 있을 때 rebuild로만 적용됨
+            precision = min(stored.precision, sketch.precision)
+            sketch = sketch.fold(precision)
+            sketch.merge(stored.fold(precision))
+        _save_sketch(post_id, sketch, rows, db)
+
+def sync_view_counts(post_ids, db: Session) -> int:
+    # 저장된 sketch의 추정값을 posts.view_count에 다시 반영 (카운터 정합성 복구용, sketch가 없는 게시글은 그대로)
+    rows = db.query(PostViewSketch).filter(PostViewSketch.post_id.in_(post_ids)).all()
+    for row in rows:
+        db.query(Post).filter(Post.id == row.post_id).update(
+            {Post.view_count: HyperLogLog.from_bytes(row.precision, row.registers).count(), Post.updated_at: Post.updated_at},
+            synchronize_session=False
+        )
+    return len(rows)
+
+def record_views(view_keys, db: Session):
+    # view_keys: (post_id, user_id) 목록
+    sketches = {}
+    for post_id, user_id in view_keys:
+        if post_id not in sketches:
+            sketches[post_id] = HyperLogLog.from_error(VIEW_HLL_ERROR)
+        sketches[post_id].add(user_id)
+
+    if not sketches:
+        return
+
+    _merge_into_stored(sketches, db)
+    db.commit()
+
+def rebuild_from_views(db: Session, batch_size: int = 500) -> int:
+    last_id = 0
+    total = 0
+    while True:
+        ids = [row.id for row in db.query(Post.id).filter(Post.id > last_id).order_by(Post.id).limit(batch_size)]
+        if not ids:
+            break
+
+        sketches = {}
+        for post_id, user_id in db.query(View.post_id, View.user_id).filter(View.post_id.in_(ids)):
+            if post_id not in sketches:
+                sketches[post_id] = HyperLogLog.from_error(VIEW_HLL_ERROR)
+            sketches[post_id].add(user_id)
+
+        if sketches:
+            _merge_into_stored(sketches, db)
+        db.commit()
+
+        last_id = ids[-1]
+        total += len(sketches)
+
+    return total
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HyperLogLog view sketch tools")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        count = rebuild_from_views(db, args.batch_size)
+    finally:
+        db.close()
+
+    print(f"rebuilt sketches for {count} posts")
@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Query, Request, Depends, UploadFile, File
 from fastapi.exceptions import RequestValidationError
-from sqlalchemy.orm import Session
-from database import get_db
-from schemas import PostCreate, PostUpdate
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db, get_read_db, read_session
+from schemas import PostCreate, PostUpdate, PostListResponse, PostDetailResponse
 from posts import posts_controller
+from posts.posts_feed_cache import feed_cache
 from auth.auth_dependencies import get_current_user
+from pagination import decode_time_id_cursor, decode_id_cursor, decode_score_id_cursor
 from typing import Optional
 
 router = APIRouter(
@@ -12,52 +15,125 @@ router = APIRouter(
     tags=["posts"]
 )
 
-@router.get("")
-async def get_posts(request: Request, page: int = Query(1), size: int = Query(10), db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
+@router.get("", response_model=PostListResponse)
+async def get_posts(request: Request, page: int = Query(1), size: int = Query(10), cursor: Optional[str] = Query(None), user: dict = Depends(get_current_user)):
     if page <= 0 or size <= 0:
         # 수동으로 유효성 검사 에러 발생
         raise RequestValidationError(
             [{"loc": ["query", "page"], "msg": "Page and size must be greater than 0", "type": "value_error.number.not_gt"}]
         )
 
-    result = posts_controller.get_all_posts(page, size, db)
-    return result
+    # cursor가 있으면 page는 무시하고 keyset 방식으로 조회
+    decoded_cursor = None
+    if cursor:
+        try:
+            decoded_cursor = decode_time_id_cursor(cursor)
+        except ValueError:
+            raise RequestValidationError(
+                [{"loc": ["query", "cursor"], "msg": "Invalid cursor", "type": "value_error"}]
+            )
 
-@router.get("/{postId}")
+    # 피드는 사용자와 무관하므로 직렬화된 응답을 캐시, 캐시 히트 시에는 DB 세션을 열지 않음
+    async def load_page() -> bytes:
+        async with read_session(request) as db:
+            result = await posts_controller.get_all_posts(page, size, db, cursor=decoded_cursor)
+        return ORJSONResponse(result).body
+
+    body = await feed_cache.get_or_load(feed_cache.page_key(page, size, cursor), load_page)
+    return Response(content=body, media_type="application/json")
+
+# /{postId}보다 먼저 등록해야 "search"가 postId로 해석되지 않음
+@router.get("/search", response_model=PostListResponse)
+async def search_posts(
+    q: str = Query(..., max_length=100),
+    size: int = Query(10, gt=0, le=50),
+    cursor: Optional[str] = Query(None),
+    user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    if not q.strip():
+        raise RequestValidationError(
+            [{"loc": ["query", "q"], "msg": "Search query must not be empty", "type": "value_error"}]
+        )
+
+    decoded_cursor = None
+    if cursor:
+        try:
+            decoded_cursor = decode_score_id_cursor(cursor)
+        except ValueError:
+            raise RequestValidationError(
+                [{"loc": ["query", "cursor"], "msg": "Invalid cursor", "type": "value_error"}]
+            )
+
+    return await posts_controller.search_posts(q, size, db, cursor=decoded_cursor)
+
+@router.get("/{postId}", response_model=PostDetailResponse)
 async def get_post_detail(
     request: Request, 
     postId: int, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user: dict = Depends(get_current_user)
 ):
-    post = await posts_controller.get_post_detail(request, postId, db, user=user)
-    
-    return {
-        "code": "post_retrieved",
-        "data": post
-    }
+    # ETag / If-None-Match 처리를 위해 controller가 응답 객체(200 또는 304)를 반환
+    return await posts_controller.get_post_detail(request, postId, db, user=user)
 
 @router.post("", status_code=201)
-async def create_post(post_data: PostCreate, user: dict = Depends(get_current_user), db: Session = Depends(get_db)):
-    return posts_controller.create_post(post_data, user, db)
+async def create_post(post_data: PostCreate, user: dict = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
+    return await posts_controller.create_post(post_data, user, db)
 
 @router.patch("/{postId}")
-async def update_post(postId: int, post_data: PostUpdate, user: dict = Depends(get_current_user), db: Session = Depends(get_db)):
-    return posts_controller.update_post(postId, post_data, user, db)
+async def update_post(postId: int, post_data: PostUpdate, user: dict = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
+    return await posts_controller.update_post(postId, post_data, user, db)
 
 @router.delete("/{postId}")
-async def delete_post(postId: int, user: dict = Depends(get_current_user), db: Session = Depends(get_db)):
-    return posts_controller.delete_post(postId, user, db)
+async def delete_post(postId: int, user: dict = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
+    return await posts_controller.delete_post(postId, user, db)
 
 @router.post("/image", status_code=201)
-def upload_post_image(postFile: UploadFile = File(...), user: dict = Depends(get_current_user)):
+async def upload_post_image(postFile: UploadFile = File(...), user: dict = Depends(get_current_user)):
     # Image upload doesn't need DB
-    return posts_controller.upload_post_image(postFile)
+    return await posts_controller.upload_post_image(postFile)
+
+# 피드 한 페이지의 게시글 중 내가 좋아요한 게시글 id 목록 (postIds=1,2,3)
+@router.get("/likes/me")
+async def get_my_liked_posts(postIds: str = Query(""), user: dict = Depends(get_current_user), db: AsyncSession = Depends(get_read_db)):
+    try:
+        post_ids = [int(v) for v in postIds.split(",") if v.strip()]
+    except ValueError:
+        raise RequestValidationError(
+            [{"loc": ["query", "postIds"], "msg": "postIds must be comma separated integers", "type": "value_error"}]
+        )
+
+    if len(post_ids) > 100:
+        raise RequestValidationError(
+            [{"loc": ["query", "postIds"], "msg": "At most 100 postIds are allowed", "type": "value_error"}]
+        )
+
+    return await posts_controller.get_my_liked_posts(post_ids, user, db)
+
+@router.get("/{postId}/likes")
+async def get_post_likers(
+    postId: int,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    decoded_cursor = None
+    if cursor:
+        try:
+            decoded_cursor = decode_id_cursor(cursor)
+        except ValueError:
+            raise RequestValidationError(
+                [{"loc": ["query", "cursor"], "msg": "Invalid cursor", "type": "value_error"}]
+            )
+
+    return await posts_controller.get_post_likers(postId, decoded_cursor, limit, db)
 
 @router.post("/{postId}/likes", status_code=201)
-async def like_post(postId: int, user: dict = Depends(get_current_user), db: Session = Depends(get_db)):
-    return posts_controller.like_post(postId, user, db)
+async def like_post(postId: int, user: dict = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
+    return await posts_controller.like_post(postId, user, db)
 
 @router.delete("/{postId}/likes")
-async def unlike_post(postId: int, user: dict = Depends(get_current_user), db: Session = Depends(get_db)):
-    return posts_controller.unlike_post(postId, user, db)
\ No newline at end of file
+async def unlike_post(postId: int, user: dict = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
+    return await posts_controller.unlike_post(postId, user, db)
\ No newline at end of file
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional
 
 class PostCreate(BaseModel):
     nickname: str
@@ -22,4 +22,4 @@ class Post(BaseModel):
     author: dict
     file: Optional[dict] = None
     createdAt: str
-    likedBy: List[int] = []
+    isLiked: bool = False
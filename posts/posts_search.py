@@ -0,0 +1,168 @@
+"""
+게시글 전문 검색 (제목 + 본문)
+
+LIKE '%검색어%'는 인덱스를 쓰지 못해 전체 테이블을 읽으므로, DB의 역색인을 사용합니다.
+한국어는 조사가 단어에 붙어 있어(서버를, 서버에서) 공백 단위 토큰으로는 찾기 어려우므로 2-gram 단위로 색인합니다.
+
+- MySQL: posts(title, detail)에 FULLTEXT 인덱스(WITH PARSER ngram, 기본 ngram_token_size=2)
+  InnoDB가 게시글 INSERT / UPDATE / DELETE 커밋 시 색인을 함께 갱신
+- SQLite(테스트 / 로컬): FTS5 가상 테이블 posts_search에 2-gram으로 나눈 제목 / 본문을 저장
+  posts_service의 작성 / 수정 / 삭제와 같은 트랜잭션에서 index_post / unindex_post로 동기화
+
+관련도(MySQL MATCH 점수, SQLite bm25 부호 반전) 내림차순, 같으면 id 내림차순으로 정렬하고
+(score, id) 커서로 다음 페이지를 조회합니다. 1글자 검색어는 색인 단위보다 짧아 무시합니다.
+
+색인 재생성: python -m posts.posts_search rebuild [--batch-size 500]
+"""
+import argparse
+import re
+from typing import List, Optional, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from database import engine, SessionLocal
+from models import Post
+
+NGRAM_SIZE = 2
+FULLTEXT_INDEX = "ft_posts_title_detail"
+FTS_TABLE = "posts_search"
+# SQLite bm25 가중치: 제목 일치를 본문보다 높게
+TITLE_WEIGHT = 2.0
+DETAIL_WEIGHT = 1.0
+
+WORD = re.compile(r"\w+")
+
+def _dialect(db=None) -> str:
+    # 세션이 연결된 DB 기준 (복제본도 같은 종류의 DB를 사용)
+    bind = db.bind if db is not None and db.bind is not None else engine
+    return bind.dialect.name
+
+def ngrams(value: Optional[str]) -> str:
+    # "서버를 배포" -> "서버 버를 배포" (단어 경계를 넘는 조합은 만들지 않음)
+    grams = []
+    for word in WORD.findall((value or "").lower()):
+        if len(word) <= NGRAM_SIZE:
+            grams.append(word)
+        else:
+            grams.extend(word[i:i + NGRAM_SIZE] for i in range(len(word) - NGRAM_SIZE + 1))
+    return " ".join(grams)
+
+def search_terms(query: str) -> List[str]:
+    return [word for word in WORD.findall(query.lower()) if len(word) >= NGRAM_SIZE]
+
+def _match_expression(terms: List[str], dialect: str) -> str:
+    # 모든 검색어를 포함(AND), 검색어 하나는 연속된 n-gram 구(phrase)
+    # \w 문자만 남기므로 따옴표 / 연산자 이스케이프가 필요 없음
+    if dialect == "mysql":
+        return " ".join(f'+"{term}"' for term in terms)
+    return " AND ".join(f'"{ngrams(term)}"' for term in terms)
+
+
+def ensure_search_index(conn):
+    # create_all은 FULLTEXT 인덱스 / 가상 테이블을 만들지 않으므로 직접 생성 (migrations에서 호출)
+    if conn.dialect.name == "mysql":
+        indexes = {index["name"] for index in inspect(conn).get_indexes(Post.__tablename__)}
+        if FULLTEXT_INDEX not in indexes:
+            conn.execute(text(
+                f"ALTER TABLE {Post.__tablename__} ADD FULLTEXT INDEX {FULLTEXT_INDEX} (title, detail) WITH PARSER ngram"
+            ))
+    elif conn.dialect.name == "sqlite":
+        conn.execute(text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(title, detail, tokenize='unicode61')"
+        ))
+
+async def index_post(post: Post, db: AsyncSession):
+    # 게시글 작성 / 수정과 같은 트랜잭션에서 호출, commit은 호출한 쪽에서 (MySQL은 InnoDB가 갱신하므로 생략)
+    if _dialect(db) != "sqlite":
+        return
+    await db.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :id"), {"id": post.id})
+    await db.execute(
+        text(f"INSERT INTO {FTS_TABLE} (rowid, title, detail) VALUES (:id, :title, :detail)"),
+        {"id": post.id, "title": ngrams(post.title), "detail": ngrams(post.detail)}
+    )
+
+async def unindex_post(postId: int, db: AsyncSession):
+    if _dialect(db) != "sqlite":
+        return
+    await db.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :id"), {"id": postId})
+
+async def search_post_ids(
+    query: str, size: int, db: AsyncSession, cursor: Optional[Tuple[float, int]] = None
+) -> List[Tuple[int, float]]:
+    """
+검색어를 모두 포함하는 게시글의 (id, score)를 관련도 순으로 최대 size개 반환합니다.
+cursor: 이전 페이지 마지막 결과의 (score, id), None이면 첫 페이지
+    """
+    terms = search_terms(query)
+    if not terms:
+        return []
+
+    dialect = _dialect(db)
+    if dialect == "mysql":
+        matches = (
+            f"SELECT id, MATCH(title, detail) AGAINST (:match IN BOOLEAN MODE) AS score "
+            f"FROM {Post.__tablename__} WHERE MATCH(title, detail) AGAINST (:match IN BOOLEAN MODE)"
+        )
+    else:
+        matches = (
+            f"SELECT rowid AS id, -bm25({FTS_TABLE}, {TITLE_WEIGHT}, {DETAIL_WEIGHT}) AS score "
+            f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match"
+        )
+
+    params = {"match": _match_expression(terms, dialect), "size": size}
+    keyset = ""
+    if cursor is not None:
+        keyset = "WHERE score < :score OR (score = :score AND id < :id)"
+        params["score"], params["id"] = cursor
+
+    result = await db.execute(
+        text(f"SELECT id, score FROM ({matches}) AS matches {keyset} ORDER BY score DESC, id DESC LIMIT :size"),
+        params
+    )
+    return [(row.id, float(row.score)) for row in result]
+
+
+def rebuild_search_index(db: Session, batch_size: int = 500) -> int:
+    if _dialect() == "mysql":
+        # 인덱스를 다시 만들어 삭제된 문서 / 단편화 정리
+        with engine.begin() as conn:
+            conn.execute(text(f"ALTER TABLE {Post.__tablename__} DROP INDEX {FULLTEXT_INDEX}"))
+            ensure_search_index(conn)
+        return db.query(Post.id).count()
+
+    ensure_search_index(db.connection())
+    db.execute(text(f"DELETE FROM {FTS_TABLE}"))
+
+    last_id = 0
+    total = 0
+    while True:
+        posts = db.query(Post.id, Post.title, Post.detail).filter(Post.id > last_id).order_by(Post.id).limit(batch_size).all()
+        if not posts:
+            break
+
+        db.execute(
+            text(f"INSERT INTO {FTS_TABLE} (rowid, title, detail) VALUES (:id, :title, :detail)"),
+            [{"id": p.id, "title": ngrams(p.title), "detail": ngrams(p.detail)} for p in posts]
+        )
+        last_id = posts[-1].id
+        total += len(posts)
+
+    # 재생성 중에는 기존 색인이 그대로 보이도록 마지막에 한 번 커밋
+    db.commit()
+    return total
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the post full-text search index")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        count = rebuild_search_index(db, args.batch_size)
+    finally:
+        db.close()
+
+    print(f"indexed {count} posts")
@@ -1,83 +1,227 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from models import Post, Like, View, User
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, or_, and_, insert, select, update, delete, func, literal, exists
+from models import Post, Like, View, User, Comment, PostViewSketch
 from posts import posts_schemas
+from posts.posts_feed_cache import feed_cache
+from posts import posts_search
 from datetime import datetime
+from typing import Optional
 
-def get_all_posts(page: int, size: int, db: Session):
+async def get_all_posts(page: int, size: int, db: AsyncSession):
     offset = (page - 1) * size
-    posts = db.query(Post).order_by(desc(Post.created_at)).offset(offset).limit(size).all()
-    return posts
+    result = await db.execute(
+        select(Post).options(joinedload(Post.user)).order_by(desc(Post.created_at), desc(Post.id)).offset(offset).limit(size)
+    )
+    return result.scalars().all()
 
-def get_post_detail(postId: int, db: Session):
-    post = db.query(Post).filter(Post.id == postId).first()
-    return post
+async def get_posts_by_cursor(cursor: Optional[tuple], size: int, db: AsyncSession):
+    # cursor: 이전 페이지 마지막 게시글의 (created_at, id), None이면 첫 페이지
+    query = select(Post).options(joinedload(Post.user))
+    if cursor is not None:
+        created_at, post_id = cursor
+        query = query.where(or_(
+            Post.created_at < created_at,
+            and_(Post.created_at == created_at, Post.id < post_id)
+        ))
+    result = await db.execute(query.order_by(desc(Post.created_at), desc(Post.id)).limit(size))
+    return result.scalars().all()
 
-def increase_view_count(postId: int, user_id: int, db: Session):
+async def get_posts_by_ids(post_ids: list, db: AsyncSession):
+    # 검색 결과처럼 순서가 정해진 id 목록의 게시글을 같은 순서로 조회 (없어진 게시글은 제외)
+    if not post_ids:
+        return []
+    result = await db.execute(select(Post).options(joinedload(Post.user)).where(Post.id.in_(post_ids)))
+    posts = {p.id: p for p in result.scalars().all()}
+    return [posts[post_id] for post_id in post_ids if post_id in posts]
 
-    existing_view = db.query(View).filter(View.post_id == postId, View.user_id == user_id).first()
-    
-    if not existing_view:
-        new_view = View(post_id=postId, user_id=user_id)
-        db.add(new_view)
-        db.commit()
+async def get_post_detail(postId: int, db: AsyncSession):
+    # 비동기 세션에서는 lazy loading이 불가하므로 작성자를 함께 조회
+    result = await db.execute(select(Post).options(joinedload(Post.user)).where(Post.id == postId))
+    return result.scalar_one_or_none()
+
+async def get_post_version(postId: int, user_id: Optional[int], db: AsyncSession):
+    # 상세 조회 ETag 계산용 값만 PK 조회 한 번으로 (작성자 프로필 변경, 내 좋아요 여부 포함), 없으면 None
+    is_liked = exists().where(Like.post_id == Post.id, Like.user_id == user_id) if user_id else literal(False)
+    result = await db.execute(
+        select(
+            Post.created_at,
+            Post.updated_at,
+            Post.like_count,
+            Post.comment_count,
+            Post.view_count,
+            User.updated_at.label("author_updated_at"),
+            is_liked.label("is_liked"),
+        )
+        .outerjoin(User, User.id == Post.user_id)
+        .where(Post.id == postId)
+    )
+    return result.first()
+
+async def post_exists(postId: int, db: AsyncSession) -> bool:
+    # ORM 객체 전체를 읽지 않고 PK만 확인
+    result = await db.execute(select(Post.id).where(Post.id == postId))
+    return result.first() is not None
+
+async def increase_counter(postId: int, column, delta: int, db: AsyncSession):
+    # 카운터만 갱신하므로 updated_at(onupdate)은 건드리지 않음, commit은 호출한 쪽에서
+    await db.execute(
+        update(Post)
+        .where(Post.id == postId)
+        .values({column: column + delta, Post.updated_at: Post.updated_at})
+        .execution_options(synchronize_session=False)
+    )
 
-def get_post_view_count(postId: int, db: Session) -> int:
-    return db.query(View).filter(View.post_id == postId).count()
+def record_views(view_keys, db: Session):
+    # view_keys: (post_id, user_id) 목록, 이미 있는 조회 기록은 유니크 제약으로 무시하는 다중 행 INSERT
+    # 조회 기록 버퍼의 flush 스레드에서 동기 세션으로 호출
+    rows = [{"post_id": post_id, "user_id": user_id} for post_id, user_id in view_keys]
+    if not rows:
+        return
 
-def create_post(post_data: posts_schemas.PostCreate, user_id: int, db: Session):
+    stmt = insert(View).values(rows).prefix_with("IGNORE", dialect="mysql").prefix_with("OR IGNORE", dialect="sqlite")
+    db.execute(stmt)
+
+    # 실제로 추가된 행을 게시글별로 알 수 없으므로 대상 게시글의 카운터를 views 기준으로 다시 계산
+    post_ids = {post_id for post_id, _ in view_keys}
+    view_count = select(func.count(View.id)).where(View.post_id == Post.id).scalar_subquery()
+    db.query(Post).filter(Post.id.in_(post_ids)).update(
+        {Post.view_count: view_count, Post.updated_at: Post.updated_at},
+        synchronize_session=False
+    )
+    db.commit()
+
+async def create_post(post_data: posts_schemas.PostCreate, user_id: int, db: AsyncSession):
     new_post = Post(
         user_id=user_id,
         title=post_data.title,
         detail=post_data.content,
-        nickname=post_data.nickname, 
+        nickname=post_data.nickname,
         post_image_url=post_data.image
     )
     db.add(new_post)
-    db.commit()
-    db.refresh(new_post)
+    # 검색 색인에 id가 필요하므로 먼저 flush, 게시글과 색인은 같은 트랜잭션으로 커밋
+    await db.flush()
+    await posts_search.index_post(new_post, db)
+    await db.commit()
+    await db.refresh(new_post)
+    await feed_cache.invalidate()
     return new_post
 
-def update_post(postId: int, post_data: posts_schemas.PostUpdate, db: Session):
-    post = db.query(Post).filter(Post.id == postId).first()
+async def update_post(postId: int, post_data: posts_schemas.PostUpdate, db: AsyncSession):
+    result = await db.execute(select(Post).where(Post.id == postId))
+    post = result.scalar_one_or_none()
     if post:
         post.title = post_data.title
         post.detail = post_data.content
         if post_data.fileUrl is not None:
              post.post_image_url = post_data.fileUrl
-        db.commit()
-        db.refresh(post)
+        await posts_search.index_post(post, db)
+        await db.commit()
+        await db.refresh(post)
+        await feed_cache.invalidate()
     return post
 
-def delete_post(postId: int, db: Session):
-    post = db.query(Post).filter(Post.id == postId).first()
-    if post:
-        db.delete(post)
-        db.commit()
-    return post
+async def delete_post(postId: int, db: AsyncSession):
+    # ORM cascade는 하위 컬렉션을 모두 로드하므로, 하위 행을 DELETE 문으로 직접 지운 뒤 게시글 삭제
+    for model in (Comment, Like, View, PostViewSketch):
+        await db.execute(delete(model).where(model.post_id == postId).execution_options(synchronize_session=False))
+    result = await db.execute(delete(Post).where(Post.id == postId).execution_options(synchronize_session=False))
+    await posts_search.unindex_post(postId, db)
+    await db.commit()
+    await feed_cache.invalidate()
+    return result.rowcount > 0
 
-def like_post(postId: int, user_id: int, db: Session):
+async def delete_user_content(user_id: int, db: AsyncSession):
+    """
+탈퇴하는 사용자의 게시글(다른 사용자의 댓글 / 좋아요 / 조회 포함)과 다른 게시글에 남긴 댓글 / 좋아요 / 조회 기록을
+DELETE 문으로 지우고, 그 게시글들의 비정규화 카운터를 함께 갱신합니다. (users 행 삭제 전, 같은 트랜잭션에서 호출)
+    """
+    post_ids = (await db.execute(select(Post.id).where(Post.user_id == user_id))).scalars().all()
+    if post_ids:
+        for model in (Comment, Like, View, PostViewSketch):
+            await db.execute(delete(model).where(model.post_id.in_(post_ids)).execution_options(synchronize_session=False))
+        await db.execute(delete(Post).where(Post.id.in_(post_ids)).execution_options(synchronize_session=False))
+        for postId in post_ids:
+            await posts_search.unindex_post(postId, db)
 
-    existing_like = db.query(Like).filter(Like.post_id == postId, Like.user_id == user_id).first()
-    if existing_like:
-        return False
-    
-    new_like = Like(post_id=postId, user_id=user_id)
-    db.add(new_like)
-    db.commit()
-    return True
-
-def unlike_post(postId: int, user_id: int, db: Session):
-    existing_like = db.query(Like).filter(Like.post_id == postId, Like.user_id == user_id).first()
-    if not existing_like:
-        return False
-    
-    db.delete(existing_like)
-    db.commit()
-    return True
+    # 다른 게시글에 남긴 기록: 카운터를 먼저 줄이고(ix_likes_user_id / ix_views_user_id / ix_comments_user_id) 행 삭제
+    for model, column in ((Like, Post.like_count), (View, Post.view_count)):
+        await db.execute(
+            update(Post)
+            .where(Post.id.in_(select(model.post_id).where(model.user_id == user_id)))
+            .values({column: column - 1, Post.updated_at: Post.updated_at})
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(delete(model).where(model.user_id == user_id).execution_options(synchronize_session=False))
+
+    # 한 게시글에 댓글을 여러 개 남겼을 수 있으므로 게시글별 개수만큼 줄이고 댓글 목록 버전 갱신
+    user_comment_count = (
+        select(func.count(Comment.id))
+        .where(Comment.post_id == Post.id, Comment.user_id == user_id)
+        .scalar_subquery()
+    )
+    await db.execute(
+        update(Post)
+        .where(Post.id.in_(select(Comment.post_id).where(Comment.user_id == user_id)))
+        .values({
+            Post.comment_count: Post.comment_count - user_comment_count,
+            Post.comments_version: Post.comments_version + 1,
+            Post.comments_updated_at: func.now(),
+            Post.updated_at: Post.updated_at,
+        })
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(delete(Comment).where(Comment.user_id == user_id).execution_options(synchronize_session=False))
+
+async def like_post(postId: int, user_id: int, db: AsyncSession) -> Optional[int]:
+    # 게시글이 있을 때만 INSERT, 이미 좋아요한 경우는 유니크 제약(unique_post_user_like)으로 무시
+    # 추가된 행이 없으면 None (게시글 없음 또는 이미 좋아요), 있으면 같은 트랜잭션에서 갱신한 좋아요 수 반환
+    stmt = (
+        insert(Like)
+        .from_select(["post_id", "user_id"], select(literal(postId), literal(user_id)).where(Post.id == postId))
+        .prefix_with("IGNORE", dialect="mysql")
+        .prefix_with("OR IGNORE", dialect="sqlite")
+    )
+    if (await db.execute(stmt)).rowcount == 0:
+        await db.rollback()
+        return None
+
+    await increase_counter(postId, Post.like_count, 1, db)
+    like_count = await get_post_like_count(postId, db)
+    await db.commit()
+    await feed_cache.invalidate()
+    return like_count
+
+async def unlike_post(postId: int, user_id: int, db: AsyncSession) -> Optional[int]:
+    result = await db.execute(
+        delete(Like)
+        .where(Like.post_id == postId, Like.user_id == user_id)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        await db.rollback()
+        return None
+
+    await increase_counter(postId, Post.like_count, -1, db)
+    like_count = await get_post_like_count(postId, db)
+    await db.commit()
+    await feed_cache.invalidate()
+    return like_count
+
+async def get_post_like_count(postId: int, db: AsyncSession) -> int:
+    result = await db.execute(select(Post.like_count).where(Post.id == postId))
+    return result.scalar() or 0
 
-def get_post_like_count(postId: int, db: Session) -> int:
-    return db.query(Like).filter(Like.post_id == postId).count()
+async def get_post_likers(postId: int, cursor: Optional[int], limit: int, db: AsyncSession):
+    # 최근 좋아요 순, cursor: 이전 페이지 마지막 좋아요 id
+    query = select(Like, User).join(User, Like.user_id == User.id).where(Like.post_id == postId)
+    if cursor is not None:
+        query = query.where(Like.id < cursor)
+    result = await db.execute(query.order_by(desc(Like.id)).limit(limit))
+    return result.all()
 
-def is_liked_by_user(postId: int, user_id: int, db: Session) -> bool:
-    return db.query(Like).filter(Like.post_id == postId, Like.user_id == user_id).first() is not None
+async def get_liked_post_ids(post_ids: list, user_id: int, db: AsyncSession) -> list:
+    # 피드 한 페이지 분량의 게시글 중 사용자가 좋아요한 게시글 id (unique_post_user_like 인덱스 사용)
+    result = await db.execute(select(Like.post_id).where(Like.user_id == user_id, Like.post_id.in_(post_ids)))
+    return list(result.scalars().all())
@@ -0,0 +1,133 @@
+"""
+조회 기록 write-behind 버퍼
+
+게시글 상세 조회 때마다 views에 SELECT + INSERT + COMMIT 하지 않도록
+(post_id, user_id) 이벤트를 메모리에 모아 중복을 제거한 뒤,
+주기(VIEW_BUFFER_FLUSH_INTERVAL) 또는 개수(VIEW_BUFFER_FLUSH_SIZE) 기준으로 한 번에 기록합니다.
+버퍼가 가득 차면(VIEW_BUFFER_MAX_SIZE) 새 이벤트는 버리고 dropped 카운터만 올립니다.
+"""
+import logging
+import threading
+
+from sqlalchemy.orm import Session
+
+from config import VIEW_BUFFER_ENABLED, VIEW_BUFFER_FLUSH_INTERVAL, VIEW_BUFFER_FLUSH_SIZE, VIEW_BUFFER_MAX_SIZE, VIEW_COUNT_BACKEND
+from database import SessionLocal, AsyncSessionLocal
+from posts import posts_service, posts_hll
+
+logger = logging.getLogger(__name__)
+
+class ViewBuffer:
+    def __init__(self, flush_interval: float, flush_size: int, max_size: int, session_factory=SessionLocal):
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self.max_size = max_size
+        self.session_factory = session_factory
+
+        self.dropped = 0
+        self.flushed = 0
+
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def add(self, post_id: int, user_id: int) -> bool:
+        with self._lock:
+            key = (post_id, user_id)
+            if key in self._pending:
+                return True
+            if len(self._pending) >= self.max_size:
+                self.dropped += 1
+                return False
+
+            self._pending.add(key)
+            if len(self._pending) >= self.flush_size:
+                self._wakeup.set()
+        return True
+
+    def flush(self) -> int:
+        # 백그라운드 스레드와 종료 시 flush가 겹치지 않도록 직렬화
+        with self._flush_lock:
+            with self._lock:
+                batch = self._pending
+                self._pending = set()
+
+            if not batch:
+                return 0
+
+            db = self.session_factory()
+            try:
+                write_views(batch, db)
+            except Exception:
+                db.rollback()
+                logger.exception("failed to flush %d buffered views", len(batch))
+                self._requeue(batch)
+                return 0
+            finally:
+                db.close()
+
+            self.flushed += len(batch)
+            return len(batch)
+
+    def _requeue(self, batch):
+        # 다음 flush에서 재시도, 버퍼 한도를 넘는 만큼은 버림
+        with self._lock:
+            for key in batch:
+                if key in self._pending:
+                    continue
+                if len(self._pending) >= self.max_size:
+                    self.dropped += 1
+                    continue
+                self._pending.add(key)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="view-buffer-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        # graceful shutdown: 스레드를 멈춘 뒤 남은 이벤트를 모두 기록
+        if self._thread is not None:
+            self._stopped.set()
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def stats(self) -> dict:
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "enabled": VIEW_BUFFER_ENABLED,
+            "pending": pending,
+            "flushed": self.flushed,
+            "dropped": self.dropped,
+        }
+
+def write_views(view_keys, db: Session):
+    if VIEW_COUNT_BACKEND == "hll":
+        posts_hll.record_views(view_keys, db)
+    else:
+        posts_service.record_views(view_keys, db)
+
+view_buffer = ViewBuffer(VIEW_BUFFER_FLUSH_INTERVAL, VIEW_BUFFER_FLUSH_SIZE, VIEW_BUFFER_MAX_SIZE)
+
+async def record_view(postId: int, user_id: int):
+    if VIEW_BUFFER_ENABLED:
+        view_buffer.add(postId, user_id)
+    else:
+        # 버퍼를 끈 경우(테스트 등) 요청 안에서 바로 기록, 동기 기록 함수를 비동기 세션에서 실행
+        # 상세 조회는 읽기 세션(복제본일 수 있음)을 쓰므로 기록은 primary 세션을 따로 열어서
+        async with AsyncSessionLocal() as db:
+            await db.run_sync(lambda session: write_views([(postId, user_id)], session))
@@ -1,14 +1,19 @@
 from pydantic import BaseModel
 from typing import Optional, List
 
+# 응답 모델: 피드 / 상세 / 댓글 목록은 controller가 DB 값으로 직접 만든 dict를 그대로 직렬화하므로
+# 실행 시 검증은 생략하고(ORJSONResponse 직접 반환) OpenAPI 문서와 벤치마크용 스키마로 사용
 class Author(BaseModel):
     userId: int
     nickname: str
-    profileImageUrl: str
+    profileImageUrl: Optional[str] = None
+    # 썸네일이 아직 생성되지 않았으면 원본 URL
+    profileThumbnailUrl: Optional[str] = None
 
 class PostFile(BaseModel):
     fileId: int
     fileUrl: str
+    thumbnailUrl: Optional[str] = None
 
 class PostCreate(BaseModel):
     nickname: str
@@ -21,17 +26,28 @@ class PostUpdate(BaseModel):
     content: str
     fileUrl: Optional[str] = None
 
-class Post(BaseModel):
+class PostSummary(BaseModel):
     postId: int
     title: str
     content: str
     likeCount: int = 0
     commentCount: int = 0
     hits: int = 0
-    author: dict
-    file: Optional[dict] = None
+    author: Author
+    file: Optional[PostFile] = None
     createdAt: str
-    likedBy: List[int] = []
+
+class Post(PostSummary):
+    isLiked: bool = False
+
+class PostListResponse(BaseModel):
+    code: str
+    data: List[PostSummary]
+    nextCursor: Optional[str] = None
+
+class PostDetailResponse(BaseModel):
+    code: str
+    data: Post
 
 class CommentCreate(BaseModel):
     content: str
@@ -43,5 +59,10 @@ class Comment(BaseModel):
     commentId: int
     postId: int
     content: str
-    author: dict
-    createdAt: str
\ No newline at end of file
+    author: Author
+    createdAt: str
+
+class CommentListResponse(BaseModel):
+    code: str
+    data: List[Comment]
+    nextCursor: Optional[str] = None
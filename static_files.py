@@ -0,0 +1,144 @@
+"""
+/public 정적 파일 서빙
+
+StaticFiles(경로 검사, If-None-Match / If-Modified-Since -> 304)를 확장해
+- 내용 해시 경로(ab/cd/<sha256>.ext, 썸네일 <sha256>.w320.webp)는 내용이 바뀌지 않으므로 1년 immutable 캐시,
+  그 외 파일은 매번 재검증(no-cache)
+- Range 요청(단일 구간) -> 206 / 416
+- 서버가 ASGI zerocopy 확장을 지원하면 sendfile로, pathsend 확장을 지원하면 서버가 직접 파일 전송
+  (uvicorn은 둘 다 지원하지 않으므로 64KB 청크 읽기로 전송)
+- STATIC_ACCEL_REDIRECT_PREFIX를 설정하면 본문 대신 X-Accel-Redirect 헤더만 응답하여 nginx가 파일을 전송
+  예) location /_public/ { internal; alias /srv/app/public/; }  + STATIC_ACCEL_REDIRECT_PREFIX=/_public
+"""
+import os
+import re
+from typing import Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Receive, Scope, Send
+
+from config import STATIC_ACCEL_REDIRECT_PREFIX
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+# uploads.shard_path / thumbnails.variant_path 형식
+CONTENT_ADDRESSED_PATH = re.compile(r"(^|/)[0-9a-f]{2}/[0-9a-f]{2}/[0-9a-f]{64}(\.w\d+)?\.[a-z0-9]+$")
+
+def cache_control_for(relative_path: str) -> str:
+    if CONTENT_ADDRESSED_PATH.search(relative_path):
+        return IMMUTABLE_CACHE_CONTROL
+    return REVALIDATE_CACHE_CONTROL
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+Range 헤더(bytes=start-end / start- / -suffix)를 (start, end) 포함 구간으로 변환합니다.
+형식이 잘못되었거나 여러 구간이면 None(전체 응답), 만족할 수 없으면 ValueError.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+
+    start_text, separator, end_text = header[len("bytes="):].strip().partition("-")
+    if not separator or not (start_text or end_text):
+        return None
+    if (start_text and not start_text.isdigit()) or (end_text and not end_text.isdigit()):
+        return None
+
+    if start_text:
+        start = int(start_text)
+        end = int(end_text) if end_text else size - 1
+        if start >= size:
+            raise ValueError("range not satisfiable")
+        if end < start:
+            return None
+    else:
+        # 마지막 N바이트
+        suffix = int(end_text)
+        if suffix == 0:
+            raise ValueError("range not satisfiable")
+        if size == 0:
+            raise ValueError("range not satisfiable")
+        start = max(size - suffix, 0)
+        end = size - 1
+
+    return start, min(end, size - 1)
+
+
+class RangeFileResponse(FileResponse):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        size = self.stat_result.st_size
+        request_headers = Headers(scope=scope)
+
+        byte_range = None
+        if_range = request_headers.get("if-range")
+        # If-Range가 현재 ETag / Last-Modified와 다르면 (파일이 바뀜) 전체 응답
+        if if_range is None or if_range in (self.headers.get("etag"), self.headers.get("last-modified")):
+            try:
+                byte_range = parse_range(request_headers.get("range"), size)
+            except ValueError:
+                response = Response(status_code=416, headers={"content-range": f"bytes */{size}"})
+                await response(scope, receive, send)
+                return
+
+        start, end = byte_range if byte_range is not None else (0, size - 1)
+        if byte_range is not None:
+            self.status_code = 206
+            self.headers["content-range"] = f"bytes {start}-{end}/{size}"
+            self.headers["content-length"] = str(end - start + 1)
+
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+
+        extensions = scope.get("extensions") or {}
+        count = max(end - start + 1, 0)
+        if scope["method"].upper() == "HEAD" or count == 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        elif "http.response.zerocopy" in extensions:
+            with open(self.path, "rb") as file:
+                await send({
+                    "type": "http.response.zerocopy",
+                    "file": file,
+                    "offset": start,
+                    "count": count,
+                    "more_body": False,
+                })
+        elif "http.response.pathsend" in extensions and byte_range is None:
+            await send({"type": "http.response.pathsend", "path": str(self.path)})
+        else:
+            async with await anyio.open_file(self.path, mode="rb") as file:
+                await file.seek(start)
+                remaining = count
+                while remaining > 0:
+                    chunk = await file.read(min(self.chunk_size, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+                if remaining > 0:
+                    # 전송 중 파일이 줄어든 경우에도 응답은 종료
+                    await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+        if self.background is not None:
+            await self.background()
+
+
+class PublicFiles(StaticFiles):
+    def __init__(self, *args, accel_redirect_prefix: str = STATIC_ACCEL_REDIRECT_PREFIX, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.accel_redirect_prefix = accel_redirect_prefix.rstrip("/")
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope, status_code: int = 200) -> Response:
+        relative_path = os.path.relpath(full_path, self.directory).replace(os.sep, "/")
+        headers = {"cache-control": cache_control_for(relative_path), "accept-ranges": "bytes"}
+
+        if self.accel_redirect_prefix:
+            # 본문은 nginx가 internal location에서 전송 (Range / 조건부 요청 / sendfile 모두 nginx가 처리)
+            headers["x-accel-redirect"] = f"{self.accel_redirect_prefix}/{relative_path}"
+            return Response(status_code=status_code, headers=headers)
+
+        response = RangeFileResponse(full_path, status_code=status_code, headers=headers, stat_result=stat_result)
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
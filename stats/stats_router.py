@@ -0,0 +1,31 @@
+from fastapi import APIRouter, HTTPException, status
+
+from config import INTERNAL_STATS_ENABLED
+from database import pool_stats, replica_router
+from auth.auth_cache import identity_cache
+from auth.auth_availability import user_filter
+from posts.posts_views import view_buffer
+from posts.posts_feed_cache import feed_cache
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["internal"]
+)
+
+# 워커 프로세스별 내부 지표 (커넥션 풀 크기 조정, 캐시/버퍼 상태 확인용)
+@router.get("/stats")
+async def get_stats():
+    if not INTERNAL_STATS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="NOT_FOUND")
+
+    return {
+        "code": "STATS_RETRIEVED",
+        "data": {
+            "dbPool": pool_stats(),
+            "dbReplicas": replica_router.stats(),
+            "authCache": identity_cache.stats(),
+            "userFilter": user_filter.stats(),
+            "viewBuffer": view_buffer.stats(),
+            "feedCache": feed_cache.stats(),
+        }
+    }
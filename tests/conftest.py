@@ -0,0 +1,130 @@
+"""
+테스트 공통 설정
+
+앱 모듈(config / database)을 import 하기 전에 임시 작업 디렉터리(public/ 포함)와 SQLite DB를 환경 변수로 지정합니다.
+- database: 테스트 세션마다 한 번 마이그레이션 적용 + 시드 데이터(migrations.seed) + 카운터 계산
+- app: lifespan을 실행한 앱 (테스트 세션 동안 유지)
+- client / member / member_client: httpx 비동기 클라이언트, 새 사용자, 그 사용자로 로그인한 클라이언트
+- statement_budget: 블록 안에서 실행된 SQL 문 수가 상한을 넘으면 실패 (N+1 회귀 감지)
+SQLite 연결마다 외래 키 검사를 켜 MySQL(InnoDB)처럼 고아 행을 남기는 삭제가 실패하도록 합니다.
+"""
+import itertools
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+
+import httpx
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+WORK_DIR = tempfile.mkdtemp(prefix="community-test-")
+os.makedirs(os.path.join(WORK_DIR, "public"))
+os.environ.update({
+    "DATABASE_URL": f"sqlite:///{os.path.join(WORK_DIR, 'test.db')}",
+    "ASYNC_DATABASE_URL": "",
+    "DATABASE_REPLICA_URLS": "",
+    "DEBUG": "false",
+    "DB_MIGRATE_ON_STARTUP": "false",
+    # 요청 안에서 바로 기록 / 매 요청 DB 조회 (문장 수가 캐시 상태에 따라 달라지지 않도록)
+    "VIEW_BUFFER_ENABLED": "false",
+    "VIEW_COUNT_BACKEND": "exact",
+    "FEED_CACHE_ENABLED": "false",
+    "USER_FILTER_ENABLED": "false",
+    "THUMBNAIL_ENABLED": "false",
+    "BCRYPT_ROUNDS": "4",
+})
+
+@event.listens_for(Engine, "connect")
+def enable_foreign_keys(dbapi_connection, connection_record):
+    # SQLite는 기본으로 외래 키를 검사하지 않음 (테스트 DB는 모두 SQLite)
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+from auth.auth_cache import identity_cache  # noqa: E402
+from database import track_queries  # noqa: E402
+
+PASSWORD = "Password1!"
+_member_ids = itertools.count(1)
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+@pytest.fixture(scope="session")
+def database():
+    from database import engine
+    from database import SessionLocal
+    from migrations import upgrade, seed
+    from posts.posts_counters import reconcile_post_counters
+
+    upgrade(engine)
+    seed(engine)
+    # 시드는 행만 넣으므로 비정규화 카운터(like / view / comment_count) 계산
+    db = SessionLocal()
+    try:
+        reconcile_post_counters(db)
+    finally:
+        db.close()
+    yield engine
+    engine.dispose()
+    shutil.rmtree(WORK_DIR, ignore_errors=True)
+
+@pytest.fixture(scope="session")
+async def app(database):
+    # PublicFiles("public") / 업로드 저장 경로가 작업 디렉터리 기준
+    previous_dir = os.getcwd()
+    os.chdir(WORK_DIR)
+    try:
+        import main
+
+        async with main.app.router.lifespan_context(main.app):
+            yield main.app
+    finally:
+        os.chdir(previous_dir)
+
+@pytest.fixture
+async def client(app):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+@pytest.fixture
+def member(database) -> dict:
+    from auth.auth_utils import get_password_hash
+    from database import SessionLocal
+    from models import User
+
+    number = next(_member_ids)
+    db = SessionLocal()
+    try:
+        user = User(email=f"member{number}@example.com", password=get_password_hash(PASSWORD), nickname=f"member{number}")
+        db.add(user)
+        db.commit()
+        return {"id": user.id, "email": user.email, "nickname": user.nickname, "password": PASSWORD}
+    finally:
+        db.close()
+
+@pytest.fixture
+async def member_client(client, member):
+    response = await client.post("/v1/auth/login", json={"email": member["email"], "password": PASSWORD})
+    assert response.status_code == 200, response.text
+    return client
+
+@pytest.fixture
+def statement_budget():
+    """
+    with statement_budget(3): 블록 안에서 실행된 SQL 문이 3개를 넘으면 실패합니다.
+    요청은 같은 태스크(httpx.ASGITransport)에서 처리되므로 database.track_queries로 집계됩니다.
+    """
+    @contextmanager
+    def budget(limit: int):
+        # 로그인 사용자 조회가 항상 캐시 미스(최악의 경우)로 집계되도록
+        identity_cache.clear()
+        with track_queries() as stats:
+            yield stats
+        assert stats.statements <= limit, f"{stats.statements} SQL statements, budget is {limit}"
+
+    return budget
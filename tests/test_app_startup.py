@@ -0,0 +1,50 @@
+"""
+앱 import / lifespan (create_app)
+
+별도 프로세스에서 빈 SQLite DB를 가리키도록 하고 실행합니다.
+"""
+import os
+import sqlite3
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STARTUP = """
+import asyncio
+import httpx
+import main
+
+async def run():
+    async with main.app.router.lifespan_context(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            print((await client.get("/")).status_code)
+
+{body}
+"""
+
+def run_app(tmp_path, body: str) -> str:
+    os.makedirs(tmp_path / "public", exist_ok=True)
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{tmp_path / 'app.db'}", "PYTHONPATH": ROOT}
+    result = subprocess.run(
+        [sys.executable, "-c", STARTUP.format(body=body)], cwd=tmp_path, env=env, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+def table_names(path) -> list:
+    conn = sqlite3.connect(path)
+    try:
+        return [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+    finally:
+        conn.close()
+
+def test_import_does_not_touch_database(tmp_path):
+    run_app(tmp_path, "")
+    assert not (tmp_path / "app.db").exists() or table_names(tmp_path / "app.db") == []
+
+def test_lifespan_starts_without_schema(tmp_path):
+    # 스키마가 없으면 조회문 예열만 실패(경고)하고 워커는 시작
+    assert run_app(tmp_path, "asyncio.run(run())").strip() == "200"
+    assert table_names(tmp_path / "app.db") == []
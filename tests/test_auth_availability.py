@@ -0,0 +1,62 @@
+"""
+이메일 / 닉네임 사용 가능 여부 Bloom filter 갱신 (다른 워커의 가입 / 닉네임 변경)
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from auth.auth_availability import UserAvailabilityFilter
+from models import User
+
+@pytest.fixture
+def db(database):
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+@pytest.fixture
+def user_filter(db) -> UserAvailabilityFilter:
+    user_filter = UserAvailabilityFilter(0.01, refresh_interval=0, rebuild_interval=600, session_factory=None)
+    user_filter.rebuild(db)
+    return user_filter
+
+def test_refresh_picks_up_nickname_change_from_other_worker(db, member, user_filter):
+    assert not user_filter.might_contain_nickname("renamed1")
+
+    user = db.get(User, member["id"])
+    user.nickname = "renamed1"
+    db.commit()
+    user_filter.refresh(db)
+
+    assert user_filter.might_contain_nickname("renamed1")
+
+def test_refresh_picks_up_lower_id_committed_late(db, user_filter):
+    # 먼저 커밋된 큰 id를 본 뒤에 작은 id가 커밋되는 경우 (MySQL auto-increment 동시 가입)
+    last_id = db.query(User.id).order_by(User.id.desc()).limit(1).scalar()
+    now = datetime.utcnow()
+    db.add(User(id=last_id + 2, email="later@example.com", password="x", nickname="later", created_at=now))
+    db.commit()
+    user_filter.refresh(db)
+
+    db.add(User(id=last_id + 1, email="earlier@example.com", password="x", nickname="earlier", created_at=now - timedelta(seconds=1)))
+    db.commit()
+    user_filter.refresh(db)
+
+    assert user_filter.might_contain_email("later@example.com")
+    assert user_filter.might_contain_email("earlier@example.com")
+    assert user_filter.might_contain_nickname("earlier")
+
+def test_idle_refresh_does_not_grow_count(db, user_filter):
+    # 겹쳐 읽는 구간의 기존 사용자를 다시 추가해도 count(재생성 기준)는 그대로
+    db.add(User(email="recent@example.com", password="x", nickname="recent", created_at=datetime.utcnow()))
+    db.commit()
+    user_filter.refresh(db)
+    counts = (user_filter._emails.count, user_filter._nicknames.count)
+
+    for _ in range(50):
+        assert user_filter.refresh(db) >= 1
+    assert (user_filter._emails.count, user_filter._nicknames.count) == counts
@@ -0,0 +1,40 @@
+"""
+auth_router 라우트별 SQL 문 수 상한 (N+1 회귀 감지)
+
+상한에는 로그인 사용자 조회(캐시 미스) 1개가 포함됩니다.
+테스트에서는 USER_FILTER_ENABLED=false라 사용 가능 여부 확인이 항상 DB로 확인합니다.
+"""
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+async def test_signup(client, statement_budget):
+    form = {"email": "signup@example.com", "password": "Password1!", "nickname": "signup"}
+    with statement_budget(4):
+        response = await client.post("/v1/auth/signup", data=form)
+    assert response.status_code == 201, response.text
+
+async def test_login(client, member, statement_budget):
+    with statement_budget(1):
+        response = await client.post("/v1/auth/login", json={"email": member["email"], "password": member["password"]})
+    assert response.status_code == 200
+
+async def test_get_me(member_client, statement_budget):
+    with statement_budget(1):
+        response = await member_client.get("/v1/auth/me")
+    assert response.status_code == 200
+
+async def test_check_email(client, member, statement_budget):
+    with statement_budget(1):
+        response = await client.get("/v1/auth/emails/availability", params={"email": member["email"]})
+    assert response.status_code == 409
+
+async def test_check_nickname(client, statement_budget):
+    with statement_budget(1):
+        response = await client.get("/v1/auth/nicknames/availability", params={"nickname": "unused"})
+    assert response.status_code == 200
+
+async def test_logout(member_client, statement_budget):
+    with statement_budget(1):
+        response = await member_client.delete("/v1/auth/session")
+    assert response.status_code == 200
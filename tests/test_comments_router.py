@@ -0,0 +1,64 @@
+"""
+comments_router 라우트별 SQL 문 수 상한 (N+1 회귀 감지)
+
+상한에는 로그인 사용자 조회(캐시 미스) 1개가 포함됩니다. 시드 게시글마다 댓글 5개가 있습니다.
+"""
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+async def create_comment(client, post_id: int) -> int:
+    response = await client.post(f"/v1/posts/{post_id}/comments", json={"content": "budget"})
+    assert response.status_code == 201, response.text
+    return response.json()["data"]["commentId"]
+
+async def test_get_comments(client, statement_budget):
+    with statement_budget(2):
+        response = await client.get("/v1/posts/10/comments")
+    assert response.status_code == 200
+    assert len(response.json()["data"]) == 5
+
+async def test_get_comments_cursor(client, statement_budget):
+    first = await client.get("/v1/posts/11/comments", params={"limit": 2})
+    with statement_budget(2):
+        response = await client.get("/v1/posts/11/comments", params={"limit": 2, "cursor": first.json()["nextCursor"]})
+    assert response.status_code == 200
+    assert len(response.json()["data"]) == 2
+
+async def test_get_comments_not_modified(client, statement_budget):
+    etag = (await client.get("/v1/posts/12/comments")).headers["ETag"]
+    with statement_budget(1):
+        response = await client.get("/v1/posts/12/comments", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+async def test_comments_etag_changes_on_edit_and_author_profile(member_client):
+    comment_id = await create_comment(member_client, 16)
+    etags = [(await member_client.get("/v1/posts/16/comments")).headers["ETag"]]
+
+    await member_client.patch(f"/v1/posts/16/comments/{comment_id}", json={"content": "수정"})
+    etags.append((await member_client.get("/v1/posts/16/comments")).headers["ETag"])
+
+    # 댓글 목록에 작성자 프로필 이미지가 포함되므로 프로필 변경도 반영
+    await member_client.patch("/v1/users/me", json={"profileImageUrl": "/public/image/profile/new.png"})
+    response = await member_client.get("/v1/posts/16/comments", headers={"If-None-Match": etags[-1]})
+
+    assert response.status_code == 200
+    assert len(set(etags + [response.headers["ETag"]])) == 3
+    assert response.json()["data"][0]["author"]["profileImageUrl"] == "/public/image/profile/new.png"
+
+async def test_create_comment(member_client, statement_budget):
+    with statement_budget(5):
+        response = await member_client.post("/v1/posts/13/comments", json={"content": "댓글"})
+    assert response.status_code == 201
+
+async def test_update_comment(member_client, statement_budget):
+    comment_id = await create_comment(member_client, 14)
+    with statement_budget(7):
+        response = await member_client.patch(f"/v1/posts/14/comments/{comment_id}", json={"content": "수정"})
+    assert response.status_code == 200
+
+async def test_delete_comment(member_client, statement_budget):
+    comment_id = await create_comment(member_client, 15)
+    with statement_budget(6):
+        response = await member_client.delete(f"/v1/posts/15/comments/{comment_id}")
+    assert response.status_code == 200
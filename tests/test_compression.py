@@ -0,0 +1,86 @@
+"""
+응답 압축 미들웨어 (gzip / brotli 협상, 대상 응답 선택)
+"""
+import gzip
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from compression import CompressionMiddleware, negotiate_encoding
+
+pytestmark = pytest.mark.anyio
+
+ITEMS = [{"postId": i, "title": f"게시글 {i}"} for i in range(200)]
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    (None, None),
+    ("gzip", "gzip"),
+    ("gzip, br", "br"),
+    ("br;q=0.5, gzip", "gzip"),
+    ("br;q=0, *", "gzip"),
+    ("*;q=0", None),
+    ("identity", None),
+    ("gzip;q=abc", None),
+])
+def test_negotiate_encoding(accept_encoding, expected):
+    assert negotiate_encoding(accept_encoding, ("br", "gzip")) == expected
+
+async def feed(request):
+    return JSONResponse(ITEMS, headers={"ETag": '"v1"'})
+
+async def small(request):
+    return JSONResponse({"code": "OK"})
+
+async def image(request):
+    return Response(b"\x00" * 4096, media_type="image/png")
+
+async def partial(request):
+    return Response(b"a" * 4096, status_code=206, media_type="text/plain")
+
+async def stream(request):
+    async def chunks():
+        for i in range(3):
+            yield f"chunk {i}\n".encode() * 100
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+@pytest.fixture
+async def client():
+    app = Starlette(routes=[
+        Route("/feed", feed), Route("/small", small), Route("/image", image),
+        Route("/partial", partial), Route("/stream", stream),
+    ])
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+async def test_compresses_large_json(client):
+    response = await client.get("/feed", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"v1"'
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json() == ITEMS
+
+@pytest.mark.parametrize("path, headers", [
+    ("/small", {"Accept-Encoding": "gzip"}),
+    ("/image", {"Accept-Encoding": "gzip"}),
+    ("/partial", {"Accept-Encoding": "gzip"}),
+    ("/feed", {"Accept-Encoding": "identity"}),
+])
+async def test_skips_ineligible_responses(client, path, headers):
+    response = await client.get(path, headers=headers)
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == str(len(response.content))
+
+async def test_streaming_response_is_flushed_per_chunk(client):
+    async with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        raw = b"".join([chunk async for chunk in response.aiter_raw()])
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(raw) == b"".join(f"chunk {i}\n".encode() * 100 for i in range(3))
@@ -0,0 +1,19 @@
+"""
+비밀번호 해시 executor (PASSWORD_HASH_EXECUTOR)
+"""
+import pytest
+
+from auth import auth_utils
+
+pytestmark = pytest.mark.anyio
+
+async def test_process_executor_spawns_workers(monkeypatch):
+    auth_utils.shutdown_password_executor()
+    monkeypatch.setattr(auth_utils, "PASSWORD_HASH_EXECUTOR", "process")
+    try:
+        hashed = await auth_utils.get_password_hash_async("Password1!")
+        assert await auth_utils.verify_password_async("Password1!", hashed)
+        # 스레드가 있는 워커 프로세스를 fork 하지 않음
+        assert auth_utils.get_password_executor()._mp_context.get_start_method() == "spawn"
+    finally:
+        auth_utils.shutdown_password_executor()
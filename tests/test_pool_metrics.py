@@ -0,0 +1,49 @@
+"""
+커넥션 풀 계측 (큐 대기 시간과 연결 수립 / pre-ping 시간 분리)
+"""
+import sqlite3
+import threading
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from database import instrumented_pool_class
+
+DELAY = 0.2
+
+def make_engine(tmp_path, connect_delay: float = 0.0, **options):
+    def creator():
+        time.sleep(connect_delay)
+        return sqlite3.connect(str(tmp_path / "pool.db"), check_same_thread=False)
+
+    return create_engine(
+        "sqlite://", creator=creator, poolclass=instrumented_pool_class(QueuePool), pool_timeout=5, **options
+    )
+
+def test_slow_connect_is_not_counted_as_wait(tmp_path):
+    engine = make_engine(tmp_path, connect_delay=DELAY, pool_size=1, max_overflow=0)
+    with engine.connect():
+        pass
+
+    stats = engine.pool.metrics.snapshot(engine.pool)
+    assert stats["checkouts"] == 1
+    assert stats["waitMaxMs"] < DELAY * 1000 / 2
+    assert stats["setupMaxMs"] >= DELAY * 1000
+    engine.dispose()
+
+def test_wait_for_checked_out_connection(tmp_path):
+    engine = make_engine(tmp_path, pool_size=1, max_overflow=0)
+    held = engine.connect()
+    timer = threading.Timer(DELAY, held.close)
+    timer.start()
+    try:
+        with engine.connect():
+            pass
+    finally:
+        timer.join()
+
+    stats = engine.pool.metrics.snapshot(engine.pool)
+    assert stats["waitMaxMs"] >= DELAY * 1000 * 0.9
+    assert stats["setupMaxMs"] < DELAY * 1000 / 2
+    engine.dispose()
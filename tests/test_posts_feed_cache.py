@@ -0,0 +1,73 @@
+"""
+피드 페이지 응답 캐시 (FEED_CACHE_ENABLED)
+"""
+import asyncio
+
+import pytest
+
+from posts.posts_feed_cache import FeedCache, MemoryFeedCacheBackend, feed_cache
+
+pytestmark = pytest.mark.anyio
+
+@pytest.fixture
+def cache() -> FeedCache:
+    return FeedCache(MemoryFeedCacheBackend(max_size=10, ttl=60.0))
+
+async def test_concurrent_misses_load_once(cache):
+    calls = 0
+    release = asyncio.Event()
+
+    async def loader() -> bytes:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return b"page"
+
+    tasks = [asyncio.ensure_future(cache.get_or_load("p:1:20", loader)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == [b"page"] * 5
+    assert calls == 1
+    assert (cache.misses, cache.coalesced) == (1, 4)
+
+    assert await cache.get_or_load("p:1:20", loader) == b"page"
+    assert cache.hits == 1
+
+async def test_invalidate_drops_all_pages(cache):
+    values = iter([b"old", b"new"])
+
+    async def loader() -> bytes:
+        return next(values)
+
+    assert await cache.get_or_load("p:1:20", loader) == b"old"
+    await cache.invalidate()
+    assert await cache.get_or_load("p:1:20", loader) == b"new"
+    assert cache.stats()["store"]["generation"] == 1
+
+async def test_loader_error_is_not_cached(cache):
+    async def failing() -> bytes:
+        raise RuntimeError("db down")
+
+    async def loader() -> bytes:
+        return b"page"
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load("p:1:20", failing)
+    assert await cache.get_or_load("p:1:20", loader) == b"page"
+
+async def test_new_post_appears_in_cached_feed(member_client, monkeypatch):
+    monkeypatch.setattr(feed_cache, "enabled", True)
+    await feed_cache.invalidate()
+
+    await member_client.get("/v1/posts", params={"size": 5})
+    hits = feed_cache.hits
+    cached = await member_client.get("/v1/posts", params={"size": 5})
+    assert feed_cache.hits == hits + 1
+
+    response = await member_client.post("/v1/posts", json={"nickname": "member", "title": "캐시 무효화", "content": "본문"})
+    assert response.status_code == 201
+    latest = await member_client.get("/v1/posts", params={"size": 5})
+
+    assert latest.json()["data"][0]["postId"] == response.json()["data"]["postId"]
+    assert latest.json()["data"] != cached.json()["data"]
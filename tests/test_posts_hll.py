@@ -0,0 +1,47 @@
+"""
+HyperLogLog 조회수 sketch (VIEW_COUNT_BACKEND=hll)
+"""
+import pytest
+
+from posts import posts_hll
+from posts.posts_hll import HyperLogLog
+
+POST_ID = 1990
+
+def test_fold_equals_sketch_built_at_lower_precision():
+    high = HyperLogLog(12)
+    low = HyperLogLog(10)
+    for user_id in range(5000):
+        high.add(user_id)
+        low.add(user_id)
+
+    assert high.fold(10).registers == low.registers
+    assert high.fold(12) is high
+    with pytest.raises(ValueError):
+        low.fold(12)
+
+def test_precision_change_keeps_stored_viewers(database, monkeypatch):
+    from database import SessionLocal
+    from models import Post
+    from posts.posts_counters import reconcile_post_counters
+
+    db = SessionLocal()
+    try:
+        monkeypatch.setattr(posts_hll, "VIEW_HLL_ERROR", 0.02)
+        posts_hll.record_views([(POST_ID, user_id) for user_id in range(5000)], db)
+        before = db.get(Post, POST_ID).view_count
+        assert abs(before - 5000) < 5000 * 0.1
+
+        # 정밀도를 높여도(오차 0.01) 저장된 sketch를 버리지 않고 병합
+        monkeypatch.setattr(posts_hll, "VIEW_HLL_ERROR", 0.01)
+        posts_hll.record_views([(POST_ID, 5000)], db)
+        db.expire_all()
+        after = db.get(Post, POST_ID).view_count
+        assert after >= before - 1
+
+        # hll 모드의 카운터 복구는 views 테이블(빈 상태)이 아니라 sketch 추정값 사용
+        reconcile_post_counters(db, view_backend="hll")
+        db.expire_all()
+        assert db.get(Post, POST_ID).view_count == after
+    finally:
+        db.close()
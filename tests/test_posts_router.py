@@ -0,0 +1,94 @@
+"""
+posts_router 라우트별 SQL 문 수 상한 (N+1 회귀 감지)
+
+상한에는 로그인 사용자 조회(캐시 미스) 1개가 포함됩니다. 시드 게시글 1번은 댓글 5개 / 좋아요 3개가 있습니다.
+"""
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+
+async def create_post(client, title: str = "budget") -> int:
+    response = await client.post("/v1/posts", json={"nickname": "member", "title": title, "content": "본문"})
+    assert response.status_code == 201, response.text
+    return response.json()["data"]["postId"]
+
+async def test_get_posts_page(member_client, statement_budget):
+    with statement_budget(2):
+        response = await member_client.get("/v1/posts", params={"page": 2, "size": 20})
+    assert response.status_code == 200
+    assert len(response.json()["data"]) == 20
+
+async def test_get_posts_cursor(member_client, statement_budget):
+    first = await member_client.get("/v1/posts", params={"size": 20})
+    with statement_budget(2):
+        response = await member_client.get("/v1/posts", params={"size": 20, "cursor": first.json()["nextCursor"]})
+    assert response.status_code == 200
+    assert len(response.json()["data"]) == 20
+
+async def test_search_posts(member_client, statement_budget):
+    with statement_budget(3):
+        response = await member_client.get("/v1/posts/search", params={"q": "배포 후기", "size": 20})
+    assert response.status_code == 200
+    assert len(response.json()["data"]) == 20
+
+async def test_get_post_detail(member_client, statement_budget):
+    with statement_budget(5):
+        response = await member_client.get("/v1/posts/1")
+    assert response.status_code == 200
+    assert response.json()["data"]["commentCount"] == 5
+
+async def test_get_post_detail_not_modified(member_client, statement_budget):
+    # 첫 조회가 조회수를 올려도 응답 ETag는 본문(hits)과 같은 값이라 다음 폴링은 304
+    first = await member_client.get("/v1/posts/2")
+    assert first.json()["data"]["hits"] >= 1
+    with statement_budget(4):
+        response = await member_client.get("/v1/posts/2", headers={"If-None-Match": first.headers["ETag"]})
+    assert response.status_code == 304
+
+async def test_create_post(member_client, statement_budget):
+    with statement_budget(5):
+        response = await member_client.post("/v1/posts", json={"nickname": "member", "title": "새 글", "content": "본문"})
+    assert response.status_code == 201
+
+async def test_update_post(member_client, statement_budget):
+    post_id = await create_post(member_client)
+    with statement_budget(7):
+        response = await member_client.patch(f"/v1/posts/{post_id}", json={"title": "수정", "content": "수정한 본문"})
+    assert response.status_code == 200
+
+async def test_delete_post(member_client, statement_budget):
+    post_id = await create_post(member_client)
+    await member_client.post(f"/v1/posts/{post_id}/likes")
+    with statement_budget(8):
+        response = await member_client.delete(f"/v1/posts/{post_id}")
+    assert response.status_code == 200
+
+async def test_upload_post_image(member_client, statement_budget):
+    with statement_budget(1):
+        response = await member_client.post("/v1/posts/image", files={"postFile": ("a.png", PNG, "image/png")})
+    assert response.status_code == 201
+
+async def test_get_my_liked_posts(member_client, statement_budget):
+    post_ids = ",".join(str(i) for i in range(1, 21))
+    with statement_budget(2):
+        response = await member_client.get("/v1/posts/likes/me", params={"postIds": post_ids})
+    assert response.status_code == 200
+
+async def test_get_post_likers(member_client, statement_budget):
+    with statement_budget(3):
+        response = await member_client.get("/v1/posts/1/likes")
+    assert response.status_code == 200
+    assert len(response.json()["data"]) == 3
+
+async def test_like_post(member_client, statement_budget):
+    with statement_budget(4):
+        response = await member_client.post("/v1/posts/3/likes")
+    assert response.status_code == 201
+
+async def test_unlike_post(member_client, statement_budget):
+    await member_client.post("/v1/posts/4/likes")
+    with statement_budget(4):
+        response = await member_client.delete("/v1/posts/4/likes")
+    assert response.status_code == 200
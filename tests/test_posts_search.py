@@ -0,0 +1,55 @@
+"""
+게시글 검색 (SQLite FTS5, 2-gram)
+"""
+import pytest
+
+from posts.posts_search import ngrams, search_terms
+
+pytestmark = pytest.mark.anyio
+
+def test_ngrams_split_words_without_crossing_boundaries():
+    assert ngrams("서버를 배포") == "서버 버를 배포"
+    assert ngrams("A 서버") == "a 서버"
+    assert ngrams(None) == ""
+
+def test_search_terms_drop_short_words():
+    assert search_terms("배포 후 FastAPI") == ["배포", "fastapi"]
+
+async def search(client, q: str, **params) -> dict:
+    response = await client.get("/v1/posts/search", params={"q": q, **params})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+async def post_ids(client, q: str) -> list:
+    return [item["postId"] for item in (await search(client, q, size=50))["data"]]
+
+async def test_search_follows_post_changes(member_client):
+    response = await member_client.post("/v1/posts", json={"nickname": "member", "title": "양자컴퓨터 입문", "content": "큐비트를 다룹니다"})
+    post_id = response.json()["data"]["postId"]
+
+    # 조사가 붙은 단어 / 본문 검색
+    assert await post_ids(member_client, "양자컴퓨터") == [post_id]
+    assert await post_ids(member_client, "큐비트") == [post_id]
+    assert await post_ids(member_client, "양자 큐비트") == [post_id]
+    assert await post_ids(member_client, "양자 블록체인") == []
+
+    await member_client.patch(f"/v1/posts/{post_id}", json={"title": "블록체인 입문", "content": "합의 알고리즘"})
+    assert await post_ids(member_client, "양자컴퓨터") == []
+    assert await post_ids(member_client, "블록체인") == [post_id]
+
+    await member_client.delete(f"/v1/posts/{post_id}")
+    assert await post_ids(member_client, "블록체인") == []
+
+async def test_search_pages_with_cursor(member_client):
+    first = await search(member_client, "배포 후기", size=7)
+    second = await search(member_client, "배포 후기", size=7, cursor=first["nextCursor"])
+
+    ids = [item["postId"] for item in first["data"] + second["data"]]
+    assert len(ids) == 14
+    assert len(set(ids)) == 14
+    assert ids == (await post_ids(member_client, "배포 후기"))[:14]
+
+@pytest.mark.parametrize("params", [{"q": "  "}, {"q": "배포", "cursor": "invalid"}])
+async def test_search_rejects_invalid_query(member_client, params):
+    response = await member_client.get("/v1/posts/search", params=params)
+    assert response.status_code == 400
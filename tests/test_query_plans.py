@@ -0,0 +1,18 @@
+"""
+주요 조회 쿼리 실행 계획 / 마이그레이션
+"""
+from sqlalchemy import create_engine
+
+from migrations import MIGRATIONS, check_plans, upgrade
+
+def test_hot_queries_use_indexes():
+    # 시드한 임시 SQLite DB에서 posts / comments / auth 서비스 조회를 EXPLAIN, full scan이 있으면 실패
+    assert check_plans() == 0
+
+def test_upgrade_is_idempotent(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrate.db'}")
+    try:
+        assert upgrade(engine) == [migration.version for migration in MIGRATIONS]
+        assert upgrade(engine) == []
+    finally:
+        engine.dispose()
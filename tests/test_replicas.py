@@ -0,0 +1,110 @@
+"""
+읽기 복제본 라우팅 (DATABASE_REPLICA_URLS)
+
+테스트 DB 파일을 복사해 복제본으로 쓰고, 복제본에만 댓글 하나를 더 넣어 어느 쪽에서 읽었는지 구분합니다.
+"""
+import shutil
+import sqlite3
+from contextlib import closing
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import database
+from database import ReplicaRouter
+
+pytestmark = pytest.mark.anyio
+
+POST_ID = 20
+# 디렉터리가 없어 연결할 수 없는 복제본
+MISSING = "missing/replica.db"
+
+@pytest.fixture
+async def use_replicas(app, tmp_path, monkeypatch):
+    engines = []
+
+    def configure(*names) -> ReplicaRouter:
+        for name in names:
+            path = str(tmp_path / name)
+            if name != MISSING:
+                shutil.copy(database.engine.url.database, path)
+                with closing(sqlite3.connect(path)) as conn, conn:
+                    conn.execute(
+                        "INSERT INTO comments (post_id, user_id, comment, nickname, created_at) "
+                        "VALUES (?, 1, 'replica only', 'user1', CURRENT_TIMESTAMP)",
+                        (POST_ID,)
+                    )
+            engines.append(create_async_engine(f"sqlite+aiosqlite:///{path}"))
+
+        router = ReplicaRouter(engines, retry_interval=30.0)
+        monkeypatch.setattr(database, "replica_router", router)
+        return router
+
+    yield configure
+    for engine in engines:
+        await engine.dispose()
+
+async def comment_count(client) -> int:
+    response = await client.get(f"/v1/posts/{POST_ID}/comments")
+    assert response.status_code == 200, response.text
+    return len(response.json()["data"])
+
+async def test_reads_round_robin_over_replicas(client, use_replicas):
+    router = use_replicas("replica1.db", "replica2.db")
+
+    assert await comment_count(client) == 6
+    assert await comment_count(client) == 6
+    assert router.replica_reads == [1, 1]
+    assert router.primary_reads == 0
+
+async def test_reads_after_own_write_use_primary(client, member, use_replicas):
+    router = use_replicas("replica1.db")
+
+    # 로그인(POST)도 쓰기 요청이라 이후 DB_REPLICA_STICKY_SECONDS 동안 primary에서 읽음
+    response = await client.post("/v1/auth/login", json={"email": member["email"], "password": member["password"]})
+    assert response.status_code == 200
+    assert await comment_count(client) == 5
+    assert router.sticky_reads >= 1
+
+    # 다른 사용자(세션 없음)는 복제본에서 읽음
+    client.cookies.clear()
+    assert await comment_count(client) == 6
+
+async def test_unavailable_replica_falls_back_to_primary(client, use_replicas):
+    router = use_replicas(MISSING, "replica1.db")
+
+    counts = [await comment_count(client) for _ in range(3)]
+    # 첫 요청에서 연결 실패한 복제본은 제외되고 이후 정상 복제본만 사용
+    assert counts == [6, 6, 6]
+    assert router.replica_failures == [1, 0]
+    assert router.stats()["replicas"][0]["healthy"] is False
+
+async def test_no_healthy_replica_uses_primary(client, use_replicas):
+    router = use_replicas(MISSING)
+
+    assert await comment_count(client) == 5
+    assert await comment_count(client) == 5
+    assert router.replica_failures == [1]
+    assert router.primary_reads == 2
+
+async def test_availability_negative_opens_no_session(client, member, use_replicas, monkeypatch):
+    from auth import auth_controller
+    from auth.auth_availability import UserAvailabilityFilter
+    from database import SessionLocal
+
+    user_filter = UserAvailabilityFilter(0.01, refresh_interval=0, rebuild_interval=600, session_factory=None)
+    with SessionLocal() as db:
+        user_filter.rebuild(db)
+    monkeypatch.setattr(auth_controller, "user_filter", user_filter)
+    router = use_replicas("replica1.db")
+
+    # filter 음성: 복제본 커넥션(pre-ping)도 잡지 않음
+    response = await client.get("/v1/auth/nicknames/availability", params={"nickname": "nobody-here"})
+    assert response.json()["code"] == "NICKNAME_AVAILABLE"
+    assert router.replica_reads == [0]
+    assert router.primary_reads == 0
+
+    # filter 양성: 복제본에서 확인
+    response = await client.get("/v1/auth/emails/availability", params={"email": member["email"]})
+    assert response.status_code == 409
+    assert router.replica_reads == [1]
@@ -0,0 +1,74 @@
+"""
+/public 정적 파일 서빙 (캐시 헤더 / Range / X-Accel-Redirect)
+"""
+import httpx
+import pytest
+
+from static_files import IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL, PublicFiles, parse_range
+
+pytestmark = pytest.mark.anyio
+
+BODY = bytes(range(256)) * 4
+HASHED = "ab/cd/" + "ab" * 32 + ".png"
+
+@pytest.mark.parametrize("header, expected", [
+    (None, None),
+    ("bytes=0-99", (0, 99)),
+    ("bytes=1000-", (1000, 1023)),
+    ("bytes=-24", (1000, 1023)),
+    ("bytes=-5000", (0, 1023)),
+    ("bytes=1000-5000", (1000, 1023)),
+    ("bytes=0-1,5-6", None),
+    ("bytes=5-1", None),
+    ("items=0-1", None),
+    ("bytes=a-b", None),
+])
+def test_parse_range(header, expected):
+    assert parse_range(header, len(BODY)) == expected
+
+@pytest.mark.parametrize("header", ["bytes=1024-", "bytes=-0"])
+def test_parse_range_not_satisfiable(header):
+    with pytest.raises(ValueError):
+        parse_range(header, len(BODY))
+
+@pytest.fixture
+def public_dir(tmp_path):
+    (tmp_path / "ab" / "cd").mkdir(parents=True)
+    (tmp_path / HASHED).write_bytes(BODY)
+    (tmp_path / "logo.png").write_bytes(BODY)
+    return tmp_path
+
+def files_client(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+async def test_cache_control_by_path(public_dir):
+    async with files_client(PublicFiles(directory=public_dir)) as client:
+        hashed = await client.get(f"/{HASHED}")
+        plain = await client.get("/logo.png")
+
+    assert hashed.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert plain.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+    assert hashed.content == plain.content == BODY
+
+async def test_range_requests(public_dir):
+    async with files_client(PublicFiles(directory=public_dir)) as client:
+        partial = await client.get("/logo.png", headers={"Range": "bytes=10-19"})
+        unsatisfiable = await client.get("/logo.png", headers={"Range": "bytes=2048-"})
+        stale = await client.get("/logo.png", headers={"Range": "bytes=10-19", "If-Range": '"old"'})
+        not_modified = await client.get("/logo.png", headers={"If-None-Match": partial.headers["etag"]})
+
+    assert partial.status_code == 206
+    assert partial.headers["content-range"] == f"bytes 10-19/{len(BODY)}"
+    assert partial.content == BODY[10:20]
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == f"bytes */{len(BODY)}"
+    assert stale.status_code == 200 and stale.content == BODY
+    assert not_modified.status_code == 304
+
+async def test_accel_redirect(public_dir):
+    async with files_client(PublicFiles(directory=public_dir, accel_redirect_prefix="/_public/")) as client:
+        response = await client.get(f"/{HASHED}")
+
+    assert response.status_code == 200
+    assert response.headers["x-accel-redirect"] == f"/_public/{HASHED}"
+    assert response.content == b""
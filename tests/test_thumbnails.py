@@ -0,0 +1,24 @@
+"""
+썸네일 프로세스 풀
+"""
+import os
+
+import pytest
+
+import thumbnails
+
+def test_executor_spawns_workers_and_generates_variants(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    path = str(tmp_path / "original.png")
+    Image.new("RGB", (400, 200), "white").save(path)
+
+    executor = thumbnails.get_thumbnail_executor()
+    try:
+        # 스레드가 있는 워커 프로세스를 fork 하지 않음
+        assert executor._mp_context.get_start_method() == "spawn"
+        created = executor.submit(thumbnails.generate_variants, path, [160], 80).result(timeout=60)
+    finally:
+        thumbnails.shutdown_thumbnail_executor()
+
+    assert created == [thumbnails.variant_path(path, 160)]
+    assert os.path.exists(created[0])
@@ -0,0 +1,88 @@
+"""
+users_router 라우트별 SQL 문 수 상한 (N+1 회귀 감지)
+
+상한에는 로그인 사용자 조회(캐시 미스) 1개가 포함됩니다.
+"""
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+
+async def test_get_my_info(member_client, statement_budget):
+    with statement_budget(1):
+        response = await member_client.get("/v1/users/me")
+    assert response.status_code == 200
+
+async def test_get_user_info(member_client, member, statement_budget):
+    with statement_budget(2):
+        response = await member_client.get(f"/v1/users/{member['id']}")
+    assert response.status_code == 200
+    assert response.json()["data"]["email"] == member["email"]
+
+async def test_update_my_info(member_client, member, statement_budget):
+    with statement_budget(4):
+        response = await member_client.patch("/v1/users/me", json={"nickname": f"new{member['id']}"})
+    assert response.status_code == 200
+
+async def test_update_my_password(member_client, statement_budget):
+    with statement_budget(4):
+        response = await member_client.patch("/v1/users/password", json={"password": "Password2!"})
+    assert response.status_code == 200
+
+async def test_update_user_info(member_client, member, statement_budget):
+    with statement_budget(4):
+        response = await member_client.patch(f"/v1/users/{member['id']}", json={"nickname": f"upd{member['id']}"})
+    assert response.status_code == 200
+
+async def test_update_user_password(member_client, member, statement_budget):
+    with statement_budget(4):
+        response = await member_client.patch(f"/v1/users/{member['id']}/password", json={"password": "Password2!"})
+    assert response.status_code == 200
+
+async def test_upload_profile_image(member_client, statement_budget):
+    with statement_budget(5):
+        response = await member_client.post("/v1/users/me/profile-image", files={"profileImage": ("a.png", PNG, "image/png")})
+    assert response.status_code == 201
+
+def post_counters(post_id: int) -> tuple:
+    from database import SessionLocal
+    from models import Post
+
+    with SessionLocal() as db:
+        post = db.get(Post, post_id)
+        return post.like_count, post.comment_count, post.view_count
+
+async def test_delete_me(member_client, member, statement_budget):
+    from database import SessionLocal
+    from models import Comment, Like, Post, View
+
+    # 탈퇴할 사용자의 글에 다른 사용자가 남긴 댓글 / 좋아요, 다른 글에 남긴 좋아요 / 댓글 2개 / 조회
+    response = await member_client.post("/v1/posts", json={"nickname": "member", "title": "탈퇴 전 글", "content": "본문"})
+    own_post_id = response.json()["data"]["postId"]
+    with SessionLocal() as db:
+        db.add_all([Comment(post_id=own_post_id, user_id=1, comment="댓글", nickname="user1"), Like(post_id=own_post_id, user_id=1)])
+        db.commit()
+
+    before = post_counters(30)
+    await member_client.post("/v1/posts/30/likes")
+    await member_client.post("/v1/posts/30/comments", json={"content": "첫 댓글"})
+    await member_client.post("/v1/posts/30/comments", json={"content": "둘째 댓글"})
+    await member_client.get("/v1/posts/30")
+    assert post_counters(30) != before
+
+    # FK 검사(conftest)가 켜져 있으므로 참조 행이 남으면 IntegrityError
+    with statement_budget(16):
+        response = await member_client.delete("/v1/users/me")
+    assert response.status_code == 200
+
+    assert post_counters(30) == before
+    with SessionLocal() as db:
+        assert db.get(Post, own_post_id) is None
+        for model in (Comment, Like, View):
+            assert db.query(model).filter((model.user_id == member["id"]) | (model.post_id == own_post_id)).count() == 0
+
+async def test_delete_user(member_client, member, statement_budget):
+    with statement_budget(10):
+        response = await member_client.delete(f"/v1/users/{member['id']}")
+    assert response.status_code == 200
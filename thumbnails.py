@@ -0,0 +1,164 @@
+"""
+업로드 이미지 썸네일(리사이즈 + WebP 재압축) 생성
+
+원본 옆에 너비별 변형을 저장합니다: public/image/posts/ab/cd/<sha256>.jpg -> <sha256>.w320.webp, <sha256>.w640.webp ...
+업로드 직후 프로세스 풀에서 백그라운드로 생성하고(요청은 기다리지 않음),
+응답의 썸네일 URL은 변형 파일이 생기기 전까지 원본 URL로 대체합니다.
+Pillow가 설치되어 있지 않거나 THUMBNAIL_ENABLED=false면 생성하지 않고 항상 원본 URL을 사용합니다.
+
+기존 파일 변형 일괄 생성: python -m thumbnails backfill [--force]
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Optional
+
+from cache import TTLCache
+from config import THUMBNAIL_ENABLED, THUMBNAIL_WIDTHS, THUMBNAIL_QUALITY, THUMBNAIL_WORKERS
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # 선택 의존성 (pyproject extras: thumbnails)
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+PUBLIC_DIR = "public"
+IMAGE_DIRS = ["public/image/posts", "public/image/profile"]
+ORIGINAL_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+# 용도별 너비: 피드 게시글 이미지 / 작성자 프로필
+FEED_IMAGE_WIDTH = max(THUMBNAIL_WIDTHS)
+PROFILE_IMAGE_WIDTH = min(THUMBNAIL_WIDTHS)
+
+def is_enabled() -> bool:
+    return THUMBNAIL_ENABLED and Image is not None
+
+def variant_path(path: str, width: int) -> str:
+    root, _ = os.path.splitext(path)
+    return f"{root}.w{width}.webp"
+
+
+def generate_variants(path: str, widths: List[int], quality: int) -> List[str]:
+    """
+원본 이미지로 너비별 WebP 변형을 만들고 경로 목록을 반환합니다. (프로세스 풀에서 실행)
+원본보다 큰 너비는 확대하지 않고 원본 크기로 저장해, 너비별 변형 파일이 항상 존재하도록 합니다.
+    """
+    created = []
+    with Image.open(path) as source:
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+
+        for width in sorted(widths, reverse=True):
+            target_width = min(width, image.width)
+            target_height = max(1, round(image.height * target_width / image.width))
+            resized = image if target_width == image.width else image.resize((target_width, target_height), Image.LANCZOS)
+
+            target = variant_path(path, width)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix=".thumb-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as buffer:
+                    resized.save(buffer, format="WEBP", quality=quality, method=4)
+                os.chmod(temp_path, 0o644)
+                os.replace(temp_path, target)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+            created.append(target)
+    return created
+
+
+# 이미지 디코딩 / 리사이즈는 CPU를 많이 쓰므로 요청 처리 프로세스와 분리된 프로세스 풀에서 실행
+# 워커 안에서 처음 쓸 때 만들어지며, 이때는 이미 스레드(조회 기록 flush, filter 갱신, threadpool)가 있으므로
+# fork 대신 spawn으로 자식 프로세스 시작 (스레드가 잡고 있던 lock을 복사해 교착되는 문제 방지)
+_executor: Optional[Executor] = None
+
+def get_thumbnail_executor() -> Executor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=THUMBNAIL_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _executor
+
+def shutdown_thumbnail_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+def _log_failure(future):
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("failed to generate thumbnails", exc_info=future.exception())
+
+def schedule_variants(path: str):
+    # 업로드 응답을 기다리게 하지 않도록 결과를 await 하지 않음, 실패는 로그만 남김
+    if not is_enabled():
+        return
+    # 같은 내용의 이미지가 이미 올라와 변형이 있으면 다시 만들지 않음
+    if all(os.path.exists(variant_path(path, width)) for width in THUMBNAIL_WIDTHS):
+        return
+    future = asyncio.get_running_loop().run_in_executor(
+        get_thumbnail_executor(), generate_variants, path, THUMBNAIL_WIDTHS, THUMBNAIL_QUALITY
+    )
+    future.add_done_callback(_log_failure)
+
+
+# 응답용 URL: 변형 파일이 있으면 변형 URL, 없으면 원본 URL
+# 한 번 생긴 변형은 지워지지 않으므로 존재 확인 결과(양성)만 캐시
+_existing_variants = TTLCache(max_size=50000, ttl=300.0)
+
+def thumbnail_url(url: Optional[str], width: int) -> Optional[str]:
+    if not url or not url.startswith(f"/{PUBLIC_DIR}/") or not is_enabled():
+        return url
+
+    variant_url = variant_path(url, width)
+    if _existing_variants.get(variant_url) is None:
+        if not os.path.exists(variant_url.lstrip("/")):
+            return url
+        _existing_variants.set(variant_url, True)
+    return variant_url
+
+
+def find_originals(directories: List[str], force: bool = False) -> List[str]:
+    paths = []
+    for directory in directories:
+        if not os.path.isdir(directory):
+            continue
+        # 원본은 해시 분산 하위 디렉터리(ab/cd/)에 있음
+        for root, _, filenames in os.walk(directory):
+            for name in filenames:
+                if name.startswith(".") or not name.lower().endswith(ORIGINAL_EXTENSIONS):
+                    continue
+                path = os.path.join(root, name)
+                if force or not all(os.path.exists(variant_path(path, width)) for width in THUMBNAIL_WIDTHS):
+                    paths.append(path)
+    return paths
+
+def backfill(directories: List[str], force: bool = False) -> int:
+    paths = find_originals(directories, force)
+    count = 0
+    with ProcessPoolExecutor(max_workers=THUMBNAIL_WORKERS) as executor:
+        futures = [executor.submit(generate_variants, path, THUMBNAIL_WIDTHS, THUMBNAIL_QUALITY) for path in paths]
+        for path, future in zip(paths, futures):
+            try:
+                future.result()
+                count += 1
+            except Exception as e:
+                print(f"skip {path}: {e}")
+    return count
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Image thumbnail tools")
+    parser.add_argument("command", choices=["backfill"])
+    parser.add_argument("--force", action="store_true", help="regenerate variants that already exist")
+    args = parser.parse_args()
+
+    if Image is None:
+        raise SystemExit("Pillow is required: pip install pillow")
+
+    count = backfill(IMAGE_DIRS, args.force)
+    print(f"generated thumbnails for {count} images")
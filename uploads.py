@@ -0,0 +1,251 @@
+"""
+이미지 업로드 공통 처리
+
+- 파일명 확장자 대신 파일 앞부분의 magic bytes로 형식(JPEG / PNG)을 판별하고, 저장 확장자도 판별 결과를 사용
+- 업로드 파일을 청크 단위로 읽어 같은 디렉터리의 임시 파일에 쓴 뒤 os.replace로 교체 (쓰다 만 파일이 노출되지 않음)
+- 파일은 내용 해시로 분산 저장(ab/cd/<sha256>.ext)하여 같은 이미지는 한 번만 저장하고, URL은 내용이 바뀌지 않는 한 불변
+- 디스크 I/O는 threadpool에서 실행해 이벤트 루프를 막지 않음
+- UPLOAD_MAX_SIZE를 넘으면 413 (FILE_TOO_LARGE)
+  multipart 본문 자체도 UploadSizeLimitMiddleware가 Content-Length / 수신 바이트 기준으로 먼저 차단
+
+기존 평면 디렉터리(<uuid>.ext, <user_id>.ext) 파일을 해시 경로로 이전하고 DB URL 갱신:
+python -m uploads migrate [--dry-run]
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import tempfile
+from typing import Optional
+
+from fastapi import HTTPException, UploadFile, status
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+
+from config import UPLOAD_MAX_SIZE, UPLOAD_CHUNK_SIZE, UPLOAD_FORM_OVERHEAD
+
+# 형식 -> (magic bytes, 저장 확장자)
+IMAGE_SIGNATURES = {
+    "jpeg": (b"\xff\xd8\xff", "jpg"),
+    "png": (b"\x89PNG\r\n\x1a\n", "png"),
+}
+SNIFF_SIZE = max(len(signature) for signature, _ in IMAGE_SIGNATURES.values())
+
+def detect_image_type(head: bytes) -> Optional[str]:
+    for kind, (signature, _) in IMAGE_SIGNATURES.items():
+        if head.startswith(signature):
+            return kind
+    return None
+
+def _too_large() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="FILE_TOO_LARGE")
+
+def shard_path(digest: str, ext: str) -> str:
+    # 한 디렉터리의 파일 수가 너무 많아지지 않도록 해시 앞 4자리로 2단계 분산: ab/cd/abcd....jpg (URL에도 그대로 사용)
+    return f"{digest[:2]}/{digest[2:4]}/{digest}.{ext}"
+
+def _write_image(source, directory: str, max_size: int, chunk_size: int, invalid_detail: str) -> str:
+    # threadpool에서 실행, directory 기준 저장 경로(ab/cd/<sha256>.ext) 반환
+    head = source.read(SNIFF_SIZE)
+    kind = detect_image_type(head)
+    if kind is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=invalid_detail)
+
+    os.makedirs(directory, exist_ok=True)
+    digest = hashlib.sha256(head)
+
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".upload-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as buffer:
+            size = len(head)
+            buffer.write(head)
+            while True:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_size:
+                    raise _too_large()
+                digest.update(chunk)
+                buffer.write(chunk)
+
+        relative_path = shard_path(digest.hexdigest(), IMAGE_SIGNATURES[kind][1])
+        target = os.path.join(directory, relative_path)
+        if os.path.exists(target):
+            # 같은 내용이 이미 저장되어 있으면 기존 파일 재사용
+            os.unlink(temp_path)
+        else:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, target)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+    return relative_path
+
+async def save_image(
+    file: UploadFile,
+    directory: str,
+    max_size: int = UPLOAD_MAX_SIZE,
+    invalid_detail: str = "INVALID_FILE",
+) -> str:
+    """
+업로드된 이미지를 내용 해시(sha256) 기준 경로 directory/ab/cd/<sha256>.<jpg|png>에 저장하고
+directory 기준 상대 경로를 반환합니다. 같은 내용은 한 번만 저장되고, 내용이 바뀌면 경로(URL)도 바뀝니다.
+형식이 JPEG / PNG가 아니면 400(invalid_detail), max_size를 넘으면 413을 발생시킵니다.
+    """
+    # multipart 파서가 알려준 크기로 본문을 읽기 전에 먼저 거름
+    if file.size is not None and file.size > max_size:
+        raise _too_large()
+
+    await file.seek(0)
+    return await run_in_threadpool(_write_image, file.file, directory, max_size, UPLOAD_CHUNK_SIZE, invalid_detail)
+
+
+class UploadSizeLimitMiddleware:
+    """
+multipart 요청 본문이 UPLOAD_MAX_SIZE(+ 폼 필드 여유분)를 넘으면 파일을 끝까지 받기 전에 413으로 응답합니다.
+Content-Length가 있으면 본문을 읽기 전에, 없으면(chunked) 받은 바이트 수가 한도를 넘는 시점에 중단합니다.
+    """
+    def __init__(self, app, max_body_size: int = UPLOAD_MAX_SIZE + UPLOAD_FORM_OVERHEAD):
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        if not headers.get(b"content-type", b"").startswith(b"multipart/form-data"):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = headers.get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_body_size:
+            response = ORJSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                content={"code": "FILE_TOO_LARGE", "data": None}
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    # 본문 파싱 중(라우트 안)에 발생하므로 등록된 HTTP 예외 처리기가 413 응답을 만듦
+                    raise _too_large()
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+# 기존 평면 디렉터리 파일 이전 (python -m uploads migrate)
+# 디렉터리 -> URL 접두어
+UPLOAD_DIRS = {
+    "public/image/posts": "/public/image/posts",
+    "public/image/profile": "/public/image/profile",
+}
+LEGACY_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+def _hash_file(path: str):
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        kind = detect_image_type(source.read(SNIFF_SIZE))
+        source.seek(0)
+        for chunk in iter(lambda: source.read(UPLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return kind, digest.hexdigest()
+
+def _copy_into(source: str, target: str):
+    # 이전이 끝날 때까지 기존 URL도 유효하도록 이동 대신 복사, 이미 있으면(중복) 건너뜀
+    if os.path.exists(target):
+        return
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix=".upload-", suffix=".tmp")
+    os.close(fd)
+    try:
+        shutil.copyfile(source, temp_path)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, target)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+def migrate_directory(directory: str, url_prefix: str, db, dry_run: bool = False) -> dict:
+    from sqlalchemy import update
+    from models import Post, User
+    from thumbnails import variant_path
+    from config import THUMBNAIL_WIDTHS
+
+    result = {"migrated": 0, "deduplicated": 0, "skipped": 0}
+    if not os.path.isdir(directory):
+        return result
+
+    planned = set()  # --dry-run에서도 중복 여부를 보여주기 위한 이번 실행의 대상 경로
+
+    # 해시 경로 파일은 하위 디렉터리에 있으므로 최상위 파일만 대상
+    for entry in sorted(os.scandir(directory), key=lambda e: e.name):
+        if not entry.is_file() or entry.name.startswith(".") or not entry.name.lower().endswith(LEGACY_EXTENSIONS):
+            continue
+
+        kind, digest = _hash_file(entry.path)
+        if kind is None:
+            print(f"skip {entry.path}: not a JPEG/PNG image")
+            result["skipped"] += 1
+            continue
+
+        relative_path = shard_path(digest, IMAGE_SIGNATURES[kind][1])
+        target = os.path.join(directory, relative_path)
+        old_url = f"{url_prefix}/{entry.name}"
+        new_url = f"{url_prefix}/{relative_path}"
+        duplicated = target in planned or os.path.exists(target)
+        planned.add(target)
+        print(f"{old_url} -> {new_url}{' (duplicate)' if duplicated else ''}")
+        if dry_run:
+            result["deduplicated" if duplicated else "migrated"] += 1
+            continue
+
+        old_variants = [(variant_path(entry.path, width), variant_path(target, width)) for width in THUMBNAIL_WIDTHS]
+        _copy_into(entry.path, target)
+        for old_variant, new_variant in old_variants:
+            if os.path.exists(old_variant):
+                _copy_into(old_variant, new_variant)
+
+        # updated_at도 갱신되어 상세 / 댓글 목록 ETag가 바뀜
+        db.execute(update(Post).where(Post.post_image_url == old_url).values(post_image_url=new_url))
+        db.execute(update(User).where(User.profile_image_url == old_url).values(profile_image_url=new_url))
+        db.commit()
+
+        # DB가 새 URL을 가리킨 뒤에 기존 파일 삭제
+        os.unlink(entry.path)
+        for old_variant, _ in old_variants:
+            if os.path.exists(old_variant):
+                os.unlink(old_variant)
+
+        result["deduplicated" if duplicated else "migrated"] += 1
+
+    return result
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Upload storage tools")
+    parser.add_argument("command", choices=["migrate"])
+    parser.add_argument("--dry-run", action="store_true", help="print planned moves without changing files or DB")
+    args = parser.parse_args()
+
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        for directory, url_prefix in UPLOAD_DIRS.items():
+            result = migrate_directory(directory, url_prefix, db, args.dry_run)
+            print(f"{directory}: {result}")
+    finally:
+        db.close()
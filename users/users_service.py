@@ -1,20 +1,29 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from models import User
 from fastapi import HTTPException, status, UploadFile
-from auth.auth_utils import get_password_hash
+from auth.auth_utils import get_password_hash_async
+from auth.auth_cache import invalidate_user
+from auth.auth_availability import user_filter
+from uploads import save_image
+from thumbnails import schedule_variants
+from comments.comments_service import touch_author_comments
+from posts.posts_service import delete_user_content
+from posts.posts_feed_cache import feed_cache
 import os
-import shutil
 
 UPLOAD_DIR = "public/image/profile"
 
-def get_user_by_id(user_id: int, db: Session):
-    user = db.query(User).filter(User.id == user_id).first()
+async def get_user_by_id(user_id: int, db: AsyncSession):
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="USER_NOT_FOUND")
     return user
 
-def update_user(user_id: int, update_data: dict, db: Session):
-    user = db.query(User).filter(User.id == user_id).first()
+async def update_user(user_id: int, update_data: dict, db: AsyncSession):
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="USER_NOT_FOUND")
     
@@ -22,54 +31,62 @@ def update_user(user_id: int, update_data: dict, db: Session):
         user.nickname = update_data["nickname"]
     if "profileImageUrl" in update_data:
         user.profile_image_url = update_data["profileImageUrl"]
+        # 댓글 목록에 작성자 프로필 이미지가 포함되므로 댓글 목록 ETag 갱신
+        await touch_author_comments(user_id, db)
         
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
+    invalidate_user(user.email)
+    if "nickname" in update_data:
+        # 이전 닉네임은 filter에서 지울 수 없으므로 다음 전체 재생성까지 오탐(DB 확인)으로 남음
+        user_filter.add(nickname=user.nickname)
     return user
 
-def update_user_password(user_id: int, new_password: str, db: Session):
-    user = db.query(User).filter(User.id == user_id).first()
+async def update_user_password(user_id: int, new_password: str, db: AsyncSession):
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="USER_NOT_FOUND")
     
-    user.password = get_password_hash(new_password)
-    db.commit()
-    db.refresh(user)
+    user.password = await get_password_hash_async(new_password)
+    await db.commit()
+    await db.refresh(user)
+    invalidate_user(user.email)
     return user
 
-def delete_user(user_id: int, db: Session):
-    user = db.query(User).filter(User.id == user_id).first()
+async def delete_user(user_id: int, db: AsyncSession):
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="USER_NOT_FOUND")
         
-    db.delete(user)
-    db.commit()
+    email = user.email
+    # ORM delete는 연관 컬렉션(posts/likes/views)을 lazy load 하므로 DELETE 문으로 직접 삭제
+    # users를 참조하는 행(게시글 / 댓글 / 좋아요 / 조회)을 먼저 지워야 FK 제약(MySQL InnoDB)에 걸리지 않음
+    await delete_user_content(user_id, db)
+    await db.execute(delete(User).where(User.id == user_id).execution_options(synchronize_session=False))
+    await db.commit()
+    invalidate_user(email)
+    await feed_cache.invalidate()
     return True
 
-def upload_profile_image(user_id: int, file: UploadFile, db: Session):
-    user = db.query(User).filter(User.id == user_id).first()
+async def upload_profile_image(user_id: int, file: UploadFile, db: AsyncSession):
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="USER_NOT_FOUND")
 
-    if not os.path.exists(UPLOAD_DIR):
-        os.makedirs(UPLOAD_DIR)
-    
-    filename = file.filename
-    ext = filename.split(".")[-1].lower() if "." in filename else ""
-    if ext not in ["jpg", "jpeg", "png"]:
-         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="INVALID_FILE")
-
-    saved_filename = f"{user.id}.{ext}"
-    file_path = os.path.join(UPLOAD_DIR, saved_filename)
-    
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    # 프로필을 바꾸면 URL도 바뀌므로(내용 해시 경로) 이전 이미지가 브라우저 캐시에 남아도 문제없음
+    saved_path = await save_image(file, UPLOAD_DIR)
+    schedule_variants(os.path.join(UPLOAD_DIR, saved_path))
         
-    profile_image_url = f"/public/image/profile/{saved_filename}"
+    profile_image_url = f"/public/image/profile/{saved_path}"
     
     # DB 업데이트
     user.profile_image_url = profile_image_url
-    db.commit()
-    db.refresh(user)
+    await touch_author_comments(user_id, db)
+    await db.commit()
+    await db.refresh(user)
+    invalidate_user(user.email)
         
     return profile_image_url